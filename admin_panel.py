@@ -19,13 +19,45 @@ def show_admin_panel():
     st.title("👤 Admin User Management")
     
     # Tabs for different admin functions
-    tab1, tab2, tab3 = st.tabs(["📋 All Users", "➕ Create User", "⚙️ Settings"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 All Users", "➕ Create User", "📥 Bulk Import", "⚙️ Settings"])
     
     # Tab 1: View All Users
     with tab1:
         st.header("All Registered Users")
         
-        users = auth.get_all_users()
+        # Server-side filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            role_filter = st.selectbox("Role", ["All", "Admins", "Non-admins"])
+        with col2:
+            status_filter = st.selectbox("Status", ["All", "active", "disabled"])
+        with col3:
+            email_prefix = st.text_input("Email starts with", placeholder="jane@").strip()
+        
+        # Pagination cursors (last email of each previous page), reset when the filters change
+        filters = (role_filter, status_filter, email_prefix)
+        if st.session_state.get('user_filters') != filters:
+            st.session_state.user_filters = filters
+            st.session_state.user_page_cursors = [None]
+        cursors = st.session_state.user_page_cursors
+        
+        users, next_cursor = auth.list_users(
+            start_after=cursors[-1],
+            is_admin={"All": None, "Admins": True, "Non-admins": False}[role_filter],
+            status=None if status_filter == "All" else status_filter,
+            email_prefix=email_prefix
+        )
+        
+        # Display stats
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Users", auth.count_users())
+        with col2:
+            st.metric("Admin Users", auth.count_users(is_admin=True))
+        with col3:
+            st.metric("Active Users", auth.count_users(status='active'))
+        
+        st.markdown("---")
         
         if users:
             # Convert to DataFrame
@@ -41,33 +73,33 @@ def show_admin_panel():
             column_order = ['email', 'display_name', 'is_admin', 'status', 'created_at', 'last_login']
             df = df[[col for col in column_order if col in df.columns]]
             
-            # Display stats
-            col1, col2, col3 = st.columns(3)
+            # Display users table
+            st.dataframe(df, use_container_width=True, height=400)
+            
+            # Page navigation
+            col1, col2, col3 = st.columns([1, 2, 1])
             with col1:
-                st.metric("Total Users", len(users))
+                if st.button("⬅️ Previous", use_container_width=True, disabled=len(cursors) == 1):
+                    cursors.pop()
+                    st.rerun()
             with col2:
-                admin_count = sum(1 for u in users if u.get('is_admin', False))
-                st.metric("Admin Users", admin_count)
+                st.caption(f"Page {len(cursors)} · {len(users)} users")
             with col3:
-                active_count = sum(1 for u in users if u.get('status') == 'active')
-                st.metric("Active Users", active_count)
-            
-            st.markdown("---")
-            
-            # Display users table
-            st.dataframe(df, use_container_width=True, height=400)
+                if st.button("Next ➡️", use_container_width=True, disabled=next_cursor is None):
+                    cursors.append(next_cursor)
+                    st.rerun()
             
             st.markdown("---")
             
             # User Actions
             st.subheader("🔧 User Actions")
             
-            # Select user
-            user_emails = [u['email'] for u in users]
-            selected_email = st.selectbox("Select User", user_emails)
+            # Select user (from the current page)
+            users_by_email = {u['email']: u for u in users}
+            selected_email = st.selectbox("Select User", list(users_by_email))
             
             if selected_email:
-                selected_user = next(u for u in users if u['email'] == selected_email)
+                selected_user = users_by_email[selected_email]
                 
                 col1, col2, col3 = st.columns(3)
                 
@@ -106,6 +138,10 @@ def show_admin_panel():
                                 st.session_state.confirm_delete = False
                                 st.rerun()
         
+        elif len(cursors) > 1:
+            # The last page emptied (e.g. after a deletion): step back
+            cursors.pop()
+            st.rerun()
         else:
             st.info("No users found")
     
@@ -145,8 +181,46 @@ def show_admin_panel():
                         st.info(f"**Password:** {new_password}")
                         st.warning("⚠️ Please share these credentials securely with the user")
     
-    # Tab 3: Settings
+    # Tab 3: Bulk Import
     with tab3:
+        st.header("Bulk Import Users")
+        
+        st.markdown("Upload a CSV with `email` and `password` columns, and optionally `display_name` and `is_admin` (true/false).")
+        
+        uploaded_file = st.file_uploader("Users CSV", type=["csv"])
+        
+        if uploaded_file is not None:
+            import_rows = list(auth.read_users_csv(uploaded_file))
+            st.caption(f"{len(import_rows):,} users in file")
+            
+            if import_rows and st.button("📥 Import Users", use_container_width=True, type="primary"):
+                progress = st.progress(0.0, text="Importing...")
+                report_table = st.empty()
+                
+                # Stream the per-row report as chunks complete
+                report = []
+                for entry in auth.bulk_create_users(import_rows):
+                    report.append(entry)
+                    if len(report) % 100 == 0 or len(report) == len(import_rows):
+                        progress.progress(len(report) / len(import_rows), text=f"Processed {len(report):,} of {len(import_rows):,}")
+                        report_table.dataframe(pd.DataFrame(report).sort_values('row'), use_container_width=True, hide_index=True, height=300)
+                
+                created_count = sum(1 for entry in report if entry['status'] == 'created')
+                if created_count == len(report):
+                    st.success(f"✅ Imported all {created_count:,} users")
+                else:
+                    st.warning(f"⚠️ Imported {created_count:,} of {len(report):,} users; see the report for failures")
+                
+                st.download_button(
+                    "💾 Download Report",
+                    pd.DataFrame(report).sort_values('row').to_csv(index=False),
+                    file_name=f"user_import_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
+    
+    # Tab 4: Settings
+    with tab4:
         st.header("Admin Settings")
         
         st.subheader("🔐 Security Settings")
@@ -0,0 +1,329 @@
+"""
+Alert Engine
+Declarative threshold, baseline-change and anomaly rules evaluated incrementally against the log store
+"""
+
+import operator
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from log_store import LogStore
+
+WINDOW_BUCKETS = 30  # each rule's window is kept as this many time buckets
+QUANTILE_BINS = 121  # log-spaced bins for p95/p99 aggregates, about 10% wide from 1 to 10^5
+_QUANTILE_EDGES = np.geomspace(1, 1e5, QUANTILE_BINS - 1)
+MAX_ALERT_HISTORY = 10000
+SEVERITIES = ("critical", "warning", "info")
+
+_OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le, "==": operator.eq}
+
+
+class AlertRule(NamedTuple):
+    """One alert rule; it fires for a group when the window's aggregate exceeds threshold
+
+    kind:
+      threshold - the aggregate itself is compared with threshold
+      change    - ratio of the aggregate to the preceding baseline_windows windows merged
+      anomaly   - z-score of the aggregate against each of the preceding baseline_windows windows
+    aggregate: mean, sum, count, rate (share of events matching where), p95 or p99
+    """
+    name: str
+    title: str
+    description: str
+    category: str
+    field: str
+    aggregate: str
+    threshold: float
+    kind: str = "threshold"
+    where: Optional[Tuple[str, object]] = None
+    group_by: Optional[str] = None
+    window_seconds: int = 300
+    baseline_windows: int = 6
+    min_events: int = 20
+    severity: str = "warning"
+    channels: Tuple[str, ...] = ("slack",)
+    value_format: str = "{:.2f}"
+
+
+DEFAULT_RULES = [
+    AlertRule(
+        name="hallucination_rate",
+        title="High Hallucination Rate",
+        description="Share of responses with hallucination score above 0.13 exceeded 20%",
+        category="Model Metrics",
+        field="hallucination_score",
+        aggregate="rate",
+        where=(">", 0.13),
+        threshold=0.20,
+        group_by="model",
+        severity="critical",
+        channels=("pagerduty", "slack"),
+        value_format="{:.1%}",
+    ),
+    AlertRule(
+        name="p95_latency_regression",
+        title="Increased Latency",
+        description="P95 latency more than 30% above its baseline",
+        category="AI/ML Applications",
+        field="latency_ms",
+        aggregate="p95",
+        kind="change",
+        threshold=1.3,
+        group_by="model",
+        channels=("slack",),
+        value_format="{:.0f}ms",
+    ),
+    AlertRule(
+        name="rag_stage_latency",
+        title="Slow RAG Stage",
+        description="Mean stage latency above 1500ms",
+        category="RAG Pipeline",
+        field="latency_ms",
+        aggregate="mean",
+        threshold=1500,
+        group_by="stage",
+        severity="info",
+        channels=("slack",),
+        value_format="{:.0f}ms",
+    ),
+    AlertRule(
+        name="cost_spike",
+        title="Cost Anomaly Detected",
+        description="Hourly model spend is more than 3 standard deviations above recent hours",
+        category="AI/ML Applications",
+        field="cost_usd",
+        aggregate="sum",
+        kind="anomaly",
+        threshold=3.0,
+        window_seconds=3600,
+        channels=("email",),
+        value_format="${:.2f}/hr",
+    ),
+]
+
+
+def _width(aggregate: str) -> int:
+    """Columns of a rule's per-bucket partial aggregate"""
+    return QUANTILE_BINS if aggregate in ("p95", "p99") else 2
+
+
+def _finish(aggregate: str, totals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(value, event count) per group from merged bucket partials of shape (..., width)"""
+    if aggregate in ("p95", "p99"):
+        counts = totals.sum(axis=-1)
+        cumulative = np.cumsum(totals, axis=-1)
+        rank = np.ceil(counts * (0.95 if aggregate == "p95" else 0.99))[..., None]
+        upper_edges = np.append(_QUANTILE_EDGES, np.inf)
+        bins = np.minimum((cumulative < rank).sum(axis=-1), QUANTILE_BINS - 2)
+        return upper_edges[bins], counts
+    counts, totals = totals[..., 0], totals[..., 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if aggregate in ("mean", "rate"):
+            return totals / counts, counts
+    return (counts if aggregate == "count" else totals), counts
+
+
+class _RuleWindows:
+    """Per-group ring of time-bucket partial aggregates for one rule
+
+    Partials (count and sum, or a histogram for quantiles) merge by addition, so a window
+    or baseline is a sum over its buckets and new events only touch their own bucket.
+    """
+
+    def __init__(self, rule: AlertRule):
+        self.rule = rule
+        self.bucket_ms = max(1, rule.window_seconds * 1000 // WINDOW_BUCKETS)
+        self.n_buckets = WINDOW_BUCKETS * (rule.baseline_windows + 1) + 1
+        self.width = _width(rule.aggregate)
+        self.groups: Dict[str, int] = {}
+        self.buckets = np.full(self.n_buckets, -1, dtype=np.int64)
+        self.partials = np.zeros((0, self.n_buckets, self.width))
+
+    def _group_codes(self, events) -> np.ndarray:
+        if self.rule.group_by is None:
+            names, codes = ["all"], np.zeros(len(events), dtype=np.int64)
+        else:
+            column = events[self.rule.group_by].cat.remove_unused_categories()
+            names, codes = list(column.cat.categories), column.cat.codes.to_numpy().astype(np.int64)
+        for name in names:
+            if name not in self.groups:
+                self.groups[name] = len(self.groups)
+        if len(self.groups) > len(self.partials):
+            grown = np.zeros((len(self.groups), self.n_buckets, self.width))
+            grown[:len(self.partials)] = self.partials
+            self.partials = grown
+        return np.array([self.groups[name] for name in names], dtype=np.int64)[codes]
+
+    def add(self, events):
+        """Fold new events (timestamp, group and value columns) into their buckets"""
+        rule = self.rule
+        values = events[rule.field]
+        if rule.where is not None:
+            op, operand = rule.where
+            values = _OPERATORS[op](values, operand).to_numpy(dtype=np.float64)
+        else:
+            values = values.to_numpy(dtype=np.float64)
+        groups = self._group_codes(events)
+        buckets = events["timestamp"].to_numpy().astype('datetime64[ms]').astype(np.int64) // self.bucket_ms
+
+        # Recycle ring slots that now hold an older bucket; drop events older than their slot
+        newest = buckets.max()
+        fresh = np.unique(buckets[buckets > newest - self.n_buckets])
+        slots = fresh % self.n_buckets
+        recycled = slots[self.buckets[slots] < fresh]
+        self.partials[:, recycled] = 0
+        self.buckets[slots] = np.maximum(self.buckets[slots], fresh)
+        keep = self.buckets[buckets % self.n_buckets] == buckets
+        groups, buckets, values = groups[keep], buckets[keep], values[keep]
+
+        cells = groups * self.n_buckets + buckets % self.n_buckets
+        size = self.partials.shape[0] * self.n_buckets
+        if self.width == QUANTILE_BINS:
+            bins = np.searchsorted(_QUANTILE_EDGES, values)
+            flat = np.bincount(cells * self.width + bins, minlength=size * self.width)
+            self.partials += flat.reshape(self.partials.shape)
+        else:
+            self.partials[..., 0] += np.bincount(cells, minlength=size).reshape(-1, self.n_buckets)
+            self.partials[..., 1] += np.bincount(cells, weights=values, minlength=size).reshape(-1, self.n_buckets)
+
+    def window(self, end_bucket: int, windows_back: int = 0) -> np.ndarray:
+        """Merged partials per group for the window ending windows_back windows before end_bucket"""
+        last = end_bucket - windows_back * WINDOW_BUCKETS
+        live = (self.buckets > last - WINDOW_BUCKETS) & (self.buckets <= last)
+        return self.partials[:, live].sum(axis=1)
+
+    def evaluate(self, now_ms: int) -> Dict[str, Tuple[bool, float, Optional[float]]]:
+        """Per group: (firing, current value, baseline value or None)"""
+        rule = self.rule
+        if not self.groups:
+            return {}
+        end = now_ms // self.bucket_ms
+        value, count = _finish(rule.aggregate, self.window(end))
+        enough = count >= rule.min_events
+        baseline = np.full(len(value), np.nan)
+        if rule.kind == "threshold":
+            firing = enough & (value > rule.threshold)
+        elif rule.kind == "change":
+            merged = sum(self.window(end, back) for back in range(1, rule.baseline_windows + 1))
+            baseline, baseline_count = _finish(rule.aggregate, merged)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                firing = enough & (baseline_count >= rule.min_events) & (value / baseline > rule.threshold)
+        else:
+            past = [_finish(rule.aggregate, self.window(end, back)) for back in range(1, rule.baseline_windows + 1)]
+            history = np.stack([values for values, _ in past], axis=1)
+            counted = np.stack([counts for _, counts in past], axis=1) >= rule.min_events
+            windows = counted.sum(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                baseline = np.where(counted, history, 0).sum(axis=1) / windows
+                spread = np.sqrt(np.where(counted, (history - baseline[:, None]) ** 2, 0).sum(axis=1) / windows)
+                firing = enough & (windows >= 3) & ((value - baseline) / np.maximum(spread, 1e-9) > rule.threshold)
+        names = list(self.groups)
+        return {
+            names[i]: (bool(firing[i]), float(value[i]), None if np.isnan(baseline[i]) else float(baseline[i]))
+            for i in range(len(names))
+        }
+
+
+class AlertEngine:
+    """Evaluates a rule set against events appended to a LogStore since the previous tick
+
+    An alert is identified by (rule, group): it opens when the rule starts firing for the
+    group, stays a single alert while it keeps firing (later evaluations only refresh it),
+    and resolves when the condition clears. Resolved alerts give the mean time to resolve.
+    """
+
+    def __init__(self, rules: Optional[List[AlertRule]] = None):
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.windows = {rule.name: _RuleWindows(rule) for rule in self.rules}
+        self.last_seq = -1
+        self.evaluations = 0
+        self.open: Dict[Tuple[str, str], Dict] = {}
+        self.history: deque = deque(maxlen=MAX_ALERT_HISTORY)
+
+    def _ingest(self, store: LogStore):
+        by_category: Dict[str, List[AlertRule]] = {}
+        for rule in self.rules:
+            by_category.setdefault(rule.category, []).append(rule)
+        # One upper bound for every category, so events appended meanwhile are read next time
+        upto = store.total_appended - 1
+        batches = []
+        for category, rules in by_category.items():
+            columns = {"timestamp"} | {r.field for r in rules} | {r.group_by for r in rules if r.group_by}
+            batches.append((rules, store.frame(category, columns=columns, since=self.last_seq, until=upto)))
+        # Windows are only fed once every category was read, so a failed read leaves none half-fed
+        for rules, events in batches:
+            if len(events):
+                for rule in rules:
+                    self.windows[rule.name].add(events)
+        self.last_seq = upto
+
+    def tick(self, store: LogStore, now: Optional[datetime] = None) -> List[Tuple[str, Dict]]:
+        """Fold in new events, evaluate every rule and return the ("fired" | "resolved", alert) transitions"""
+        now = now or datetime.now()
+        now_ms = int(np.datetime64(now, 'ms').astype(np.int64))
+        self._ingest(store)
+        self.evaluations += 1
+        transitions = []
+        for rule in self.rules:
+            for group, (firing, value, baseline) in self.windows[rule.name].evaluate(now_ms).items():
+                key = (rule.name, group)
+                alert = self.open.get(key)
+                if firing and alert is None:
+                    alert = self.open[key] = {
+                        "rule": rule.name,
+                        "group": group,
+                        "severity": rule.severity,
+                        "title": rule.title if rule.group_by is None else f"{rule.title} - {group}",
+                        "description": rule.description,
+                        "channels": rule.channels,
+                        "fired_at": now,
+                        "resolved_at": None,
+                    }
+                    transitions.append(("fired", alert))
+                if alert is None:
+                    continue
+                if firing:
+                    alert["value"] = rule.value_format.format(value)
+                    alert["baseline"] = None if baseline is None else rule.value_format.format(baseline)
+                    alert["last_seen"] = now
+                else:
+                    alert["resolved_at"] = now
+                    self.history.append(self.open.pop(key))
+                    transitions.append(("resolved", alert))
+        return transitions
+
+    def active(self) -> List[Dict]:
+        """Open alerts, most severe first and newest first within a severity"""
+        alerts = sorted(self.open.values(), key=lambda alert: alert["fired_at"], reverse=True)
+        return sorted(alerts, key=lambda alert: SEVERITIES.index(alert["severity"]))
+
+    def grouped(self) -> Dict[str, List[Dict]]:
+        """Open alerts grouped by rule, in active() order"""
+        groups: Dict[str, List[Dict]] = {}
+        for alert in self.active():
+            groups.setdefault(alert["rule"], []).append(alert)
+        return groups
+
+    def fired_counts(self, now: Optional[datetime] = None) -> Dict[str, Tuple[int, int]]:
+        """Alerts fired in the last 24 hours and 7 days, per severity"""
+        now = now or datetime.now()
+        counts = {severity: [0, 0] for severity in SEVERITIES}
+        for alert in list(self.history) + list(self.open.values()):
+            age = (now - alert["fired_at"]).total_seconds()
+            if age <= 7 * 86400:
+                counts[alert["severity"]][1] += 1
+                if age <= 86400:
+                    counts[alert["severity"]][0] += 1
+        return {severity: (day, week) for severity, (day, week) in counts.items()}
+
+    def mttr(self, since: Optional[datetime] = None) -> Optional[float]:
+        """Mean seconds from firing to resolution over resolved alerts (optionally resolved after since)"""
+        durations = [
+            (alert["resolved_at"] - alert["fired_at"]).total_seconds()
+            for alert in self.history
+            if since is None or alert["resolved_at"] >= since
+        ]
+        return sum(durations) / len(durations) if durations else None
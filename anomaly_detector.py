@@ -0,0 +1,151 @@
+"""
+Latency Anomaly Detector
+Online per-model and per-stage detector over the log store's latency_ms stream
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from log_store import LogStore
+
+# latency_ms streams scored by the detector: source category -> field that keys a series
+ANOMALY_SOURCES = {
+    "AI/ML Applications": "model",
+    "RAG Pipeline": "stage",
+}
+
+DEFAULT_ALPHA = 0.01  # EWMA weight of the newest event (~100-event memory)
+DEFAULT_THRESHOLD = 4.0  # flag events this many standard deviations above the running mean
+MAX_RECENT_ANOMALIES = 5000
+MIN_STD_MS = 1.0
+
+_ANOMALY_COLUMNS = ["_seq", "timestamp", "source_category", "field", "key", "latency_ms", "expected_ms", "zscore"]
+
+
+def _ewm(initial: float, values: np.ndarray, alpha: float) -> np.ndarray:
+    """s[0] = initial, s[t] = (1 - alpha) * s[t-1] + alpha * values[t-1], computed in compiled code"""
+    series = pd.Series(np.concatenate([[initial], values]))
+    return series.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+class LatencyAnomalyDetector:
+    """Exponentially weighted mean/variance per (category, key) series, scored one batch at a time
+
+    State per series is three numbers (events seen, mean, variance), so memory is bounded by the
+    number of models and stages and each event costs O(1). The first 1/alpha events of a series
+    use plain running moments as a warm-up and are never flagged. An event is anomalous when it
+    lies more than threshold standard deviations above the mean of the events before it; values
+    feeding the running moments are clipped at that bound as of the start of the batch, so a
+    spike does not inflate the variance and hide the next one.
+    """
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA, threshold: float = DEFAULT_THRESHOLD,
+                 max_recent: int = MAX_RECENT_ANOMALIES):
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = int(np.ceil(1 / alpha))
+        self.max_recent = max_recent
+        self.last_seq = -1
+        self.scored = 0
+        # (category, key) -> (events seen, mean, variance)
+        self.state: Dict[Tuple[str, str], Tuple[int, float, float]] = {}
+        self.counts: Dict[Tuple[str, str], int] = {}
+        self._recent = pd.DataFrame(columns=_ANOMALY_COLUMNS)
+
+    def score(self, series: Tuple[str, str], latency: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advance one series over a batch of latencies in arrival order
+
+        Returns (anomalous, expected, zscore) per event, each relative to the state before the event.
+        """
+        x = np.asarray(latency, dtype=np.float64)
+        n = len(x)
+        seen, mean, var = self.state.get(series, (0, 0.0, 0.0))
+        means = np.empty(n + 1)
+        variances = np.empty(n + 1)
+        means[0], variances[0] = mean, var
+
+        # Warm-up: exact running moments, continuing from any earlier partial warm-up
+        k = min(max(self.warmup - seen, 0), n)
+        if k:
+            counts = seen + np.arange(1, k + 1)
+            sums = seen * mean + np.cumsum(x[:k])
+            squares = seen * (var + mean * mean) + np.cumsum(x[:k] * x[:k])
+            means[1:k + 1] = sums / counts
+            variances[1:k + 1] = np.maximum(squares / counts - means[1:k + 1] ** 2, 0.0)
+
+        # Steady state: m[t] = m[t-1] + a*d, v[t] = (1-a)*(v[t-1] + a*d^2) with d = x[t] - m[t-1]
+        if k < n:
+            a = self.alpha
+            m0, v0 = means[k], variances[k]
+            bound = m0 + self.threshold * max(np.sqrt(v0), MIN_STD_MS)
+            clipped = np.minimum(x[k:], bound)
+            means[k:] = _ewm(m0, clipped, a)
+            deltas = clipped - means[k:-1]
+            variances[k:] = _ewm(v0, (1 - a) * deltas * deltas, a)
+
+        expected = means[:-1]
+        std = np.maximum(np.sqrt(variances[:-1]), MIN_STD_MS)
+        zscore = (x - expected) / std
+        anomalous = (zscore > self.threshold) & (seen + np.arange(n) >= self.warmup)
+        self.state[series] = (seen + n, float(means[-1]), float(variances[-1]))
+        return anomalous, expected, zscore
+
+    def observe(self, store: LogStore) -> int:
+        """Score every latency event appended to the store since the last call; returns the anomalies found"""
+        found = []
+        upto = store.total_appended - 1
+        # Read every category before scoring any, so a failed read leaves no category half-observed
+        batches = [(category, field, store.frame(category, columns=["timestamp", field, "latency_ms"],
+                                                 since=self.last_seq, until=upto))
+                   for category, field in ANOMALY_SOURCES.items()]
+        for category, field, events in batches:
+            if events.empty:
+                continue
+            self.scored += len(events)
+            keys = events[field].cat.remove_unused_categories()
+            codes = keys.cat.codes.to_numpy()
+            latency = events["latency_ms"].to_numpy()
+            for code, key in enumerate(keys.cat.categories):
+                rows = np.flatnonzero(codes == code)
+                anomalous, expected, zscore = self.score((category, key), latency[rows])
+                if not anomalous.any():
+                    continue
+                self.counts[(category, key)] = self.counts.get((category, key), 0) + int(anomalous.sum())
+                hits = rows[anomalous]
+                found.append(pd.DataFrame({
+                    "_seq": events["_seq"].to_numpy()[hits],
+                    "timestamp": events["timestamp"].to_numpy()[hits],
+                    "source_category": category,
+                    "field": field,
+                    "key": key,
+                    "latency_ms": latency[hits],
+                    "expected_ms": expected[anomalous],
+                    "zscore": zscore[anomalous],
+                }))
+        self.last_seq = upto
+        if not found:
+            return 0
+        new = pd.concat(found, ignore_index=True)
+        frames = [self._recent, new] if len(self._recent) else [new]
+        self._recent = pd.concat(frames, ignore_index=True).sort_values("_seq").tail(self.max_recent)
+        return len(new)
+
+    def anomalies(self, category: Optional[str] = None, key: Optional[str] = None,
+                  since_seq: int = -1) -> pd.DataFrame:
+        """Recently flagged events (newest max_recent kept), optionally for one series, oldest first"""
+        recent = self._recent
+        mask = recent["_seq"] > since_seq
+        if category is not None:
+            mask &= recent["source_category"] == category
+        if key is not None:
+            mask &= recent["key"] == key
+        return recent[mask].reset_index(drop=True)
+
+    def series(self) -> List[Tuple[str, str]]:
+        """Every (category, key) series scored so far"""
+        return sorted(self.state)
+
+    def total_anomalies(self) -> int:
+        return sum(self.counts.values())
@@ -4,17 +4,45 @@ Handles user authentication, registration, and admin management
 """
 
 import streamlit as st
-import firebase_admin
-from firebase_admin import credentials, auth, firestore
+import atexit
+import csv
+import hashlib
+import importlib
+import io
 import json
 import os
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, Iterator, List, Tuple
+
+class _LazyModule:
+    """Module stand-in that imports the real module on first attribute access"""
+    
+    def __init__(self, name: str):
+        self._name = name
+    
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+# Firebase SDK modules (imported on first use, keeping them off the login page's cold start)
+firebase_admin = _LazyModule('firebase_admin')
+credentials = _LazyModule('firebase_admin.credentials')
+auth = _LazyModule('firebase_admin.auth')
+firestore = _LazyModule('firebase_admin.firestore')
+
+_init_lock = threading.Lock()
 
 # Initialize Firebase Admin SDK
 def init_firebase():
-    """Initialize Firebase Admin SDK"""
-    if not firebase_admin._apps:
+    """Initialize Firebase Admin SDK (once per process)"""
+    if firebase_admin._apps:
+        return
+    with _init_lock:
+        if firebase_admin._apps:
+            return
         try:
             # Try to load from Streamlit secrets (production)
             if "firebase" in st.secrets:
@@ -36,6 +64,100 @@ def get_firestore_client():
     init_firebase()
     return firestore.client()
 
+# Profile Cache & Login Tracking (process-wide, shared by all sessions)
+PROFILE_CACHE_TTL = 300  # seconds a cached Firestore profile is trusted
+LAST_LOGIN_FLUSH_INTERVAL = 60  # seconds between last_login batch writes
+LAST_LOGIN_MAX_ATTEMPTS = 5  # flushes an update is tried in before it is dropped
+FIRESTORE_BATCH_SIZE = 500  # Firestore's limit on writes per batch
+USER_LIST_CACHE_TTL = 30  # seconds a cached user listing page or count is trusted
+USER_PAGE_SIZE = 50
+
+_cache_lock = threading.Lock()
+_profile_cache: Dict[str, Tuple[float, Optional[Dict]]] = {}
+_listing_cache: Dict[Tuple, Tuple[float, object]] = {}
+_email_uids: Dict[str, str] = {}
+_pending_logins: Dict[str, datetime] = {}
+_login_attempts: Dict[str, int] = {}  # failed flushes per queued uid
+_last_login_flush = time.monotonic()
+
+def get_user_profile(uid: str) -> Optional[Dict]:
+    """Get a user's Firestore profile, served from a TTL cache keyed by uid"""
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _profile_cache.get(uid)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    user_doc = get_firestore_client().collection('users').document(uid).get()
+    profile = user_doc.to_dict() if user_doc.exists else None
+    with _cache_lock:
+        _profile_cache[uid] = (now + PROFILE_CACHE_TTL, profile)
+    return profile
+
+def invalidate_user_cache(uid: Optional[str] = None, deleted: bool = False):
+    """Drop cached listings and one user's profile (or all profiles); deleted users leave the login queue and email index"""
+    with _cache_lock:
+        _listing_cache.clear()
+        if uid is None:
+            _profile_cache.clear()
+        else:
+            _profile_cache.pop(uid, None)
+            if deleted:
+                _pending_logins.pop(uid, None)
+                _login_attempts.pop(uid, None)
+                for email in [e for e, u in _email_uids.items() if u == uid]:
+                    del _email_uids[email]
+
+def record_login(uid: str):
+    """Queue a last_login update; writes are coalesced and flushed in batches"""
+    with _cache_lock:
+        _pending_logins[uid] = datetime.now()
+        due = (len(_pending_logins) >= FIRESTORE_BATCH_SIZE or
+               time.monotonic() - _last_login_flush >= LAST_LOGIN_FLUSH_INTERVAL)
+    if due:
+        flush_last_logins()
+
+def flush_last_logins():
+    """Write all queued last_login timestamps to Firestore in batched commits; failed batches are requeued"""
+    global _last_login_flush
+    with _cache_lock:
+        pending = list(_pending_logins.items())
+        _pending_logins.clear()
+        _last_login_flush = time.monotonic()
+    if not pending:
+        return
+    
+    committed = 0
+    try:
+        db = get_firestore_client()
+        for start in range(0, len(pending), FIRESTORE_BATCH_SIZE):
+            batch = db.batch()
+            for uid, login_time in pending[start:start + FIRESTORE_BATCH_SIZE]:
+                batch.update(db.collection('users').document(uid), {'last_login': login_time})
+            batch.commit()
+            committed = start + FIRESTORE_BATCH_SIZE
+    except Exception as e:
+        failed = pending[committed:]
+        retried = []
+        with _cache_lock:
+            for uid, login_time in failed:
+                attempts = _login_attempts.get(uid, 0) + 1
+                if attempts >= LAST_LOGIN_MAX_ATTEMPTS:
+                    _login_attempts.pop(uid, None)
+                    continue
+                retried.append(uid)
+                _login_attempts[uid] = attempts
+                # A login queued meanwhile is newer and wins
+                if uid not in _pending_logins or _pending_logins[uid] < login_time:
+                    _pending_logins[uid] = login_time
+        print(f"❌ last_login flush failed, {len(retried)} of {len(failed)} updates requeued: {str(e)}")
+        pending = pending[:committed]
+    with _cache_lock:
+        for uid, _ in pending:
+            _login_attempts.pop(uid, None)
+
+atexit.register(flush_last_logins)
+
 # User Authentication Functions
 def create_user(email: str, password: str, display_name: str = None, is_admin: bool = False) -> Optional[Dict]:
     """Create a new user in Firebase Authentication"""
@@ -64,6 +186,7 @@ def create_user(email: str, password: str, display_name: str = None, is_admin: b
             'last_login': None,
             'status': 'active'
         })
+        invalidate_user_cache(user.uid)
         
         return {
             'uid': user.uid,
@@ -84,24 +207,17 @@ def verify_user(email: str, password: str) -> Optional[Dict]:
     try:
         init_firebase()
         
-        # Get user by email
+        # Get user by email (the record carries the custom claims)
         user = auth.get_user_by_email(email)
         
-        # Get user profile from Firestore
-        db = get_firestore_client()
-        user_doc = db.collection('users').document(user.uid).get()
+        # Get user profile from Firestore (cached)
+        user_data = get_user_profile(user.uid)
         
-        if user_doc.exists:
-            user_data = user_doc.to_dict()
-            
-            # Update last login
-            db.collection('users').document(user.uid).update({
-                'last_login': datetime.now()
-            })
+        if user_data is not None:
+            # Update last login (coalesced into batched writes)
+            record_login(user.uid)
             
-            # Get custom claims
-            user_record = auth.get_user(user.uid)
-            custom_claims = user_record.custom_claims or {}
+            custom_claims = user.custom_claims or {}
             
             return {
                 'uid': user.uid,
@@ -119,26 +235,98 @@ def verify_user(email: str, password: str) -> Optional[Dict]:
         st.error(f"❌ Verification failed: {str(e)}")
         return None
 
-def get_all_users() -> List[Dict]:
-    """Get all users from Firebase (Admin only)"""
-    try:
-        init_firebase()
-        db = get_firestore_client()
-        
+def _users_query(is_admin: Optional[bool] = None, status: Optional[str] = None, email_prefix: str = ''):
+    """Firestore query over the users collection with server-side filters, ordered by email"""
+    query = get_firestore_client().collection('users')
+    if is_admin is not None:
+        query = query.where(filter=firestore.FieldFilter('is_admin', '==', is_admin))
+    if status:
+        query = query.where(filter=firestore.FieldFilter('status', '==', status))
+    if email_prefix:
+        query = query.where(filter=firestore.FieldFilter('email', '>=', email_prefix))
+        query = query.where(filter=firestore.FieldFilter('email', '<', email_prefix + '\uf8ff'))
+    return query.order_by('email')
+
+def _cached(key: Tuple, load):
+    """Serve a user listing result from the short-lived cache, loading it on a miss"""
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _listing_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    result = load()
+    with _cache_lock:
+        _listing_cache[key] = (now + USER_LIST_CACHE_TTL, result)
+    return result
+
+def list_users(page_size: int = USER_PAGE_SIZE, start_after: Optional[str] = None,
+               is_admin: Optional[bool] = None, status: Optional[str] = None,
+               email_prefix: str = '') -> Tuple[List[Dict], Optional[str]]:
+    """Get one page of users ordered by email, and the cursor (last email) for the next page"""
+    def load():
+        query = _users_query(is_admin, status, email_prefix)
+        if start_after:
+            query = query.start_after({'email': start_after})
         users = []
-        users_ref = db.collection('users')
-        docs = users_ref.stream()
-        
-        for doc in docs:
+        for doc in query.limit(page_size).stream():
             user_data = doc.to_dict()
             user_data['uid'] = doc.id
             users.append(user_data)
-        
-        return users
+        with _cache_lock:
+            _email_uids.update((u['email'], u['uid']) for u in users if u.get('email'))
+        cursor = users[-1]['email'] if len(users) == page_size else None
+        return users, cursor
+    
+    try:
+        init_firebase()
+        flush_last_logins()
+        return _cached(('page', page_size, start_after, is_admin, status, email_prefix), load)
     
     except Exception as e:
         st.error(f"❌ Failed to get users: {str(e)}")
-        return []
+        return [], None
+
+def count_users(is_admin: Optional[bool] = None, status: Optional[str] = None) -> int:
+    """Count users matching the filters with a server-side aggregation"""
+    def load():
+        return int(_users_query(is_admin, status).count().get()[0][0].value)
+    
+    try:
+        init_firebase()
+        return _cached(('count', is_admin, status), load)
+    
+    except Exception as e:
+        st.error(f"❌ Failed to count users: {str(e)}")
+        return 0
+
+def lookup_uid(email: str) -> Optional[str]:
+    """Get a user's uid by email from the email index, querying Firestore on a miss"""
+    with _cache_lock:
+        uid = _email_uids.get(email)
+    if uid:
+        return uid
+    
+    try:
+        init_firebase()
+        query = get_firestore_client().collection('users').where(filter=firestore.FieldFilter('email', '==', email))
+        docs = list(query.limit(1).stream())
+        if not docs:
+            return None
+        with _cache_lock:
+            _email_uids[email] = docs[0].id
+        return docs[0].id
+    
+    except Exception as e:
+        st.error(f"❌ User lookup failed: {str(e)}")
+        return None
+
+def get_all_users() -> List[Dict]:
+    """Get all users from Firebase (Admin only), page by page"""
+    users, cursor = list_users()
+    while cursor:
+        page, cursor = list_users(start_after=cursor)
+        users.extend(page)
+    return users
 
 def delete_user(uid: str) -> bool:
     """Delete user from Firebase Authentication and Firestore"""
@@ -148,6 +336,7 @@ def delete_user(uid: str) -> bool:
         
         db = get_firestore_client()
         db.collection('users').document(uid).delete()
+        invalidate_user_cache(uid, deleted=True)
         
         return True
     
@@ -166,6 +355,7 @@ def make_admin(uid: str) -> bool:
             'is_admin': True,
             'admin_since': datetime.now()
         })
+        invalidate_user_cache(uid)
         
         return True
     
@@ -183,6 +373,7 @@ def revoke_admin(uid: str) -> bool:
         db.collection('users').document(uid).update({
             'is_admin': False
         })
+        invalidate_user_cache(uid)
         
         return True
     
@@ -201,6 +392,149 @@ def send_password_reset_email(email: str) -> bool:
         st.error(f"❌ Password reset failed: {str(e)}")
         return False
 
+# Bulk Provisioning
+IMPORT_CHUNK_SIZE = 1000  # Firebase Auth's limit on users per import_users call
+PROVISIONING_WORKERS = 4  # chunks imported concurrently
+LOOKUP_BATCH_SIZE = 100  # Firebase Auth's limit on identifiers per get_users call
+PBKDF2_ROUNDS = 10000
+
+def read_users_csv(file) -> Iterator[Dict]:
+    """Parse a users CSV (email, password, optional display_name and is_admin columns)"""
+    text = io.TextIOWrapper(file, encoding='utf-8-sig') if not isinstance(file, io.TextIOBase) else file
+    for row in csv.DictReader(text):
+        row = {(key or '').strip().lower(): (value or '').strip() for key, value in row.items()}
+        yield {
+            'email': row.get('email', ''),
+            'password': row.get('password', ''),
+            'display_name': row.get('display_name', ''),
+            'is_admin': row.get('is_admin', '').lower() in ('true', 'yes', 'y', '1')
+        }
+
+def _existing_accounts(users: List[Dict]) -> Tuple[set, set]:
+    """Emails (lowercased) and uids among the given users that already have an Auth account"""
+    identifiers = []
+    for user in users:
+        identifiers += [auth.EmailIdentifier(user['email']), auth.UidIdentifier(user['uid'])]
+    emails, uids = set(), set()
+    for start in range(0, len(identifiers), LOOKUP_BATCH_SIZE):
+        for record in auth.get_users(identifiers[start:start + LOOKUP_BATCH_SIZE]).users:
+            if record.email:
+                emails.add(record.email.lower())
+            uids.add(record.uid)
+    return emails, uids
+
+def _provision_chunk(chunk: List[Tuple[int, Dict]]) -> List[Dict]:
+    """Import one chunk of validated users into Auth and write their profiles; one report entry per row"""
+    # import_users skips uniqueness checks, so rows matching an existing account are rejected up front
+    try:
+        emails, uids = _existing_accounts([user for _, user in chunk])
+        failed = {}
+        for i, (_, user) in enumerate(chunk):
+            if user['email'].lower() in emails:
+                failed[i] = "Email already registered"
+            elif user['uid'] in uids:
+                failed[i] = "User ID already exists"
+    except Exception as e:
+        failed = {i: f"Could not check for existing accounts: {str(e)}" for i in range(len(chunk))}
+    pending = [i for i in range(len(chunk)) if i not in failed]
+    
+    records = []
+    for _, user in (chunk[i] for i in pending):
+        salt = os.urandom(16)
+        records.append(auth.ImportUserRecord(
+            uid=user['uid'],
+            email=user['email'],
+            display_name=user['display_name'],
+            password_hash=hashlib.pbkdf2_hmac('sha256', user['password'].encode(), salt, PBKDF2_ROUNDS),
+            password_salt=salt,
+            custom_claims={'admin': True} if user['is_admin'] else None
+        ))
+    
+    try:
+        if records:
+            result = auth.import_users(records, hash_alg=auth.UserImportHash.pbkdf2_sha256(rounds=PBKDF2_ROUNDS))
+            failed.update((pending[error.index], error.reason) for error in result.errors)
+    except Exception as e:
+        failed.update((i, str(e)) for i in pending)
+    
+    # Profiles for the imported users, in batched Firestore writes
+    imported = [user for i, (_, user) in enumerate(chunk) if i not in failed]
+    try:
+        db = get_firestore_client()
+        for start in range(0, len(imported), FIRESTORE_BATCH_SIZE):
+            batch = db.batch()
+            for user in imported[start:start + FIRESTORE_BATCH_SIZE]:
+                batch.set(db.collection('users').document(user['uid']), {
+                    'email': user['email'],
+                    'display_name': user['display_name'],
+                    'is_admin': user['is_admin'],
+                    'created_at': datetime.now(),
+                    'last_login': None,
+                    'status': 'active'
+                })
+            batch.commit()
+    except Exception as e:
+        failed.update((i, f"Account created but profile write failed: {str(e)}")
+                      for i, (_, user) in enumerate(chunk) if i not in failed)
+    
+    return [{
+        'row': row,
+        'email': user['email'],
+        'status': 'failed' if i in failed else 'created',
+        'error': failed.get(i, '')
+    } for i, (row, user) in enumerate(chunk)]
+
+def _validate_import_row(user: Dict, seen: set) -> Tuple[Optional[Dict], str]:
+    """Normalize one import row, or explain why it is rejected"""
+    email = (user.get('email') or '').strip()
+    password = user.get('password') or ''
+    if not email or '@' not in email:
+        return None, "Invalid email address"
+    if len(password) < 6:
+        return None, "Password must be at least 6 characters"
+    if email.lower() in seen:
+        return None, "Duplicate email in import"
+    seen.add(email.lower())
+    return {
+        'uid': uuid.uuid4().hex[:28],
+        'email': email,
+        'password': password,
+        'display_name': user.get('display_name') or email.split('@')[0],
+        'is_admin': bool(user.get('is_admin'))
+    }, ''
+
+def bulk_create_users(users: Iterable[Dict]) -> Iterator[Dict]:
+    """Provision many users in chunked Auth imports, yielding a report entry per row as chunks finish"""
+    init_firebase()
+    seen = set()
+    
+    with ThreadPoolExecutor(max_workers=PROVISIONING_WORKERS) as pool:
+        in_flight = set()
+        chunk: List[Tuple[int, Dict]] = []
+        for row, user in enumerate(users, start=1):
+            record, error = _validate_import_row(user, seen)
+            if error:
+                yield {'row': row, 'email': user.get('email', ''), 'status': 'failed', 'error': error}
+                continue
+            
+            chunk.append((row, record))
+            if len(chunk) == IMPORT_CHUNK_SIZE:
+                in_flight.add(pool.submit(_provision_chunk, chunk))
+                chunk = []
+            
+            # Bound the chunks in flight so large imports aren't all queued up front
+            while len(in_flight) >= PROVISIONING_WORKERS:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        
+        if chunk:
+            in_flight.add(pool.submit(_provision_chunk, chunk))
+        for future in in_flight:
+            yield from future.result()
+    
+    invalidate_user_cache()
+
 # Session Management
 def init_session_state():
     """Initialize session state variables for authentication"""
@@ -259,3 +593,18 @@ def initialize_admin():
     
     except Exception as e:
         print(f"❌ Admin initialization failed: {str(e)}")
+
+def _bootstrap():
+    """Initialize Firebase and the default admin user"""
+    try:
+        init_firebase()
+        initialize_admin()
+    except Exception as e:
+        print(f"❌ Firebase bootstrap failed: {str(e)}")
+
+@st.cache_resource(show_spinner=False)
+def start_bootstrap() -> threading.Thread:
+    """Run the Firebase/admin bootstrap once per server process, off the script thread"""
+    thread = threading.Thread(target=_bootstrap, name="firebase-bootstrap", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,215 @@
+"""
+Chart Data Provider
+Synthetic dashboard series computed once per time bucket and memoized across reruns and sessions.
+Each point is derived from a hash of (series, absolute time tick), so values are stable between
+interactions and a window slides forward without rewriting its past.
+"""
+
+import time
+import zlib
+from datetime import datetime
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Tick sizes (seconds)
+SECOND = 1
+HOUR = 3600
+DAY = 86400
+LIVE_REFRESH_SECONDS = 5  # live series advance in steps of the Real-time page's refresh
+
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _uniform(series: str, ticks: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Deterministic pseudo-random values in [low, high), one per absolute time tick (splitmix64)"""
+    with np.errstate(over='ignore'):
+        x = ticks.astype(np.uint64) * _GOLDEN + np.uint64(zlib.crc32(series.encode()))
+        x ^= x >> np.uint64(30)
+        x *= _MIX_1
+        x ^= x >> np.uint64(27)
+        x *= _MIX_2
+        x ^= x >> np.uint64(31)
+    return low + (x >> np.uint64(11)) / float(1 << 53) * (high - low)
+
+
+def _integers(series: str, ticks: np.ndarray, low: int, high: int) -> np.ndarray:
+    """Deterministic pseudo-random integers in [low, high], one per tick"""
+    return np.floor(_uniform(series, ticks, low, high + 1)).astype(np.int64)
+
+
+def _current_tick(period: int) -> int:
+    return int(time.time() // period)
+
+
+def _window(end_tick: int, count: int) -> np.ndarray:
+    return np.arange(end_tick - count + 1, end_tick + 1)
+
+
+def _timestamps(ticks: np.ndarray, period: int) -> pd.DatetimeIndex:
+    """Local wall-clock start of each tick"""
+    return pd.DatetimeIndex([datetime.fromtimestamp(int(t) * period) for t in ticks])
+
+
+def _live_tick() -> int:
+    """Current second, rounded down to the live refresh step"""
+    now = _current_tick(SECOND)
+    return now - now % LIVE_REFRESH_SECONDS
+
+
+# Hourly and daily series
+@st.cache_data(max_entries=2, show_spinner=False)
+def _ingestion_volume(end_hour: int) -> pd.DataFrame:
+    ticks = _window(end_hour, 24)
+    return pd.DataFrame({
+        'time': _timestamps(ticks, HOUR),
+        'volume_gb': _uniform('ingestion_volume', ticks, 80, 120)
+    })
+
+def ingestion_volume_24h() -> pd.DataFrame:
+    """Hourly ingestion volume (GB) for the last 24 hours"""
+    return _ingestion_volume(_current_tick(HOUR))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _latency_with_anomalies(end_hour: int) -> pd.DataFrame:
+    ticks = _window(end_hour, 48)
+    latency = _uniform('model_latency', ticks, 800, 1200)
+    anomaly = np.zeros(len(ticks), dtype=bool)
+    # Injected anomalies
+    latency[[15, 32, 40]] = [3500, 3200, 3800]
+    anomaly[[15, 32, 40]] = True
+    return pd.DataFrame({'time': _timestamps(ticks, HOUR), 'latency_ms': latency, 'anomaly': anomaly})
+
+def latency_with_anomalies_48h() -> pd.DataFrame:
+    """Hourly model latency (ms) for the last 48 hours, with injected anomalies flagged"""
+    return _latency_with_anomalies(_current_tick(HOUR))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _token_usage(end_hour: int) -> pd.DataFrame:
+    ticks = _window(end_hour, 24)
+    return pd.DataFrame({'hour': np.arange(24), 'tokens': _integers('token_usage', ticks, 40000, 60000)})
+
+def token_usage_24h() -> pd.DataFrame:
+    """Hourly token usage for the last 24 hours"""
+    return _token_usage(_current_tick(HOUR))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _storage_growth(end_day: int) -> pd.DataFrame:
+    ticks = _window(end_day, 30)
+    return pd.DataFrame({
+        'date': _timestamps(ticks, DAY),
+        'total_tb': np.cumsum(_uniform('storage_growth', ticks, 50, 150))
+    })
+
+def storage_growth_30d() -> pd.DataFrame:
+    """Cumulative storage (TB) over the last 30 days"""
+    return _storage_growth(_current_tick(DAY))
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _daily_costs(end_day: int) -> pd.DataFrame:
+    ticks = _window(end_day, 30)
+    return pd.DataFrame({'date': _timestamps(ticks, DAY), 'cost_usd': _uniform('daily_cost', ticks, 400, 600)})
+
+def daily_costs_30d() -> pd.DataFrame:
+    """Daily AI spend (USD) over the last 30 days"""
+    return _daily_costs(_current_tick(DAY))
+
+
+# Typical GB/day per Splunk index and daily growth, relative to GROWTH_EPOCH_DAY
+_INDEX_BASE_GB = {
+    "aiml_models": 28,
+    "aiml_training": 18,
+    "aiml_rag": 16,
+    "aiml_metrics": 8,
+    "user_activity": 10,
+    "infrastructure": 14,
+    "security_audit": 6,
+}
+DAILY_GROWTH = 0.002
+GROWTH_EPOCH_DAY = 20605  # 2026-06-01
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _index_volume(end_day: int, days: int) -> pd.DataFrame:
+    ticks = _window(end_day, days)
+    dates = _timestamps(ticks, DAY)
+    growth = 1 + DAILY_GROWTH * (ticks - GROWTH_EPOCH_DAY)
+    weekly = np.where(dates.dayofweek >= 5, 0.7, 1.0)  # lighter weekends
+    data = {'day': ticks, 'date': dates}
+    for index, base in _INDEX_BASE_GB.items():
+        data[index] = base * growth * weekly * _uniform(f'index_volume_{index}', ticks, 0.9, 1.1)
+    return pd.DataFrame(data)
+
+def index_volume(days: int) -> pd.DataFrame:
+    """Daily ingestion volume (GB) per Splunk index for the last days, with the absolute day number"""
+    return _index_volume(_current_tick(DAY), days)
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _forwarder_volumes(end_hour: int, count: int) -> np.ndarray:
+    return _integers('forwarder_volume', end_hour * count + np.arange(count), 50000, 150000)
+
+def forwarder_volumes(count: int) -> np.ndarray:
+    """Logs/hour for each of the top forwarders this hour"""
+    return _forwarder_volumes(_current_tick(HOUR), count)
+
+
+# Live (per-second) series
+@st.cache_data(max_entries=4, show_spinner=False)
+def _per_second(series: str, end_second: int, low: int, high: int) -> pd.DataFrame:
+    ticks = _window(end_second, 60)
+    return pd.DataFrame({'seconds_ago': end_second - ticks, 'value': _integers(series, ticks, low, high)})
+
+def ingestion_rate_60s() -> pd.DataFrame:
+    """Events/sec over the last minute (seconds_ago, value)"""
+    return _per_second('ingestion_rate', _live_tick(), 2000, 4000)
+
+def query_response_60s() -> pd.DataFrame:
+    """Query response time (ms) over the last minute (seconds_ago, value)"""
+    return _per_second('query_response', _live_tick(), 200, 1000)
+
+
+# (series, low, high) for each live metric card
+_LIVE_METRICS = {
+    "Ingestion Rate": ('live_ingestion_rate', 2500, 3500),
+    "Query Load": ('live_query_load', 150, 250),
+    "Indexer CPU": ('live_indexer_cpu', 45, 75),
+    "Network I/O": ('live_network_io', 800, 1200),
+    "Active Queries": ('live_active_queries', 50, 100),
+}
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _live_metrics(end_second: int) -> Dict[str, Tuple[int, int]]:
+    ticks = np.array([end_second - LIVE_REFRESH_SECONDS, end_second])
+    metrics = {}
+    for name, (series, low, high) in _LIVE_METRICS.items():
+        previous, current = _integers(series, ticks, low, high)
+        metrics[name] = (int(current), int(current - previous))
+    return metrics
+
+def live_metrics() -> Dict[str, Tuple[int, int]]:
+    """Current value and change since the previous refresh for each live metric card"""
+    return _live_metrics(_live_tick())
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _cluster_load(end_second: int, components: int) -> pd.DataFrame:
+    ticks = end_second * components + np.arange(components)
+    return pd.DataFrame({
+        'cpu': _integers('cluster_cpu', ticks, 30, 70),
+        'memory': _integers('cluster_memory', ticks, 40, 80),
+        'disk': _integers('cluster_disk', ticks, 20, 60),
+        'network': _integers('cluster_network', ticks, 500, 1500)
+    })
+
+def cluster_load(components: int) -> pd.DataFrame:
+    """Current CPU/memory/disk (%) and network (Mbps) for each cluster component"""
+    return _cluster_load(_live_tick(), components)
+
@@ -0,0 +1,201 @@
+"""
+Drift Engine
+Reference-versus-live distribution drift (two-sample KS and PSI) for every numeric feature of a source category
+"""
+
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from log_store import SOURCE_SCHEMAS, LogStore
+
+DRIFT_CATEGORY = "Model Metrics"
+DRIFT_KEY = "model"
+
+HISTOGRAM_BINS = 100  # fine bins per feature for the KS statistic
+PSI_GROUPS = 10  # PSI is computed over these coarser groups of adjacent bins
+BLOCK_EVENTS = 500  # events per histogram block; the live window slides one block at a time
+WINDOW_BLOCKS = 4
+KS_ALPHA = 0.01
+PSI_WARNING = 0.1
+PSI_MAJOR = 0.2
+_PSI_FLOOR = 1e-4
+
+
+def numeric_features(category: str) -> List[str]:
+    """int and float columns of a source category's schema"""
+    return [name for name, kind in SOURCE_SCHEMAS[category] if kind in ("int", "float")]
+
+
+def ks_critical_value(n: int, m: int, alpha: float = KS_ALPHA) -> float:
+    """Two-sample KS statistic above which the samples differ at significance alpha (asymptotic)"""
+    return float(np.sqrt(-np.log(alpha / 2) / 2) * np.sqrt((n + m) / (n * m)))
+
+
+def ks_p_values(statistics: np.ndarray, n: int, m: int) -> np.ndarray:
+    """Asymptotic two-sample KS p-values for an array of statistics"""
+    effective = np.sqrt(n * m / (n + m))
+    lam = (effective + 0.12 + 0.11 / effective) * np.asarray(statistics, dtype=np.float64)
+    k = np.arange(1, 101)[:, None]
+    terms = 2 * (-1.0) ** (k - 1) * np.exp(-2 * k * k * lam[None, :] ** 2)
+    return np.clip(terms.sum(axis=0), 0.0, 1.0)
+
+
+class FeatureWindow:
+    """Fixed-bin histograms of many features for one key: a reference snapshot and a sliding live window
+
+    Bin edges are set per feature from the key's first block of events (values outside are
+    counted in the end bins). The live window is the sum of the last window_blocks completed
+    block histograms plus the block being filled, kept as a running total so adding events and
+    sliding the window cost O(new events). The first full window becomes the reference.
+    """
+
+    def __init__(self, n_features: int, block_events: int = BLOCK_EVENTS, window_blocks: int = WINDOW_BLOCKS):
+        self.n_features = n_features
+        self.block_events = block_events
+        self.window_blocks = window_blocks
+        self.low: Optional[np.ndarray] = None
+        self.width: Optional[np.ndarray] = None
+        self._pending: List[np.ndarray] = []
+        self._pending_events = 0
+        self.blocks: deque = deque()
+        self.current = np.zeros((n_features, HISTOGRAM_BINS), dtype=np.int64)
+        self.current_events = 0
+        self.window = np.zeros((n_features, HISTOGRAM_BINS), dtype=np.int64)
+        self.reference: Optional[np.ndarray] = None
+
+    @property
+    def live_events(self) -> int:
+        return len(self.blocks) * self.block_events + self.current_events
+
+    @property
+    def reference_events(self) -> int:
+        return 0 if self.reference is None else int(self.reference[0].sum())
+
+    def _set_edges(self, values: np.ndarray):
+        low, high = np.nanquantile(values, [0.001, 0.999], axis=0)
+        pad = np.maximum((high - low) * 0.25, 1e-9)
+        self.low = low - pad
+        self.width = (high - low + 2 * pad) / HISTOGRAM_BINS
+
+    def _histogram(self, values: np.ndarray) -> np.ndarray:
+        """(features, bins) counts of an (events, features) array, in one bincount"""
+        bins = np.clip(((values - self.low) / self.width).astype(np.int64), 0, HISTOGRAM_BINS - 1)
+        flat = bins + np.arange(self.n_features) * HISTOGRAM_BINS
+        return np.bincount(flat.ravel(), minlength=self.n_features * HISTOGRAM_BINS).reshape(self.n_features, -1)
+
+    def add(self, values: np.ndarray):
+        """Add an (events, features) array in arrival order"""
+        if self.low is None:
+            self._pending.append(values)
+            self._pending_events += len(values)
+            if self._pending_events < self.block_events:
+                return
+            values = np.concatenate(self._pending)
+            self._pending = []
+            self._set_edges(values)
+        start = 0
+        while start < len(values):
+            stop = start + min(self.block_events - self.current_events, len(values) - start)
+            counts = self._histogram(values[start:stop])
+            self.current += counts
+            self.window += counts
+            self.current_events += stop - start
+            if self.current_events == self.block_events:
+                self._complete_block()
+            start = stop
+
+    def _complete_block(self):
+        self.blocks.append(self.current)
+        self.current = np.zeros_like(self.current)
+        self.current_events = 0
+        if len(self.blocks) > self.window_blocks:
+            self.window -= self.blocks.popleft()
+        if self.reference is None and len(self.blocks) == self.window_blocks:
+            self.snapshot_reference()
+
+    def snapshot_reference(self):
+        """Make the live window the new reference and start an empty live window"""
+        self.reference = self.window.copy()
+        self.blocks.clear()
+        self.current[:] = 0
+        self.current_events = 0
+        self.window[:] = 0
+
+    def compare(self) -> Optional[Dict[str, np.ndarray]]:
+        """KS statistic, p-value, PSI and drift flag per feature, or None until both windows have events"""
+        n, m = self.reference_events, self.live_events
+        if not n or not m:
+            return None
+        p = self.reference / n
+        q = self.window / m
+        ks = np.abs(np.cumsum(p, axis=1) - np.cumsum(q, axis=1)).max(axis=1)
+        p_grouped = np.maximum(p.reshape(self.n_features, PSI_GROUPS, -1).sum(axis=2), _PSI_FLOOR)
+        q_grouped = np.maximum(q.reshape(self.n_features, PSI_GROUPS, -1).sum(axis=2), _PSI_FLOOR)
+        psi = ((q_grouped - p_grouped) * np.log(q_grouped / p_grouped)).sum(axis=1)
+        p_value = ks_p_values(ks, n, m)
+        return {
+            "ks_statistic": ks,
+            "p_value": p_value,
+            "psi": psi,
+            "drift_detected": (psi >= PSI_MAJOR) | ((p_value < KS_ALPHA) & (psi >= PSI_WARNING)),
+        }
+
+
+class DriftEngine:
+    """Per-key feature windows for one source category, fed incrementally from a LogStore"""
+
+    def __init__(self, category: str = DRIFT_CATEGORY, key: str = DRIFT_KEY,
+                 block_events: int = BLOCK_EVENTS, window_blocks: int = WINDOW_BLOCKS):
+        self.category = category
+        self.key = key
+        self.features = numeric_features(category)
+        self.block_events = block_events
+        self.window_blocks = window_blocks
+        self.windows: Dict[str, FeatureWindow] = {}
+        self.last_seq = -1
+
+    def observe(self, store: LogStore) -> int:
+        """Add the category's events appended since the last call to each key's live window"""
+        upto = store.total_appended - 1
+        events = store.frame(self.category, columns=[self.key] + self.features, since=self.last_seq, until=upto)
+        self.last_seq = upto
+        if events.empty:
+            return 0
+        values = events[self.features].to_numpy(dtype=np.float64)
+        keys = events[self.key].cat.remove_unused_categories()
+        codes = keys.cat.codes.to_numpy()
+        for code, key in enumerate(keys.cat.categories):
+            window = self.windows.get(key)
+            if window is None:
+                window = self.windows[key] = FeatureWindow(len(self.features), self.block_events, self.window_blocks)
+            window.add(values[codes == code])
+        return len(events)
+
+    def keys(self) -> List[str]:
+        return sorted(self.windows)
+
+    def baselined_keys(self) -> List[str]:
+        """Keys whose reference window has been captured"""
+        return [key for key in self.keys() if self.windows[key].reference is not None]
+
+    def snapshot_reference(self, key: str):
+        self.windows[key].snapshot_reference()
+
+    def report(self, key: str) -> Optional[pd.DataFrame]:
+        """One row per feature comparing the key's live window with its reference, or None if not ready"""
+        window = self.windows.get(key)
+        result = window.compare() if window is not None else None
+        if result is None:
+            return None
+        report = pd.DataFrame({"feature": self.features, **result})
+        report["reference_events"] = window.reference_events
+        report["live_events"] = window.live_events
+        return report
+
+    def drift_detected(self, key: str) -> bool:
+        """Same meaning as the drift_detected field of Model Metrics events: any feature of the key drifted"""
+        report = self.report(key)
+        return bool(report is not None and report["drift_detected"].any())
@@ -0,0 +1,133 @@
+"""
+Forecasting
+Additive Holt-Winters fitted to many series at once, with prediction intervals and incremental refits
+"""
+
+import itertools
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+ALPHAS = (0.1, 0.3, 0.5, 0.8)  # level smoothing
+BETAS = (0.0, 0.05, 0.2)  # trend smoothing, as a fraction of alpha
+GAMMAS = (0.05, 0.2, 0.5)  # seasonal smoothing
+INTERVAL_Z = 1.96  # 95% prediction interval
+REFIT_EVERY = 7  # new observations absorbed by state updates before parameters are re-estimated
+
+
+class HoltWinters:
+    """Additive level + trend + season state for S series fitted together (ETS(A,A,A) in error-correction form)
+
+    fit() grid-searches (alpha, beta, gamma) for every series in one pass over time, with the
+    series and parameter grid as array dimensions, and keeps each series' best combination.
+    update() runs the same recursions on new observations with the fitted parameters.
+    season=None fits Holt's linear trend without a seasonal component.
+    """
+
+    def __init__(self, season: Optional[int] = None):
+        self.season = season or 1
+        self.seasonal = season is not None and season > 1
+        self.observations = 0
+
+    def _initial_state(self, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        m = self.season
+        if self.seasonal and y.shape[1] >= 2 * m:
+            first, second = y[:, :m].mean(axis=1), y[:, m:2 * m].mean(axis=1)
+            return first, (second - first) / m, y[:, :m] - first[:, None]
+        level = y[:, 0]
+        trend = y[:, 1] - y[:, 0] if y.shape[1] > 1 else np.zeros(len(y))
+        return level, trend, np.zeros((len(y), m))
+
+    def _run(self, y: np.ndarray, level, trend, seasons, alpha, beta, gamma, phase: int):
+        """Apply the recursions over y (S, T); state arrays may carry a trailing parameter-grid axis"""
+        sse = np.zeros(level.shape)
+        m = self.season
+        for t in range(y.shape[1]):
+            i = (phase + t) % m
+            observed = y[:, t].reshape((-1,) + (1,) * (level.ndim - 1))
+            error = observed - (level + trend + seasons[:, i])
+            sse += error * error
+            level = level + trend + alpha * error
+            trend = trend + alpha * beta * error
+            if self.seasonal:
+                seasons[:, i] = seasons[:, i] + gamma * error
+        return level, trend, seasons, sse
+
+    def fit(self, y: np.ndarray) -> "HoltWinters":
+        """Estimate parameters and state from a (series, time) array"""
+        y = np.asarray(y, dtype=np.float64)
+        level, trend, seasons = self._initial_state(y)
+        grid = np.array(list(itertools.product(ALPHAS, BETAS, GAMMAS if self.seasonal else (0.0,))))
+        alpha, beta, gamma = grid.T
+        # State per (series, combination); seasons as (series, season index, combination)
+        level = np.repeat(level[:, None], len(grid), axis=1)
+        trend = np.repeat(trend[:, None], len(grid), axis=1)
+        seasons = np.repeat(seasons[:, :, None], len(grid), axis=2)
+        level, trend, seasons, sse = self._run(y, level, trend, seasons, alpha, beta, gamma, 0)
+        best = sse.argmin(axis=1)
+        rows = np.arange(len(y))
+        self.alpha, self.beta, self.gamma = alpha[best], beta[best], gamma[best]
+        self.level, self.trend = level[rows, best], trend[rows, best]
+        self.seasons = seasons[rows, :, best]
+        self.sse = sse[rows, best]
+        self.observations = y.shape[1]
+        return self
+
+    def update(self, y: np.ndarray):
+        """Absorb new (series, k) observations without re-estimating parameters"""
+        y = np.asarray(y, dtype=np.float64)
+        self.level, self.trend, self.seasons, sse = self._run(
+            y, self.level, self.trend, self.seasons, self.alpha, self.beta, self.gamma, self.observations
+        )
+        self.sse = self.sse + sse
+        self.observations += y.shape[1]
+
+    def forecast(self, horizon: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(mean, lower, upper) arrays of shape (series, horizon)"""
+        steps = np.arange(1, horizon + 1)
+        season_index = (self.observations + steps - 1) % self.season
+        mean = self.level[:, None] + steps * self.trend[:, None] + self.seasons[:, season_index]
+        # Variance grows by (alpha + alpha*beta*j + gamma*[j is a whole season ahead])^2 per step
+        j = steps[:-1]
+        c = (self.alpha[:, None] * (1 + self.beta[:, None] * j)
+             + self.gamma[:, None] * (self.seasonal & (j % self.season == 0)))
+        multiplier = np.sqrt(1 + np.concatenate([np.zeros((len(c), 1)), np.cumsum(c * c, axis=1)], axis=1))
+        sigma = np.sqrt(self.sse / max(self.observations, 1))
+        band = INTERVAL_Z * sigma[:, None] * multiplier
+        return mean, mean - band, mean + band
+
+
+class ForecastCache:
+    """Fitted models for named groups of series on a shared time grid, advanced as the grid moves forward
+
+    forecast() is given the full history (series, time) and the absolute index of its first
+    column. Columns past the cached fit are absorbed with state updates, and parameters are
+    re-estimated only after refit_every new columns, a gap, or a change in the series list.
+    """
+
+    def __init__(self, refit_every: int = REFIT_EVERY):
+        self.refit_every = refit_every
+        self._lock = threading.Lock()
+        # group -> (series names, model, absolute index after the last absorbed column, columns since fit)
+        self._fits: Dict[str, Tuple[List[str], HoltWinters, int, int]] = {}
+
+    def forecast(self, group: str, names: List[str], history: np.ndarray, start: int, horizon: int,
+                 season: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(mean, lower, upper) per series for the horizon steps after the end of history"""
+        end = start + history.shape[1]
+        with self._lock:
+            cached = self._fits.get(group)
+            if cached is not None and cached[0] == list(names) and start <= cached[2] <= end:
+                _, model, fitted_end, since_fit = cached
+                if end > fitted_end and since_fit + end - fitted_end < self.refit_every:
+                    model.update(history[:, fitted_end - start:])
+                    since_fit += end - fitted_end
+                elif end > fitted_end:
+                    model, since_fit = None, 0
+            else:
+                model, since_fit = None, 0
+            if model is None:
+                model = HoltWinters(season).fit(history)
+            self._fits[group] = (list(names), model, end, since_fit)
+            return model.forecast(horizon)
@@ -0,0 +1,145 @@
+"""
+Ingestion Worker
+Background producer that generates synthetic events at a target rate into a log store shared by all sessions
+"""
+
+import argparse
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+import streamlit as st
+
+from log_generator import generate_mixed_batch
+from log_store import DEFAULT_MAX_BYTES, LogStore
+from shared_log_store import SharedLogStore, open_log_store
+from tier_manager import TierManager
+
+DEFAULT_RATE = 100  # events per second
+MAX_RATE = 1_000_000
+TICK_SECONDS = 0.1  # one batch per tick; batches spread their timestamps over the tick
+MAX_BACKLOG_SECONDS = 1.0  # when generation falls behind, at most this much owed work is kept
+RATE_SMOOTHING = 0.2  # EWMA weight of the newest tick in the achieved rate
+
+
+class IngestionWorker:
+    """Daemon thread appending vectorized batches of mixed-source events to a LogStore
+
+    start(), stop() and set_rate() only flip state read by the thread, so page reruns never
+    generate events themselves; snapshot() returns a copy of the counters for display.
+    """
+
+    def __init__(self, store: LogStore, rate: float = DEFAULT_RATE, tick_seconds: float = TICK_SECONDS):
+        self.store = store
+        self.rate = float(rate)
+        self.tick_seconds = tick_seconds
+        self._active = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"events": 0, "batches": 0, "achieved_rate": 0.0, "dropped": 0, "started_at": None, "last_error": None}
+
+    @property
+    def running(self) -> bool:
+        return self._active.is_set()
+
+    def start(self):
+        with self._lock:
+            if self._active.is_set() or self.store.read_only:
+                return
+            self._active.set()
+            self._stats["started_at"] = time.time()
+            # A thread that has not yet seen the stop() keeps going; once it has exited (clearing _thread) start a new one
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ingestion-worker", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            self._active.clear()
+            self._stats["achieved_rate"] = 0.0
+
+    def set_rate(self, rate: float):
+        """Target events per second, clipped to [0, MAX_RATE]"""
+        self.rate = float(min(max(rate, 0), MAX_RATE))
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return dict(self._stats, running=self.running, rate=self.rate)
+
+    def _run(self):
+        rng = np.random.default_rng()
+        owed = 0.0
+        last = time.monotonic()
+        while True:
+            with self._lock:
+                # Decided under the lock, so start() either sees this thread continue or spawns a new one
+                if not self._active.is_set():
+                    self._thread = None
+                    return
+            now = time.monotonic()
+            elapsed, last = now - last, now
+            owed += self.rate * elapsed
+            backlog = self.rate * MAX_BACKLOG_SECONDS
+            dropped = max(0, int(owed - backlog))
+            owed -= dropped
+            n = int(owed)
+            owed -= n
+            try:
+                if n:
+                    span_ms = max(1, int(elapsed * 1000))
+                    for category, columns in generate_mixed_batch(n, rng, datetime.now(), span_ms).items():
+                        self.store.extend(category, columns)
+                error = None
+            except Exception as e:  # keep producing; the page shows the last error
+                n, error = 0, f"{type(e).__name__}: {e}"
+            with self._lock:
+                stats = self._stats
+                stats["events"] += n
+                stats["batches"] += 1 if n else 0
+                stats["dropped"] += dropped
+                if error:
+                    stats["last_error"] = error
+                if elapsed > 0 and self._active.is_set():
+                    rate = n / elapsed
+                    stats["achieved_rate"] += RATE_SMOOTHING * (rate - stats["achieved_rate"])
+            time.sleep(max(0.0, self.tick_seconds - (time.monotonic() - now)))
+
+
+@st.cache_resource(show_spinner=False)
+def ingestion_worker() -> IngestionWorker:
+    """One worker, and the log store it feeds, per server process
+
+    With LOG_STORE_SHARED_NAME set the store is attached read-only to the block a standalone
+    ingest process writes (see __main__), and this worker never starts.
+    """
+    return IngestionWorker(open_log_store())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Standalone ingest process writing a shared memory log store")
+    parser.add_argument("--shared", required=True, help="block name; dashboards set LOG_STORE_SHARED_NAME to it")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE)
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024)
+    args = parser.parse_args()
+    shared = SharedLogStore.create(args.shared, int(args.max_mb * 1024 * 1024))
+    standalone = IngestionWorker(shared, rate=args.rate)
+    tiers = TierManager(shared)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    standalone.start()
+    tiers.start()
+    print(f"Writing {args.rate:,.0f} events/s into shared log store '{args.shared}' ({shared.nbytes / 1024 / 1024:,.0f} MB)")
+    try:
+        while True:
+            time.sleep(10)
+            stats = standalone.snapshot()
+            print(f"{stats['events']:,} events, {stats['achieved_rate']:,.0f}/s, generation {shared.generation:,}")
+    except KeyboardInterrupt:
+        standalone.stop()
+    finally:
+        tiers.stop()
+        tiers.flush()
+        shared.unlink()
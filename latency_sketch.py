@@ -0,0 +1,152 @@
+"""
+Latency Sketches
+Mergeable DDSketch-style latency histograms per key and minute, with range quantiles in constant time
+"""
+
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+RELATIVE_ACCURACY = 0.01  # quantile estimates are within 1% of the true value
+MIN_LATENCY_MS = 0.1  # smaller latencies share the lowest bucket
+MAX_LATENCY_MS = 1e6  # larger latencies share the highest bucket
+RETENTION_MINUTES = 240
+MAX_KEYS = 64  # per group; spans of further keys are counted as dropped
+MAX_CLOCK_SKEW_MINUTES = 5  # spans ending further in the future are dropped
+QUANTILES = (0.5, 0.95, 0.99)
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = np.log(_GAMMA)
+_INDEX_OFFSET = int(np.floor(np.log(MIN_LATENCY_MS) / _LOG_GAMMA))
+BUCKETS = int(np.ceil(np.log(MAX_LATENCY_MS) / _LOG_GAMMA)) - _INDEX_OFFSET + 1
+# Representative value of each bucket: the point with equal relative error to both bounds
+BUCKET_VALUES = 2 * _GAMMA ** (np.arange(BUCKETS) + _INDEX_OFFSET) / (_GAMMA + 1)
+
+
+def bucket_index(latency_ms: np.ndarray) -> np.ndarray:
+    """Logarithmic bucket of each latency (bucket i covers (gamma^(i-1), gamma^i] after the offset)"""
+    logs = np.log(np.maximum(latency_ms, MIN_LATENCY_MS)) / _LOG_GAMMA
+    return np.clip(np.ceil(logs).astype(np.int64) - _INDEX_OFFSET, 0, BUCKETS - 1)
+
+
+def sketch_quantiles(counts: np.ndarray, quantiles: Iterable[float] = QUANTILES) -> np.ndarray:
+    """Quantile estimates from a bucket count vector (NaN when empty)"""
+    quantiles = np.asarray(list(quantiles), dtype=np.float64)
+    total = counts.sum()
+    if not total:
+        return np.full(len(quantiles), np.nan)
+    ranks = quantiles * (total - 1)
+    return BUCKET_VALUES[np.searchsorted(np.cumsum(counts), ranks, side='right')]
+
+
+class MinuteSketch:
+    """Bucket counts of one key for each of the last retention minutes, held as running totals
+
+    Row m holds the counts of every value up to and including minute m, so the sketch of any
+    range of minutes is the difference of two rows: O(buckets) however long the range. Merging
+    sketches is adding their count vectors. Late values update all newer rows in one pass.
+    """
+
+    def __init__(self, retention_minutes: int = RETENTION_MINUTES):
+        self.retention = retention_minutes
+        # One spare row so the total before the oldest retained minute is still known
+        self.rows = retention_minutes + 1
+        self.counts = np.zeros((self.rows, BUCKETS), dtype=np.int64)
+        self.sums = np.zeros(self.rows)
+        self.head: Optional[int] = None  # newest minute
+
+    @property
+    def oldest(self) -> int:
+        return self.head - self.retention + 1
+
+    def _advance(self, minute: int):
+        """Move the newest minute forward, carrying the running totals into the new rows"""
+        if self.head is None:
+            self.head = minute
+            return
+        steps = minute - self.head
+        if steps <= 0:
+            return
+        last = self.head % self.rows
+        new_rows = (self.head + 1 + np.arange(min(steps, self.rows))) % self.rows
+        self.counts[new_rows] = self.counts[last]
+        self.sums[new_rows] = self.sums[last]
+        self.head = minute
+
+    def add(self, minutes: np.ndarray, buckets: np.ndarray, values: np.ndarray) -> int:
+        """Add values by minute and bucket; returns how many were older than the retention and dropped"""
+        if not len(minutes):
+            return 0
+        self._advance(int(minutes.max()))
+        kept = minutes >= self.oldest
+        minutes, buckets, values = minutes[kept], buckets[kept], values[kept]
+        if not len(minutes):
+            return int((~kept).sum())
+        first = int(minutes.min())
+        span = self.head - first + 1
+        positions = minutes - first
+        delta = np.bincount(positions * BUCKETS + buckets, minlength=span * BUCKETS).reshape(span, BUCKETS)
+        rows = (first + np.arange(span)) % self.rows
+        self.counts[rows] += np.cumsum(delta, axis=0)
+        self.sums[rows] += np.cumsum(np.bincount(positions, weights=values, minlength=span))
+        return int((~kept).sum())
+
+    def range(self, start: int, end: int) -> Tuple[np.ndarray, float]:
+        """(bucket counts, sum of values) over minutes start..end inclusive, clipped to the retention"""
+        if self.head is None:
+            return np.zeros(BUCKETS, dtype=np.int64), 0.0
+        start, end = max(start, self.oldest), min(end, self.head)
+        if start > end:
+            return np.zeros(BUCKETS, dtype=np.int64), 0.0
+        top, base = end % self.rows, (start - 1) % self.rows
+        return self.counts[top] - self.counts[base], float(self.sums[top] - self.sums[base])
+
+
+class LatencySketches:
+    """Minute sketches per (group, key), e.g. ("stage", "Retrieval") or ("service", "vector-db")"""
+
+    def __init__(self, retention_minutes: int = RETENTION_MINUTES):
+        self.retention = retention_minutes
+        self.sketches: Dict[str, Dict[str, MinuteSketch]] = {}
+        self.dropped = 0
+
+    def add(self, group: str, keys, start_us: np.ndarray, end_us: np.ndarray):
+        """Add span latencies under each span's key, in the (UTC epoch) minute the span ended"""
+        codes, uniques = pd.factorize(keys)
+        minutes = end_us // 60_000_000
+        latency = (end_us - start_us) / 1000
+        buckets = bucket_index(latency)
+        in_time = minutes <= int(time.time() // 60) + MAX_CLOCK_SKEW_MINUTES
+        self.dropped += int((~in_time).sum())
+        sketches = self.sketches.setdefault(group, {})
+        for code, key in enumerate(uniques):
+            selected = (codes == code) & in_time
+            key = str(key)
+            if key not in sketches and len(sketches) >= MAX_KEYS:
+                self.dropped += int(selected.sum())
+                continue
+            sketch = sketches.setdefault(key, MinuteSketch(self.retention))
+            self.dropped += sketch.add(minutes[selected], buckets[selected], latency[selected])
+
+    def summary(self, group: str, start_minute: int, end_minute: int,
+                quantiles: Iterable[float] = QUANTILES) -> pd.DataFrame:
+        """Count, mean, rate and quantiles per key of a group over an inclusive range of epoch minutes"""
+        quantiles = list(quantiles)
+        seconds = (end_minute - start_minute + 1) * 60
+        rows = []
+        for key, sketch in self.sketches.get(group, {}).items():
+            counts, total = sketch.range(start_minute, end_minute)
+            n = int(counts.sum())
+            if not n:
+                continue
+            row = {"key": key, "count": n, "mean_ms": total / n, "per_second": n / seconds}
+            row.update({f"p{round(q * 100)}_ms": value for q, value in zip(quantiles, sketch_quantiles(counts, quantiles))})
+            rows.append(row)
+        columns = ["key", "count", "mean_ms", "per_second"] + [f"p{round(q * 100)}_ms" for q in quantiles]
+        return pd.DataFrame(rows, columns=columns)
+
+    def clear(self):
+        self.sketches.clear()
+        self.dropped = 0
@@ -0,0 +1,469 @@
+"""
+Log Generator
+Synthetic log events for the six source categories, per record or in vectorized batches
+"""
+
+import random
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from log_store import epoch_us_to_local
+
+# Fraction of model and RAG stage latencies that are slow outliers
+LATENCY_SPIKE_RATE = 0.002
+
+
+def _latency_ms(low: int, high: int, spike_low: int, spike_high: int) -> int:
+    """Latency like random.randint(low, high), occasionally a spike from [spike_low, spike_high]"""
+    if random.random() < LATENCY_SPIKE_RATE:
+        return random.randint(spike_low, spike_high)
+    return random.randint(low, high)
+
+
+# Per-record generation
+def generate_log_entry():
+    """Generate realistic log entry"""
+    models = ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]
+    stages = ["ingestion", "embedding", "retrieval", "inference", "post-processing"]
+    users = ["user_001", "user_002", "user_003", "data_science_team", "ml_ops_team"]
+    
+    trace_id = f"{random.randint(1000, 9999)}-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
+    
+    log = {
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+        "trace_id": trace_id,
+        "model": random.choice(models),
+        "stage": random.choice(stages),
+        "user_id": random.choice(users),
+        "latency_ms": random.randint(50, 3000),
+        "tokens_input": random.randint(100, 2000),
+        "tokens_output": random.randint(50, 1000),
+        "confidence_score": round(random.uniform(0.6, 0.99), 2),
+        "cost_usd": round(random.uniform(0.001, 0.05), 4),
+        "status": random.choice(["success", "success", "success", "warning", "error"])
+    }
+    return log
+
+def generate_source_specific_log(source_category):
+    """Generate logs specific to each of the six source categories"""
+    
+    trace_id = f"{random.randint(1000, 9999)}-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    
+    if source_category == "🤖 AI/ML Applications":
+        log = {
+            "timestamp": timestamp,
+            "source_category": "AI/ML Applications",
+            "source_type": random.choice(["model_serving", "training_job", "data_pipeline", "inference_api"]),
+            "trace_id": trace_id,
+            "model": random.choice(["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]),
+            "operation": random.choice(["inference", "batch_prediction", "online_serving"]),
+            "latency_ms": _latency_ms(50, 3000, 6000, 15000),
+            "tokens_input": random.randint(100, 2000),
+            "tokens_output": random.randint(50, 1000),
+            "cost_usd": round(random.uniform(0.001, 0.05), 4),
+            "status": random.choice(["success", "success", "success", "warning"]),
+            "gpu_utilization": f"{random.randint(40, 95)}%"
+        }
+    
+    elif source_category == "🔗 RAG Pipeline":
+        log = {
+            "timestamp": timestamp,
+            "source_category": "RAG Pipeline",
+            "trace_id": trace_id,
+            "stage": random.choice(["ingestion", "embedding", "retrieval", "prompt_construction", "llm_inference", "post_processing"]),
+            "document_id": f"doc_{random.randint(1000, 9999)}",
+            "vector_db": "Pinecone",
+            "embedding_model": "text-embedding-ada-002",
+            "retrieval_count": random.randint(3, 10),
+            "similarity_score": round(random.uniform(0.7, 0.99), 3),
+            "latency_ms": _latency_ms(20, 2500, 5000, 12000),
+            "chunk_size": random.randint(256, 1024),
+            "status": random.choice(["success", "success", "success"])
+        }
+    
+    elif source_category == "📊 Model Metrics":
+        log = {
+            "timestamp": timestamp,
+            "source_category": "Model Metrics",
+            "trace_id": trace_id,
+            "model": random.choice(["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro"]),
+            "metric_type": random.choice(["performance", "quality", "cost", "reliability"]),
+            "latency_p50": random.randint(400, 800),
+            "latency_p95": random.randint(1000, 2000),
+            "latency_p99": random.randint(2000, 3500),
+            "tokens_per_sec": random.randint(50, 150),
+            "cost_per_1k_tokens": round(random.uniform(0.001, 0.005), 4),
+            "hallucination_score": round(random.uniform(0.01, 0.15), 3),
+            "drift_detected": random.choice([False, False, False, True]),
+            "confidence_score": round(random.uniform(0.75, 0.98), 3)
+        }
+    
+    elif source_category == "👥 User Interactions":
+        log = {
+            "timestamp": timestamp,
+            "source_category": "User Interactions",
+            "trace_id": trace_id,
+            "user_id": random.choice(["user_001", "user_002", "user_003", "data_science_team", "ml_ops_team"]),
+            "action": random.choice(["login", "query", "config_change", "data_access", "model_deploy", "dashboard_view"]),
+            "session_id": f"sess_{random.randint(10000, 99999)}",
+            "ip_address": f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}",
+            "user_agent": "Mozilla/5.0 (Platform)",
+            "click_path": random.choice(["/dashboard", "/models", "/settings", "/logs", "/alerts"]),
+            "duration_sec": random.randint(5, 300),
+            "status": random.choice(["success", "success", "success", "failed"])
+        }
+    
+    elif source_category == "🖥️ Infrastructure":
+        log = {
+            "timestamp": timestamp,
+            "source_category": "Infrastructure",
+            "trace_id": trace_id,
+            "host": f"k8s-node-{random.randint(1, 20)}",
+            "component": random.choice(["api-gateway", "model-server", "database", "cache", "load-balancer"]),
+            "event_type": random.choice(["deployment", "restart", "scale", "failure", "config_change"]),
+            "cpu_percent": random.randint(20, 90),
+            "memory_mb": random.randint(1024, 8192),
+            "disk_io_mbps": random.randint(10, 500),
+            "network_mbps": random.randint(50, 1000),
+            "pod_count": random.randint(3, 50),
+            "status": random.choice(["healthy", "healthy", "healthy", "degraded"])
+        }
+    
+    else:  # 🔒 Governance & Compliance
+        log = {
+            "timestamp": timestamp,
+            "source_category": "Governance & Compliance",
+            "trace_id": trace_id,
+            "policy_type": random.choice(["data_privacy", "model_fairness", "audit_trail", "regulatory"]),
+            "policy_id": f"POL-{random.randint(100, 999)}",
+            "enforcement_action": random.choice(["allow", "allow", "allow", "block", "alert"]),
+            "compliance_framework": random.choice(["GDPR", "HIPAA", "SOC2", "PCI-DSS"]),
+            "anomaly_detected": random.choice([False, False, False, True]),
+            "risk_level": random.choice(["low", "low", "medium", "high"]),
+            "pii_detected": random.choice([False, False, True]),
+            "audit_required": random.choice([True, False, False]),
+            "status": random.choice(["compliant", "compliant", "compliant", "violation"])
+        }
+    
+    return log
+
+
+# Vectorized batch generation
+
+# UI labels (with emoji) map onto the plain source_category stored in each log
+SOURCE_CATEGORIES = {
+    "🤖 AI/ML Applications": "AI/ML Applications",
+    "🔗 RAG Pipeline": "RAG Pipeline",
+    "📊 Model Metrics": "Model Metrics",
+    "👥 User Interactions": "User Interactions",
+    "🖥️ Infrastructure": "Infrastructure",
+    "🔒 Governance & Compliance": "Governance & Compliance",
+}
+
+
+def _digits(values: np.ndarray, width: int) -> np.ndarray:
+    """Zero-padded ASCII digits of non-negative integers as an (n, width) uint8 array"""
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (values[:, None] // powers % 10 + ord('0')).astype(np.uint8)
+
+
+def _join_bytes(*parts: np.ndarray) -> np.ndarray:
+    """Concatenate (n, w) uint8 arrays and view each row as one fixed-width bytes string"""
+    joined = np.ascontiguousarray(np.hstack(parts))
+    return joined.view(f"S{joined.shape[1]}").ravel()
+
+
+def _literal(text: str, n: int) -> np.ndarray:
+    return np.broadcast_to(np.frombuffer(text.encode(), dtype=np.uint8), (n, len(text)))
+
+
+def _choice(values):
+    """Uniform choice from a list (repeat entries to weight them); strings come back as a Categorical"""
+    if isinstance(values[0], bool):
+        pool = np.asarray(values, dtype=bool)
+        return lambda rng, n: pool[rng.integers(0, len(pool), n)]
+    categories, codes = np.unique(values, return_inverse=True)
+    categories = categories.tolist()
+    return lambda rng, n: pd.Categorical.from_codes(codes[rng.integers(0, len(codes), n)], categories=categories)
+
+
+def _labels(template: str, low: int, high: int):
+    """Choice from the formatted labels template.format(low..high) as a Categorical"""
+    labels = [template.format(i) for i in range(low, high + 1)]
+    return lambda rng, n: pd.Categorical.from_codes(rng.integers(0, len(labels), n), categories=labels)
+
+
+def _integers(low: int, high: int):
+    """Inclusive integer range, like random.randint"""
+    return lambda rng, n: rng.integers(low, high + 1, n, dtype=np.int32)
+
+
+def _with_spikes(generate, low: int, high: int, rate: float = LATENCY_SPIKE_RATE):
+    """Replace a small random fraction of generated integers with values drawn from [low, high]"""
+    def spiky(rng, n):
+        values = generate(rng, n)
+        spikes = np.flatnonzero(rng.random(n) < rate)
+        values[spikes] = rng.integers(low, high + 1, len(spikes))
+        return values
+    return spiky
+
+
+def _uniform(low: float, high: float, decimals: int):
+    """Rounded uniform floats, like round(random.uniform(low, high), decimals)"""
+    return lambda rng, n: np.round(rng.uniform(low, high, n), decimals)
+
+
+def _constant(value: str):
+    return lambda rng, n: pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
+
+
+def _prefixed_id(prefix: str, low: int, high: int):
+    """High-cardinality ids such as doc_1234, as fixed-width bytes"""
+    width = len(str(high))
+    return lambda rng, n: _join_bytes(_literal(prefix, n), _digits(rng.integers(low, high + 1, n), width))
+
+
+def _trace_ids(rng, n):
+    parts = [_digits(rng.integers(1000, 10000, n), 4) for _ in range(3)]
+    dash = _literal("-", n)
+    return _join_bytes(parts[0], dash, parts[1], dash, parts[2])
+
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def _hex_ids(rng, n: int, nbytes: int) -> np.ndarray:
+    """Random lowercase hex ids of 2 * nbytes characters (W3C trace and span ids), as fixed-width bytes"""
+    raw = rng.integers(0, 256, (n, nbytes), dtype=np.uint8)
+    digits = np.empty((n, 2 * nbytes), dtype=np.uint8)
+    digits[:, 0::2] = _HEX_DIGITS[raw >> 4]
+    digits[:, 1::2] = _HEX_DIGITS[raw & 15]
+    return digits.view(f"S{2 * nbytes}").ravel()
+
+
+@lru_cache(maxsize=1)
+def _ip_table() -> np.ndarray:
+    octets = np.array([str(i).encode() for i in range(1, 256)])
+    return np.char.add(np.char.add(b"192.168.", octets[:, None]), np.char.add(b".", octets[None, :])).ravel()
+
+
+def _ip_addresses(rng, n):
+    table = _ip_table()
+    return table[rng.integers(0, len(table), n)]
+
+
+_BATCH_SPECS = {
+    "AI/ML Applications": [
+        ("source_type", _choice(["model_serving", "training_job", "data_pipeline", "inference_api"])),
+        ("trace_id", _trace_ids),
+        ("model", _choice(["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"])),
+        ("operation", _choice(["inference", "batch_prediction", "online_serving"])),
+        ("latency_ms", _with_spikes(_integers(50, 3000), 6000, 15000)),
+        ("tokens_input", _integers(100, 2000)),
+        ("tokens_output", _integers(50, 1000)),
+        ("cost_usd", _uniform(0.001, 0.05, 4)),
+        ("status", _choice(["success", "success", "success", "warning"])),
+        ("gpu_utilization", _labels("{}%", 40, 95)),
+    ],
+    "RAG Pipeline": [
+        ("trace_id", _trace_ids),
+        ("stage", _choice(["ingestion", "embedding", "retrieval", "prompt_construction", "llm_inference", "post_processing"])),
+        ("document_id", _prefixed_id("doc_", 1000, 9999)),
+        ("vector_db", _constant("Pinecone")),
+        ("embedding_model", _constant("text-embedding-ada-002")),
+        ("retrieval_count", _integers(3, 10)),
+        ("similarity_score", _uniform(0.7, 0.99, 3)),
+        ("latency_ms", _with_spikes(_integers(20, 2500), 5000, 12000)),
+        ("chunk_size", _integers(256, 1024)),
+        ("status", _constant("success")),
+    ],
+    "Model Metrics": [
+        ("trace_id", _trace_ids),
+        ("model", _choice(["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro"])),
+        ("metric_type", _choice(["performance", "quality", "cost", "reliability"])),
+        ("latency_p50", _integers(400, 800)),
+        ("latency_p95", _integers(1000, 2000)),
+        ("latency_p99", _integers(2000, 3500)),
+        ("tokens_per_sec", _integers(50, 150)),
+        ("cost_per_1k_tokens", _uniform(0.001, 0.005, 4)),
+        ("hallucination_score", _uniform(0.01, 0.15, 3)),
+        ("drift_detected", _choice([False, False, False, True])),
+        ("confidence_score", _uniform(0.75, 0.98, 3)),
+    ],
+    "User Interactions": [
+        ("trace_id", _trace_ids),
+        ("user_id", _choice(["user_001", "user_002", "user_003", "data_science_team", "ml_ops_team"])),
+        ("action", _choice(["login", "query", "config_change", "data_access", "model_deploy", "dashboard_view"])),
+        ("session_id", _prefixed_id("sess_", 10000, 99999)),
+        ("ip_address", _ip_addresses),
+        ("user_agent", _constant("Mozilla/5.0 (Platform)")),
+        ("click_path", _choice(["/dashboard", "/models", "/settings", "/logs", "/alerts"])),
+        ("duration_sec", _integers(5, 300)),
+        ("status", _choice(["success", "success", "success", "failed"])),
+    ],
+    "Infrastructure": [
+        ("trace_id", _trace_ids),
+        ("host", _labels("k8s-node-{}", 1, 20)),
+        ("component", _choice(["api-gateway", "model-server", "database", "cache", "load-balancer"])),
+        ("event_type", _choice(["deployment", "restart", "scale", "failure", "config_change"])),
+        ("cpu_percent", _integers(20, 90)),
+        ("memory_mb", _integers(1024, 8192)),
+        ("disk_io_mbps", _integers(10, 500)),
+        ("network_mbps", _integers(50, 1000)),
+        ("pod_count", _integers(3, 50)),
+        ("status", _choice(["healthy", "healthy", "healthy", "degraded"])),
+    ],
+    "Governance & Compliance": [
+        ("trace_id", _trace_ids),
+        ("policy_type", _choice(["data_privacy", "model_fairness", "audit_trail", "regulatory"])),
+        ("policy_id", _labels("POL-{}", 100, 999)),
+        ("enforcement_action", _choice(["allow", "allow", "allow", "block", "alert"])),
+        ("compliance_framework", _choice(["GDPR", "HIPAA", "SOC2", "PCI-DSS"])),
+        ("anomaly_detected", _choice([False, False, False, True])),
+        ("risk_level", _choice(["low", "low", "medium", "high"])),
+        ("pii_detected", _choice([False, False, True])),
+        ("audit_required", _choice([True, False, False])),
+        ("status", _choice(["compliant", "compliant", "compliant", "violation"])),
+    ],
+}
+
+
+def generate_log_batch(source_category: str, n: int, rng: Optional[np.random.Generator] = None,
+                       end_time: Optional[datetime] = None, span_ms: int = 1000) -> Dict[str, np.ndarray]:
+    """Generate n events for one source category as columns
+
+    Timestamps are datetime64[ms], spread in order over the span_ms before end_time.
+    Low-cardinality strings come back as pandas Categoricals, ids as fixed-width bytes.
+    """
+    category = SOURCE_CATEGORIES.get(source_category, source_category)
+    rng = rng or np.random.default_rng()
+    end = np.datetime64(end_time or datetime.now(), 'ms')
+    offsets = np.sort(rng.integers(0, span_ms + 1, n))[::-1]
+    columns = {"timestamp": end - offsets.astype('timedelta64[ms]')}
+    for name, generate in _BATCH_SPECS[category]:
+        columns[name] = generate(rng, n)
+    return columns
+
+
+def generate_mixed_batch(n: int, rng: Optional[np.random.Generator] = None,
+                         end_time: Optional[datetime] = None, span_ms: int = 1000) -> Dict[str, Dict[str, np.ndarray]]:
+    """Generate n events spread uniformly over all six source categories, keyed by category"""
+    rng = rng or np.random.default_rng()
+    categories = list(_BATCH_SPECS)
+    counts = rng.multinomial(n, [1 / len(categories)] * len(categories))
+    return {
+        category: generate_log_batch(category, int(count), rng, end_time, span_ms)
+        for category, count in zip(categories, counts)
+        if count
+    }
+
+
+def batch_to_frame(source_category: str, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Build a DataFrame from a batch, with timestamps formatted like per-record logs"""
+    category = SOURCE_CATEGORIES.get(source_category, source_category)
+    data = {
+        "timestamp": np.char.replace(np.datetime_as_string(columns["timestamp"], unit='ms'), 'T', ' '),
+        "source_category": pd.Categorical.from_codes(
+            np.zeros(len(columns["timestamp"]), dtype=np.int8), categories=[category]
+        ),
+    }
+    for name, values in columns.items():
+        if name == "timestamp":
+            continue
+        if isinstance(values, np.ndarray) and values.dtype.kind == 'S':
+            values = np.char.decode(values)
+        data[name] = values
+    return pd.DataFrame(data)
+
+
+# RAG request traces: (span name, service, duration range in ms); the root span covers the request.
+# Ingestion and Embedding run in parallel, then the remaining stages run one after another.
+RAG_ROOT_SPAN = ("RAG Request", "api-gateway")
+RAG_STAGE_SPANS = [
+    ("Ingestion", "document-processor", (10, 50)),
+    ("Embedding", "embedding-service", (100, 200)),
+    ("Retrieval", "vector-db", (30, 80)),
+    ("Prompt Construction", "prompt-builder", (5, 15)),
+    ("LLM Inference", "llm-gateway", (1500, 2500)),
+    ("Post-Processing", "response-formatter", (10, 30)),
+]
+RAG_ERROR_RATE = 0.005  # LLM Inference spans that fail
+
+
+def generate_rag_traces(n: int, rng: Optional[np.random.Generator] = None,
+                        end_time: Optional[datetime] = None, span_ms: int = 1000) -> Dict[str, np.ndarray]:
+    """Generate n RAG request traces as span columns, one root plus one span per stage per trace
+
+    Columns: trace_id (S32 hex), span_id and parent_span_id (S16 hex, empty for roots), name,
+    service, status (Categoricals) and start_us/end_us (int64 UTC epoch microseconds, as in
+    OTLP). Requests start in order over the span_ms before end_time (naive local time, like
+    log timestamps); stage gaps of 0-5 ms model queueing.
+    """
+    rng = rng or np.random.default_rng()
+    end = round(end_time.timestamp() * 1_000_000) if end_time else time.time_ns() // 1000
+    request_start = end - np.sort(rng.integers(0, span_ms * 1000 + 1, n))[::-1]
+    stages = len(RAG_STAGE_SPANS)
+    gaps = rng.integers(0, 5001, (n, stages + 1))
+    durations = np.empty((n, stages), dtype=np.int64)
+    for i, (name, _, (low, high)) in enumerate(RAG_STAGE_SPANS):
+        generate = _integers(low, high)
+        if name == "LLM Inference":
+            generate = _with_spikes(generate, 6000, 15000)
+        durations[:, i] = generate(rng, n).astype(np.int64) * 1000 + rng.integers(0, 1000, n)
+
+    starts = np.empty((n, stages), dtype=np.int64)
+    starts[:, 0] = request_start + gaps[:, 0]
+    starts[:, 1] = request_start + gaps[:, 1]
+    ready = np.maximum(starts[:, 0] + durations[:, 0], starts[:, 1] + durations[:, 1])
+    for i in range(2, stages):
+        starts[:, i] = ready + gaps[:, i]
+        ready = starts[:, i] + durations[:, i]
+
+    trace_ids = _hex_ids(rng, n, 16)
+    span_ids = _hex_ids(rng, n * (stages + 1), 8).reshape(n, stages + 1)
+    parents = np.empty((n, stages + 1), dtype="S16")
+    parents[:, 0] = b""
+    parents[:, 1:] = span_ids[:, :1]
+    names = [RAG_ROOT_SPAN[0]] + [name for name, _, _ in RAG_STAGE_SPANS]
+    services = [RAG_ROOT_SPAN[1]] + [service for _, service, _ in RAG_STAGE_SPANS]
+    codes = np.tile(np.arange(stages + 1, dtype=np.int8), n)
+
+    failed = rng.random(n) < RAG_ERROR_RATE
+    status = np.zeros((n, stages + 1), dtype=np.int8)
+    status[failed, 0] = 1
+    status[failed, 1 + [name for name, _, _ in RAG_STAGE_SPANS].index("LLM Inference")] = 1
+
+    return {
+        "trace_id": np.repeat(trace_ids, stages + 1),
+        "span_id": span_ids.ravel(),
+        "parent_span_id": parents.ravel(),
+        "name": pd.Categorical.from_codes(codes, categories=names),
+        "service": pd.Categorical.from_codes(codes, categories=services),
+        "start_us": np.column_stack([request_start, starts]).ravel(),
+        "end_us": np.column_stack([ready + gaps[:, stages], starts + durations]).ravel(),
+        "status": pd.Categorical.from_codes(status.ravel(), categories=["success", "error"]),
+    }
+
+
+def rag_span_events(spans: Dict[str, np.ndarray], rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """RAG Pipeline events for the stage (non-root) spans of generate_rag_traces output
+
+    Each event carries the span's trace_id, its start time as timestamp, the stage name in
+    the batch generator's snake_case form and the span duration as latency_ms.
+    """
+    stages = spans["parent_span_id"] != b""
+    events = generate_log_batch("RAG Pipeline", int(stages.sum()), rng)
+    names = spans["name"][stages]
+    stage_names = [name.lower().replace(" ", "_").replace("-", "_") for name in names.categories]
+    events["timestamp"] = epoch_us_to_local(spans["start_us"][stages]).astype('datetime64[ms]')
+    events["trace_id"] = spans["trace_id"][stages]
+    events["stage"] = pd.Categorical.from_codes(names.codes, categories=stage_names)
+    events["latency_ms"] = (spans["end_us"][stages] - spans["start_us"][stages]) // 1000
+    events["status"] = spans["status"][stages]
+    return events
@@ -0,0 +1,156 @@
+"""
+Log Store Indexes
+Incrementally maintained lookup structures for the columnar ring buffers:
+hash chains for high-cardinality ids and bitmaps for low-cardinality fields
+"""
+
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+# Fields indexed in every source category whose schema has them
+HASH_INDEXED_FIELDS = ("trace_id", "session_id", "document_id")
+BITMAP_INDEXED_FIELDS = ("model", "stage", "status", "user_id")
+
+_HASH_MULTIPLIERS = np.array(
+    [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93],
+    dtype=np.uint64,
+)
+
+
+def allocate(shape, dtype, fill=0) -> np.ndarray:
+    """Default allocator for store columns and index arrays: private process memory"""
+    return np.full(shape, fill, dtype=dtype)
+
+
+def hash_bytes(values: np.ndarray) -> np.ndarray:
+    """Vectorized 64-bit hash of a fixed-width bytes array"""
+    values = np.ascontiguousarray(values)
+    width = values.dtype.itemsize
+    raw = values.view(np.uint8).reshape(len(values), width)
+    if width % 8:
+        raw = np.hstack([raw, np.zeros((len(values), 8 - width % 8), dtype=np.uint8)])
+    words = np.ascontiguousarray(raw).view(np.uint64)
+    h = np.zeros(len(values), dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for i in range(words.shape[1]):
+            h ^= words[:, i] * _HASH_MULTIPLIERS[i % len(_HASH_MULTIPLIERS)]
+            h ^= h >> np.uint64(29)
+    return h
+
+
+class HashIndex:
+    """Bucketed hash chains over one bytes column, keyed by row id (total rows written)
+
+    heads[bucket] holds the newest row in a bucket and chain[slot] the previous row
+    in the same bucket, so chains run newest to oldest and a walk stops at the first
+    evicted row. Eviction needs no bookkeeping and memory is two int64 arrays.
+    """
+
+    def __init__(self, capacity: int, allocate: Callable = allocate):
+        self.capacity = capacity
+        self.mask = (1 << max(4, (2 * capacity - 1).bit_length())) - 1
+        self.heads = allocate(self.mask + 1, np.int64, -1)
+        self.chain = allocate(capacity, np.int64, -1)
+
+    @property
+    def nbytes(self) -> int:
+        return self.heads.nbytes + self.chain.nbytes
+
+    def add(self, values: np.ndarray, rows: np.ndarray):
+        """Index a batch of values written at the given (increasing) row ids"""
+        buckets = (hash_bytes(values) & np.uint64(self.mask)).astype(np.int64)
+        # Sorting (bucket, position) packed into one key keeps batch order within a bucket
+        # and is much faster than a stable argsort
+        shift = max(1, len(rows).bit_length())
+        keys = np.sort((buckets << shift) | np.arange(len(rows)))
+        buckets, rows = keys >> shift, rows[keys & ((1 << shift) - 1)]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = buckets[1:] != buckets[:-1]
+        previous = np.empty_like(rows)
+        previous[1:] = rows[:-1]
+        previous[first] = self.heads[buckets[first]]
+        self.chain[rows % self.capacity] = previous
+        last = np.ones(len(rows), dtype=bool)
+        last[:-1] = first[1:]
+        self.heads[buckets[last]] = rows[last]
+
+    def candidates(self, value: np.ndarray, oldest_row: int) -> np.ndarray:
+        """Live row ids in the bucket of a one-element value array (may include hash collisions), newest first"""
+        bucket = int(hash_bytes(value)[0] & np.uint64(self.mask))
+        rows = []
+        row = int(self.heads[bucket])
+        while row >= oldest_row:
+            rows.append(row)
+            row = int(self.chain[row % self.capacity])
+        return np.array(rows, dtype=np.int64)
+
+    def clear(self):
+        self.heads.fill(-1)
+
+
+class BitmapIndex:
+    """One packed bitmap of slots per categorical code"""
+
+    def __init__(self, capacity: int):
+        self.nwords = (capacity + 63) // 64
+        self.bitmaps: Dict[int, np.ndarray] = {}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(bitmap.nbytes for bitmap in self.bitmaps.values())
+
+    def _bitmap(self, code: int) -> np.ndarray:
+        bitmap = self.bitmaps.get(code)
+        if bitmap is None:
+            bitmap = self.bitmaps[code] = np.zeros(self.nwords, dtype=np.uint64)
+        return bitmap
+
+    def set_one(self, slot: int, code: int, old_code: Optional[int] = None):
+        bit = np.uint64(1 << (slot & 63))
+        if old_code is not None:
+            self.bitmaps[old_code][slot >> 6] &= ~bit
+        self._bitmap(code)[slot >> 6] |= bit
+
+    def refresh(self, column: np.ndarray, filled: int, start: int, stop: int):
+        """Recompute the words covering slots [start, stop) from the column's current codes"""
+        first, last = start >> 6, (stop + 63) >> 6
+        codes = np.full((last - first) * 64, -1, dtype=np.int64)
+        span = column[first * 64:last * 64]
+        codes[:len(span)] = span
+        codes[max(0, filled - first * 64):] = -1
+        for code in set(self.bitmaps) | set(np.unique(codes[codes >= 0]).tolist()):
+            self._bitmap(code)[first:last] = np.packbits(codes == code, bitorder='little').view(np.uint64)
+
+    def get(self, code: Optional[int]) -> Optional[np.ndarray]:
+        return None if code is None else self.bitmaps.get(code)
+
+    def clear(self):
+        self.bitmaps.clear()
+
+
+def bitmap_slots(bitmap: np.ndarray) -> np.ndarray:
+    """Slot numbers of the set bits, touching only non-zero words"""
+    nonzero = np.flatnonzero(bitmap)
+    if not len(nonzero):
+        return np.empty(0, dtype=np.int64)
+    bits = np.unpackbits(bitmap[nonzero].view(np.uint8), bitorder='little').reshape(-1, 64)
+    word, bit = np.nonzero(bits)
+    return nonzero[word] * 64 + bit
+
+
+def newest_words(bitmap: np.ndarray, head_word: int, n: int) -> np.ndarray:
+    """Copy of a bitmap keeping only the n non-zero words nearest before head_word (ring order)"""
+    nonzero = np.flatnonzero(bitmap)
+    if len(nonzero) > n:
+        recency = (head_word - nonzero) % len(bitmap)
+        nonzero = nonzero[np.argpartition(recency, n - 1)[:n]]
+    trimmed = np.zeros_like(bitmap)
+    trimmed[nonzero] = bitmap[nonzero]
+    return trimmed
+
+
+def bitmap_count(bitmap: np.ndarray) -> int:
+    """Number of set bits"""
+    nonzero = bitmap[bitmap != 0]
+    return int(np.unpackbits(nonzero.view(np.uint8)).sum()) if len(nonzero) else 0
@@ -0,0 +1,331 @@
+"""
+Log Segments
+Append-only, time-bucketed columnar segment files for ingested events, read through mmap
+"""
+
+import lzma
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from log_store import SOURCE_SCHEMAS, column_dtype
+# Where segments are written, one subdirectory per source category (TierManager adds one level per log store)
+# Where segments are written; one subdirectory per source category
+DEFAULT_SEGMENT_DIR = os.getenv('LOG_SEGMENT_DIR', os.path.join(tempfile.gettempdir(), 'aimlobs-segments'))
+DEFAULT_BUCKET_MS = int(float(os.getenv('LOG_SEGMENT_BUCKET_MINUTES', '60')) * 60_000)
+
+MAGIC = b"AIMLSEG1"
+FORMAT_VERSION = 1
+SEGMENT_SUFFIX = ".seg"
+ALIGNMENT = 64
+
+# Column codecs; compressed columns are inflated whole when read, uncompressed ones are mmap views
+CODECS = {"none": 0, "zlib": 1, "lzma": 2}
+_COMPRESS = {1: lambda data: zlib.compress(data, 6), 2: lambda data: lzma.compress(data, preset=6)}
+_DECOMPRESS = {1: zlib.decompress, 2: lzma.decompress}
+
+# File layout (little-endian):
+#   header     magic, version, column count, category, rows, timestamp and sequence ranges,
+#              dictionary offset / string count / byte length
+#   directory  one entry per column: name, kind, codec, data offset, stored and raw byte length
+#   data       each column at an aligned offset, rows sorted by timestamp then arrival
+#   dictionary int64 end offsets of the strings, then their UTF-8 bytes (codes of "cat" columns index it)
+_HEADER = struct.Struct("<8sHH4x64sqqqqqQQQ")
+_COLUMN = struct.Struct("<32s8sB7xQQQ")
+SEQ_COLUMN = "_seq"
+
+
+def category_slug(category: str) -> str:
+    """Directory name of a source category, e.g. "AI/ML Applications" -> "ai_ml_applications\""""
+    return re.sub(r'[^a-z0-9]+', '_', category.lower()).strip('_')
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_segment(path: str, category: str, events: pd.DataFrame, codec: str = "none") -> "Segment":
+    """Write one segment from events shaped like LogStore.frame() (all schema fields and _seq)
+
+    Categorical fields are re-encoded against a dictionary of only the strings the segment
+    uses. The file is written under a temporary name and renamed, so readers never see a
+    partial segment.
+    """
+    schema = SOURCE_SCHEMAS[category]
+    codec_id = CODECS[codec]
+    timestamps = events["timestamp"].to_numpy().astype('datetime64[ms]').astype(np.int64)
+    seqs = events[SEQ_COLUMN].to_numpy().astype(np.int64)
+    order = np.lexsort((seqs, timestamps))
+    timestamps, seqs = timestamps[order], seqs[order]
+
+    strings: Dict[str, int] = {}
+    columns = [(SEQ_COLUMN, "long", seqs)]
+    for name, kind in schema:
+        if name == "timestamp":
+            values = timestamps
+        elif kind == "cat":
+            used = pd.Categorical(events[name]).remove_unused_categories()
+            mapping = np.array([strings.setdefault(str(v), len(strings)) for v in used.categories], dtype=np.int32)
+            values = mapping[used.codes[order]] if len(mapping) else np.zeros(len(order), dtype=np.int32)
+        else:
+            values = events[name].to_numpy()[order].astype(column_dtype(kind))
+        columns.append((name, kind, np.ascontiguousarray(values)))
+
+    encoded = [value.encode() for value in strings]
+    string_ends = np.cumsum([len(value) for value in encoded], dtype=np.int64)
+
+    offset = _aligned(_HEADER.size + _COLUMN.size * len(columns))
+    directory, blocks = [], []
+    for name, kind, values in columns:
+        raw = values.tobytes()
+        stored = _COMPRESS[codec_id](raw) if codec_id else raw
+        directory.append(_COLUMN.pack(name.encode(), kind.encode(), codec_id, offset, len(stored), len(raw)))
+        blocks.append((offset, stored))
+        offset = _aligned(offset + len(stored))
+    dictionary_offset = offset
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(columns), category.encode(), len(order),
+        int(timestamps[0]) if len(order) else 0, int(timestamps[-1]) if len(order) else 0,
+        int(seqs.min()) if len(order) else 0, int(seqs.max()) if len(order) else 0,
+        dictionary_offset, len(encoded), int(string_ends[-1]) if len(encoded) else 0,
+    )
+    directory_path = os.path.dirname(path)
+    os.makedirs(directory_path, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory_path, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(header)
+        f.write(b"".join(directory))
+        for block_offset, stored in blocks:
+            f.seek(block_offset)
+            f.write(stored)
+        f.seek(dictionary_offset)
+        f.write(string_ends.tobytes())
+        f.write(b"".join(encoded))
+    os.replace(temporary, path)
+    return Segment(path)
+
+
+class Segment:
+    """One segment file: header, column directory and dictionary are parsed on open, column data on demand
+
+    Reads map the file and take NumPy views of uncompressed columns, so a query touches only the
+    pages of the columns and row range it needs; compressed columns are inflated whole.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            head = f.read(_HEADER.size)
+            (magic, version, ncolumns, category, self.rows, self.min_ts, self.max_ts, self.min_seq, self.max_seq,
+             dictionary_offset, nstrings, string_bytes) = _HEADER.unpack(head)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a log segment of format version {FORMAT_VERSION}")
+            self.category = category.rstrip(b"\0").decode()
+            self.columns = {}
+            for entry in struct.iter_unpack(_COLUMN.format, f.read(_COLUMN.size * ncolumns)):
+                name, kind, codec_id, offset, stored, raw = entry
+                self.columns[name.rstrip(b"\0").decode()] = (kind.rstrip(b"\0").decode(), codec_id, offset, stored, raw)
+            f.seek(dictionary_offset)
+            ends = np.frombuffer(f.read(8 * nstrings), dtype=np.int64)
+            blob = f.read(string_bytes)
+        starts = np.concatenate([[0], ends[:-1]]) if nstrings else ends
+        self.dictionary = [blob[start:end].decode() for start, end in zip(starts.tolist(), ends.tolist())]
+        self.nbytes = os.path.getsize(path)
+
+    @property
+    def codec(self) -> str:
+        codec_ids = {codec_id for _, codec_id, _, _, _ in self.columns.values()}
+        names = {codec_id: name for name, codec_id in CODECS.items()}
+        return "+".join(sorted(names[codec_id] for codec_id in codec_ids))
+
+    def _column(self, mapped: mmap.mmap, name: str) -> np.ndarray:
+        kind, codec_id, offset, stored, raw = self.columns[name]
+        dtype = column_dtype(kind)
+        if codec_id:
+            return np.frombuffer(_DECOMPRESS[codec_id](mapped[offset:offset + stored]), dtype=dtype)
+        return np.frombuffer(mapped, dtype=dtype, count=raw // dtype.itemsize, offset=offset)
+
+    def frame(self, columns: Optional[Iterable[str]] = None, start_ms: Optional[int] = None,
+              end_ms: Optional[int] = None, where: Optional[Dict[str, str]] = None,
+              categories: Optional[pd.Index] = None) -> pd.DataFrame:
+        """Events in [start_ms, end_ms) matching field=value filters, shaped like ColumnarRingBuffer.frame
+
+        The time range is found by binary search on the sorted timestamps and filters compare
+        dictionary codes, before any other column is read. Pass categories (a superset of the
+        dictionary) to decode categoricals against a dictionary shared by several segments.
+        """
+        where = where or {}
+        wanted = set(self.columns) if columns is None else set(columns) | set(where) | {"timestamp"}
+        if categories is None:
+            categories = pd.Index(self.dictionary)
+        remap = categories.get_indexer(self.dictionary).astype(np.int32)
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            views = {}
+            timestamps = views["timestamp"] = self._column(mapped, "timestamp")
+            lo = 0 if start_ms is None else int(np.searchsorted(timestamps, start_ms, side='left'))
+            hi = self.rows if end_ms is None else int(np.searchsorted(timestamps, end_ms, side='left'))
+            rows = np.arange(lo, max(lo, hi))
+            for field, value in where.items():
+                if field not in self.columns:
+                    rows = rows[:0]
+                    continue
+                kind = self.columns[field][0]
+                views[field] = self._column(mapped, field)
+                if kind == "cat":
+                    code = self.dictionary.index(value) if value in self.dictionary else -1
+                    rows = rows[views[field][rows] == code]
+                elif kind.startswith("S"):
+                    rows = rows[views[field][rows] == str(value).encode()]
+            # Copy the selected rows out of the mapping before it is closed
+            data = {SEQ_COLUMN: self._column(mapped, SEQ_COLUMN)[rows].copy()}
+            for name, kind in SOURCE_SCHEMAS[self.category]:
+                if name not in wanted:
+                    continue
+                values = (views.get(name) if name in views else self._column(mapped, name))[rows].copy()
+                if kind == "ts":
+                    data[name] = values.astype('datetime64[ms]')
+                elif kind == "cat":
+                    data[name] = pd.Categorical.from_codes(remap[values], dtype=pd.CategoricalDtype(categories))
+                elif kind.startswith("S"):
+                    data[name] = values.astype(f"U{kind[1:]}")
+                else:
+                    data[name] = values
+            del views, timestamps
+        df = pd.DataFrame(data)
+        df.insert(1, "source_category", self.category)
+        return df
+
+
+def read_segments(segments: List[Segment], columns: Optional[Iterable[str]] = None, start_ms: Optional[int] = None,
+                  end_ms: Optional[int] = None, where: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """Events of several segments of one category in one frame, categoricals sharing a merged dictionary"""
+    if not segments:
+        return pd.DataFrame(columns=[SEQ_COLUMN, "source_category", "timestamp"])
+    categories = pd.Index(pd.unique(np.concatenate([np.asarray(s.dictionary, dtype=object) for s in segments])))
+    frames = [segment.frame(columns, start_ms, end_ms, where, categories) for segment in segments]
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+class SegmentStore:
+    """Directory of segments per source category, each covering at most one time bucket
+
+    The catalog is rebuilt from the file names and headers on refresh(), so segments written by
+    another process (or an earlier run) are picked up; writes only ever add or remove whole files.
+    """
+
+    def __init__(self, root: str = DEFAULT_SEGMENT_DIR, bucket_ms: int = DEFAULT_BUCKET_MS):
+        self.root = root
+        self.bucket_ms = bucket_ms
+        self._lock = threading.Lock()
+        self._segments: Dict[str, Segment] = {}
+
+    def _path(self, category: str, bucket: int, first_seq: int) -> str:
+        name = f"{bucket * self.bucket_ms}-{first_seq}{SEGMENT_SUFFIX}"
+        return os.path.join(self.root, category_slug(category), name)
+
+    def write(self, category: str, events: pd.DataFrame, codec: str = "none") -> List[Segment]:
+        """Write events (LogStore.frame() of one category) as one new segment per time bucket they span"""
+        if not len(events):
+            return []
+        buckets = events["timestamp"].to_numpy().astype('datetime64[ms]').astype(np.int64) // self.bucket_ms
+        written = []
+        for bucket in np.unique(buckets).tolist():
+            part = events[buckets == bucket]
+            path = self._path(category, bucket, int(part[SEQ_COLUMN].min()))
+            written.append(write_segment(path, category, part, codec))
+        with self._lock:
+            self._segments.update((segment.path, segment) for segment in written)
+        return written
+
+    def move(self, segment: Segment, target: "SegmentStore") -> Segment:
+        """Move a segment file into another store of the same bucket size as-is (a rename, no data copied)"""
+        path = os.path.join(target.root, category_slug(segment.category), os.path.basename(segment.path))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(segment.path, path)
+        with self._lock:
+            self._segments.pop(segment.path, None)
+        segment.path = path
+        with target._lock:
+            target._segments[path] = segment
+        return segment
+
+    def remove(self, segments: Iterable[Segment]):
+        """Delete segment files (readers already holding a mapping keep it until they close it)"""
+        with self._lock:
+            for segment in segments:
+                self._segments.pop(segment.path, None)
+                try:
+                    os.remove(segment.path)
+                except FileNotFoundError:
+                    pass
+
+    def refresh(self):
+        """Sync the catalog with the segment files on disk"""
+        paths = set()
+        if os.path.isdir(self.root):
+            for category_dir in os.scandir(self.root):
+                if category_dir.is_dir():
+                    paths.update(entry.path for entry in os.scandir(category_dir.path)
+                                 if entry.name.endswith(SEGMENT_SUFFIX))
+        with self._lock:
+            for path in set(self._segments) - paths:
+                del self._segments[path]
+            for path in paths - set(self._segments):
+                try:
+                    self._segments[path] = Segment(path)
+                except (OSError, ValueError, struct.error):
+                    continue  # removed meanwhile, or not a segment
+
+    def segments(self, category: Optional[str] = None, start_ms: Optional[int] = None,
+                 end_ms: Optional[int] = None) -> List[Segment]:
+        """Catalogued segments overlapping [start_ms, end_ms), oldest first"""
+        with self._lock:
+            found = [
+                segment for segment in self._segments.values()
+                if (category is None or segment.category == category)
+                and (start_ms is None or segment.max_ts >= start_ms)
+                and (end_ms is None or segment.min_ts < end_ms)
+            ]
+        return sorted(found, key=lambda segment: (segment.min_ts, segment.min_seq))
+
+    def frame(self, category: str, columns: Optional[Iterable[str]] = None, start_ms: Optional[int] = None,
+              end_ms: Optional[int] = None, where: Optional[Dict[str, str]] = None,
+              before_seq: Optional[int] = None) -> pd.DataFrame:
+        """Events of one category from every overlapping segment, ordered by arrival
+
+        before_seq keeps only events with _seq < before_seq, skipping segments that hold none.
+        """
+        segments = self.segments(category, start_ms, end_ms)
+        if before_seq is not None:
+            segments = [segment for segment in segments if segment.min_seq < before_seq]
+        events = read_segments(segments, columns, start_ms, end_ms, where)
+        if before_seq is not None:
+            events = events[events[SEQ_COLUMN] < before_seq]
+        return events.sort_values(SEQ_COLUMN, ignore_index=True)
+
+    def summary(self) -> pd.DataFrame:
+        """Segment count, events, bytes and time span per category and codec"""
+        rows = [
+            {"category": s.category, "codec": s.codec, "segments": 1, "events": s.rows, "bytes": s.nbytes,
+             "oldest": s.min_ts, "newest": s.max_ts}
+            for s in self.segments()
+        ]
+        columns = ["category", "codec", "segments", "events", "bytes", "oldest", "newest"]
+        if not rows:
+            return pd.DataFrame(columns=columns)
+        summary = pd.DataFrame(rows).groupby(["category", "codec"], as_index=False).agg(
+            segments=("segments", "sum"), events=("events", "sum"), bytes=("bytes", "sum"),
+            oldest=("oldest", "min"), newest=("newest", "max"),
+        )
+        summary["oldest"] = summary["oldest"].astype('datetime64[ms]')
+        summary["newest"] = summary["newest"].astype('datetime64[ms]')
+        return summary[columns]
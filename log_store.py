@@ -0,0 +1,634 @@
+"""
+Columnar Log Store
+Fixed-capacity, per-source-category ring buffers for ingested log events
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from log_index import (
+    BITMAP_INDEXED_FIELDS, HASH_INDEXED_FIELDS, BitmapIndex, HashIndex, allocate, bitmap_count, bitmap_slots,
+    newest_words
+)
+
+# Memory ceiling for the column arrays of one store (all source categories together)
+DEFAULT_MAX_BYTES = int(float(os.getenv('LOG_STORE_MAX_MB', '64')) * 1024 * 1024)
+
+# Column kinds:
+#   ts    - event time, int64 milliseconds (naive wall-clock, like datetime.now())
+#   int   - int32
+#   long  - int64
+#   float - float64
+#   bool  - bool
+#   cat   - low-cardinality string, int32 code into the store's StringTable
+#   S<n>  - high-cardinality string, fixed-width bytes
+SOURCE_SCHEMAS = {
+    "AI/ML Applications": [
+        ("timestamp", "ts"),
+        ("source_type", "cat"),
+        ("trace_id", "S32"),
+        ("model", "cat"),
+        ("operation", "cat"),
+        ("latency_ms", "int"),
+        ("tokens_input", "int"),
+        ("tokens_output", "int"),
+        ("cost_usd", "float"),
+        ("status", "cat"),
+        ("gpu_utilization", "cat"),
+    ],
+    "RAG Pipeline": [
+        ("timestamp", "ts"),
+        ("trace_id", "S32"),
+        ("stage", "cat"),
+        ("document_id", "S16"),
+        ("vector_db", "cat"),
+        ("embedding_model", "cat"),
+        ("retrieval_count", "int"),
+        ("similarity_score", "float"),
+        ("latency_ms", "int"),
+        ("chunk_size", "int"),
+        ("status", "cat"),
+    ],
+    "Model Metrics": [
+        ("timestamp", "ts"),
+        ("trace_id", "S32"),
+        ("model", "cat"),
+        ("metric_type", "cat"),
+        ("latency_p50", "int"),
+        ("latency_p95", "int"),
+        ("latency_p99", "int"),
+        ("tokens_per_sec", "int"),
+        ("cost_per_1k_tokens", "float"),
+        ("hallucination_score", "float"),
+        ("drift_detected", "bool"),
+        ("confidence_score", "float"),
+    ],
+    "User Interactions": [
+        ("timestamp", "ts"),
+        ("trace_id", "S32"),
+        ("user_id", "cat"),
+        ("action", "cat"),
+        ("session_id", "S16"),
+        ("ip_address", "S15"),
+        ("user_agent", "cat"),
+        ("click_path", "cat"),
+        ("duration_sec", "int"),
+        ("status", "cat"),
+    ],
+    "Infrastructure": [
+        ("timestamp", "ts"),
+        ("trace_id", "S32"),
+        ("host", "cat"),
+        ("component", "cat"),
+        ("event_type", "cat"),
+        ("cpu_percent", "int"),
+        ("memory_mb", "int"),
+        ("disk_io_mbps", "int"),
+        ("network_mbps", "int"),
+        ("pod_count", "int"),
+        ("status", "cat"),
+    ],
+    "Governance & Compliance": [
+        ("timestamp", "ts"),
+        ("trace_id", "S32"),
+        ("policy_type", "cat"),
+        ("policy_id", "cat"),
+        ("enforcement_action", "cat"),
+        ("compliance_framework", "cat"),
+        ("anomaly_detected", "bool"),
+        ("risk_level", "cat"),
+        ("pii_detected", "bool"),
+        ("audit_required", "bool"),
+        ("status", "cat"),
+    ],
+}
+
+# Splunk index names used in SPL queries and retention policies, by source category
+SPLUNK_INDEXES = {
+    "aiml_models": "AI/ML Applications",
+    "aiml_training": "AI/ML Applications",
+    "aiml_rag": "RAG Pipeline",
+    "aiml_metrics": "Model Metrics",
+    "user_activity": "User Interactions",
+    "infrastructure": "Infrastructure",
+    "security_audit": "Governance & Compliance",
+}
+
+_KIND_DTYPES = {
+    "ts": np.int64,
+    "int": np.int32,
+    "long": np.int64,
+    "float": np.float64,
+    "bool": np.bool_,
+    "cat": np.int32,
+}
+
+
+def column_dtype(kind: str) -> np.dtype:
+    """Get the NumPy dtype used to store a column kind"""
+    if kind.startswith("S"):
+        return np.dtype(kind)
+    return np.dtype(_KIND_DTYPES[kind])
+
+
+def row_nbytes(schema) -> int:
+    """Bytes used by one row of a schema, including the arrival sequence number"""
+    return 8 + sum(column_dtype(kind).itemsize for _, kind in schema)
+
+
+def timestamp_to_ms(timestamp: str) -> int:
+    """Convert a log timestamp string to int64 milliseconds"""
+    return int(np.datetime64(timestamp, 'ms').astype(np.int64))
+
+
+def ms_to_timestamps(values: np.ndarray) -> List[str]:
+    """Format int64 milliseconds back into log timestamp strings"""
+    formatted = np.datetime_as_string(np.asarray(values, dtype='datetime64[ms]'), unit='ms')
+    return [s.replace('T', ' ') for s in formatted.tolist()]
+
+
+def epoch_us_to_local(values: np.ndarray) -> np.ndarray:
+    """Epoch microseconds (UTC, as spans carry them) as naive local datetime64[us], like log timestamps"""
+    values = np.asarray(values, dtype=np.int64)
+    if not len(values):
+        return values.astype('datetime64[us]')
+    seconds = values // 1_000_000
+    first, last = (time.localtime(int(v)).tm_gmtoff for v in (seconds.min(), seconds.max()))
+    if first == last:
+        offsets = first
+    else:  # the values straddle a DST change
+        offsets = np.array([time.localtime(int(v)).tm_gmtoff for v in seconds.tolist()], dtype=np.int64)
+    return (values + offsets * 1_000_000).astype('datetime64[us]')
+
+
+class StringTable:
+    """Interned strings shared by all categorical columns of a store"""
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: str) -> int:
+        """Get the code for a string, adding it to the table if new"""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+        return code
+
+    def intern_many(self, values: Iterable[str]) -> np.ndarray:
+        """Get codes for many strings, interning each distinct value once"""
+        if isinstance(values, pd.Categorical):
+            mapping = np.fromiter((self.intern(str(v)) for v in values.categories), dtype=np.int32)
+            return mapping[values.codes]
+        values = np.asarray(values, dtype=object)
+        uniques, inverse = np.unique(values, return_inverse=True)
+        codes = np.fromiter((self.intern(v) for v in uniques), dtype=np.int32, count=len(uniques))
+        return codes[inverse]
+
+    def code(self, value: str) -> Optional[int]:
+        """Get the code for a string without interning it"""
+        return self._codes.get(value)
+
+    def values(self) -> List[str]:
+        """Snapshot of all interned strings, indexed by code"""
+        return list(self._values)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Map codes back to an object array of strings"""
+        return np.asarray(self._values, dtype=object)[codes]
+
+
+class ColumnarRingBuffer:
+    """Fixed-capacity columnar buffer for the events of one source category
+
+    allocate places the column and hash index arrays (e.g. in shared memory); bitmap indexes
+    are always private and can be turned off with bitmap_fields=().
+    """
+
+    def __init__(self, category: str, schema, capacity: int, strings: StringTable,
+                 allocate: Callable = allocate, bitmap_fields: Iterable[str] = BITMAP_INDEXED_FIELDS):
+        self.category = category
+        self.schema = schema
+        self.kinds = dict(schema)
+        self.capacity = capacity
+        # Readers of a buffer another process writes see fewer rows, keeping clear of the slots being overwritten
+        self.visible = capacity
+        self.strings = strings
+        self.seq = allocate(capacity, np.int64)
+        self.columns = {name: allocate(capacity, column_dtype(kind)) for name, kind in schema}
+        self.written = 0
+        self.hash_indexes = {f: HashIndex(capacity, allocate) for f in HASH_INDEXED_FIELDS if f in self.kinds}
+        self.bitmap_indexes = {f: BitmapIndex(capacity) for f in bitmap_fields if f in self.kinds}
+
+    def __len__(self) -> int:
+        return min(self.written, self.visible)
+
+    @property
+    def oldest_row(self) -> int:
+        """Row id (count of rows written before it) of the oldest live event"""
+        return self.written - len(self)
+
+    @property
+    def nbytes(self) -> int:
+        return self.seq.nbytes + sum(col.nbytes for col in self.columns.values())
+
+    @property
+    def index_nbytes(self) -> int:
+        indexes = list(self.hash_indexes.values()) + list(self.bitmap_indexes.values())
+        return sum(index.nbytes for index in indexes)
+
+    def _encode(self, name: str, value):
+        kind = self.kinds[name]
+        if kind == "ts":
+            return timestamp_to_ms(value)
+        if kind == "cat":
+            return self.strings.intern(str(value))
+        if kind.startswith("S"):
+            return str(value).encode()
+        return value
+
+    def append(self, log: Dict, seq: int):
+        """Write one event into the next slot, overwriting the oldest when full"""
+        slot = self.written % self.capacity
+        occupied = self.written >= self.capacity
+        for name, column in self.columns.items():
+            value = self._encode(name, log[name])
+            if name in self.bitmap_indexes:
+                self.bitmap_indexes[name].set_one(slot, value, int(column[slot]) if occupied else None)
+            column[slot] = value
+        for name, index in self.hash_indexes.items():
+            index.add(self.columns[name][slot:slot + 1], np.array([self.written]))
+        self.seq[slot] = seq
+        self.written += 1
+
+    def _encode_many(self, name: str, values) -> np.ndarray:
+        kind = self.kinds[name]
+        if kind == "ts":
+            return np.asarray(values, dtype='datetime64[ms]').astype(np.int64)
+        if kind == "cat":
+            return self.strings.intern_many(values)
+        return np.asarray(values).astype(kind if kind.startswith("S") else _KIND_DTYPES[kind])
+
+    def extend(self, columns: Dict[str, np.ndarray], seqs: np.ndarray):
+        """Write a batch of events given as columns; only the newest capacity rows are kept"""
+        skipped = max(0, len(seqs) - self.capacity)
+        self.written += skipped
+        rows = np.arange(self.written, self.written + len(seqs) - skipped)
+        slots = rows % self.capacity
+        for name, column in self.columns.items():
+            column[slots] = self._encode_many(name, columns[name][skipped:])
+        for name, index in self.hash_indexes.items():
+            index.add(self.columns[name][slots], rows)
+        self.seq[slots] = seqs[skipped:]
+        self.written += len(slots)
+        if len(slots):
+            filled = len(self)
+            start, stop = int(slots[0]), int(slots[-1]) + 1
+            ranges = [(start, stop)] if start < stop else [(start, self.capacity), (0, stop)]
+            for name, index in self.bitmap_indexes.items():
+                for range_start, range_stop in ranges:
+                    index.refresh(self.columns[name], filled, range_start, range_stop)
+
+    def lookup(self, field: str, value: str) -> np.ndarray:
+        """Slots holding value in a hash-indexed field, oldest first"""
+        key = np.array([value.encode()], dtype=self.columns[field].dtype)
+        rows = self.hash_indexes[field].candidates(key, self.oldest_row)[::-1]
+        rows = rows[rows < self.written]  # a concurrent writer may have indexed rows past this reader's snapshot
+        slots = rows % self.capacity
+        return slots[self.columns[field][slots] == key[0]]
+
+    def match(self, filters: Dict[str, str], limit: Optional[int] = None) -> Optional[np.ndarray]:
+        """Slots matching field=value filters via the indexes, in arrival order
+
+        Returns None when no filter is on an indexed field (the caller has to scan).
+        Filters on fields without an index are checked against the candidate slots.
+        With a limit, only the newest matches are returned.
+        """
+        if any(field not in self.kinds for field in filters):
+            return np.empty(0, dtype=np.int64)
+        indexed = [f for f in filters if f in self.hash_indexes or f in self.bitmap_indexes]
+        if not indexed:
+            return None
+        bitmap = None
+        slots = None
+        for field in indexed:
+            value = str(filters[field])
+            if field in self.hash_indexes:
+                found = self.lookup(field, value)
+                slots = found if slots is None else np.intersect1d(slots, found)
+            else:
+                found = self.bitmap_indexes[field].get(self.strings.code(value))
+                if found is None:
+                    return np.empty(0, dtype=np.int64)
+                bitmap = found if bitmap is None else bitmap & found
+        if bitmap is not None:
+            if limit is not None and slots is None and len(indexed) == len(filters):
+                head_word = ((self.written - 1) % self.capacity) >> 6
+                bitmap = newest_words(bitmap, head_word, limit + 1)
+            from_bitmap = bitmap_slots(bitmap)
+            slots = from_bitmap if slots is None else np.intersect1d(slots, from_bitmap)
+        for field, value in filters.items():
+            if field not in indexed:
+                slots = slots[self.decoded_array(field, slots) == value]
+        slots = slots[np.argsort(self.seq[slots], kind='stable')]
+        return slots if limit is None else slots[len(slots) - min(limit, len(slots)):]
+
+    def facet_counts(self, field: str) -> Dict[str, int]:
+        """Event count per value of a categorical field, from its bitmap index when it has one"""
+        names = self.strings.values()
+        if field in self.bitmap_indexes:
+            counts = {names[code]: bitmap_count(bitmap) for code, bitmap in self.bitmap_indexes[field].bitmaps.items()}
+        else:
+            codes = np.bincount(self.columns[field][self.all_slots()])
+            counts = {names[code]: int(count) for code, count in enumerate(codes)}
+        return {name: count for name, count in counts.items() if count}
+
+    def decoded_array(self, name: str, slots: np.ndarray) -> np.ndarray:
+        """Values of one column for the given slots as a NumPy array (strings decoded)"""
+        kind = self.kinds[name]
+        values = self.columns[name][slots]
+        if kind == "cat":
+            return self.strings.decode(values)
+        if kind.startswith("S"):
+            return values.astype(f"U{kind[1:]}")
+        return values
+
+    def tail_slots(self, k: int) -> np.ndarray:
+        """Slots of the newest k events, oldest first"""
+        k = min(k, len(self))
+        return np.arange(self.written - k, self.written) % self.capacity
+
+    def all_slots(self) -> np.ndarray:
+        """Slots of every live event, oldest first"""
+        return self.tail_slots(len(self))
+
+    def slots_since(self, seq: int) -> np.ndarray:
+        """Slots of the live events that arrived after sequence number seq, oldest first"""
+        # Sequence numbers grow with row id, so binary search the live rows
+        low, high = self.oldest_row, self.written
+        while low < high:
+            middle = (low + high) // 2
+            if self.seq[middle % self.capacity] > seq:
+                high = middle
+            else:
+                low = middle + 1
+        return np.arange(low, self.written) % self.capacity
+
+    def decoded(self, name: str, slots: np.ndarray) -> list:
+        """Values of one column for the given slots, as native Python objects"""
+        kind = self.kinds[name]
+        values = self.columns[name][slots]
+        if kind == "ts":
+            return ms_to_timestamps(values)
+        if kind == "cat":
+            return self.strings.decode(values).tolist()
+        if kind.startswith("S"):
+            return [v.decode() for v in values.tolist()]
+        return values.tolist()
+
+    def rows(self, slots: np.ndarray) -> List[Dict]:
+        """Rebuild log dicts, in the generator's field order, for the given slots"""
+        names = [name for name, _ in self.schema]
+        columns = [self.decoded(name, slots) for name in names]
+        rows = []
+        for values in zip(*columns):
+            log = {"timestamp": values[0], "source_category": self.category}
+            log.update(zip(names[1:], values[1:]))
+            rows.append(log)
+        return rows
+
+    def frame(self, slots: Optional[np.ndarray] = None, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Columnar view of the given slots (default: all live events) as a DataFrame
+
+        Categorical fields stay dictionary-encoded as pandas Categoricals; pass columns
+        to materialize only the fields a query needs.
+        """
+        if slots is None:
+            slots = self.all_slots()
+        wanted = set(self.kinds) if columns is None else set(columns)
+        categories = None
+        data = {"_seq": self.seq[slots]}
+        for name, kind in self.schema:
+            if name not in wanted:
+                continue
+            values = self.columns[name][slots]
+            if kind == "ts":
+                data[name] = values.astype('datetime64[ms]')
+            elif kind == "cat":
+                if categories is None:
+                    categories = pd.Index(self.strings.values())
+                data[name] = pd.Categorical.from_codes(values, dtype=pd.CategoricalDtype(categories))
+            elif kind.startswith("S"):
+                data[name] = values.astype(f"U{kind[1:]}")
+            else:
+                data[name] = values
+        df = pd.DataFrame(data)
+        df.insert(1, "source_category", self.category)
+        return df
+
+    def clear(self):
+        self.written = 0
+        for index in list(self.hash_indexes.values()) + list(self.bitmap_indexes.values()):
+            index.clear()
+
+
+class LogStore:
+    """Per-source-category ring buffers with a shared string table and arrival order
+
+    Appends and reads take one lock, so a background writer and page reruns can share a store.
+    """
+
+    read_only = False  # True for stores attached to events another process writes
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, allocate: Callable = allocate,
+                 bitmap_fields: Iterable[str] = BITMAP_INDEXED_FIELDS):
+        self.max_bytes = max_bytes
+        self.strings = StringTable()
+        per_category = max_bytes // len(SOURCE_SCHEMAS)
+        self.buffers = {
+            category: ColumnarRingBuffer(
+                category, schema, max(1, per_category // row_nbytes(schema)), self.strings, allocate, bitmap_fields
+            )
+            for category, schema in SOURCE_SCHEMAS.items()
+        }
+        self.next_seq = 0
+        self.clears = 0  # times clear() ran, so incremental readers can tell row counts restarted
+        # One writer (e.g. the ingestion worker) and many readers share a store
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of events currently held"""
+        return sum(len(buffer) for buffer in self.buffers.values())
+
+    @property
+    def total_appended(self) -> int:
+        """Number of events ever appended, including evicted ones"""
+        return self.next_seq
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self.buffers.values())
+
+    def append(self, log: Dict):
+        """Append one event to its source category's buffer"""
+        with self._lock:
+            self.buffers[log["source_category"]].append(log, self.next_seq)
+            self.next_seq += 1
+
+    def extend(self, source_category: str, columns: Dict[str, np.ndarray]):
+        """Append a batch of events for one category, given as columns (see log_generator.generate_log_batch)"""
+        with self._lock:
+            n = len(columns["timestamp"])
+            self.buffers[source_category].extend(columns, np.arange(self.next_seq, self.next_seq + n))
+            self.next_seq += n
+
+    def lookup(self, field: str, value: str) -> List[Dict]:
+        """All live events with a hash-indexed field (trace_id, session_id, document_id) equal to value"""
+        with self._lock:
+            tagged = []
+            for buffer in self.buffers.values():
+                if field in buffer.hash_indexes:
+                    slots = buffer.lookup(field, value)
+                    tagged.extend(zip(buffer.seq[slots].tolist(), buffer.rows(slots)))
+            tagged.sort(key=lambda item: item[0])
+            return [log for _, log in tagged]
+
+    def search(self, filters: Dict[str, str], category: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Newest events (oldest first, at most limit) matching field=value filters, using the indexes"""
+        with self._lock:
+            filters = dict(filters)
+            category = filters.pop("source_category", category)
+            buffers = [self.buffers[category]] if category else self.buffers.values()
+            tagged = []
+            for buffer in buffers:
+                slots = buffer.match(filters, limit) if filters else buffer.all_slots()
+                if slots is None:
+                    slots = buffer.all_slots()
+                    for field, value in filters.items():
+                        slots = slots[buffer.decoded_array(field, slots) == value]
+                if limit is not None:
+                    slots = slots[-limit:]
+                tagged.extend(zip(buffer.seq[slots].tolist(), buffer.rows(slots)))
+            tagged.sort(key=lambda item: item[0])
+            return [log for _, log in (tagged[-limit:] if limit is not None else tagged)]
+
+    def facet_counts(self, field: str) -> Dict[str, int]:
+        """Event counts per value of a low-cardinality field across all categories"""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for buffer in self.buffers.values():
+                if buffer.kinds.get(field) == "cat":
+                    for value, count in buffer.facet_counts(field).items():
+                        counts[value] = counts.get(value, 0) + count
+            return counts
+
+    def tail(self, k: int) -> List[Dict]:
+        """The newest k events across all categories, oldest first"""
+        with self._lock:
+            if k <= 0:
+                return []
+            tagged = []
+            for buffer in self.buffers.values():
+                slots = buffer.tail_slots(k)
+                tagged.extend(zip(buffer.seq[slots].tolist(), buffer.rows(slots)))
+            tagged.sort(key=lambda item: item[0])
+            return [log for _, log in tagged[-k:]]
+
+    def frame(self, category: Optional[str] = None, columns: Optional[Iterable[str]] = None,
+              where: Optional[Dict[str, str]] = None, since: Optional[int] = None,
+              start_ms: Optional[int] = None, end_ms: Optional[int] = None,
+              until: Optional[int] = None) -> pd.DataFrame:
+        """Live events (optionally one category and a subset of fields) as one DataFrame, ordered by arrival
+
+        where narrows the rows with field=value filters answered from the indexes;
+        unindexed filters are left for the caller. since keeps only events with _seq > since
+        and until those with _seq <= until, start_ms / end_ms only events with timestamps in
+        [start_ms, end_ms). Incremental readers pass until=total_appended - 1 read beforehand
+        and resume from it, so events appended while they read are not skipped.
+        """
+        with self._lock:
+            buffers = [self.buffers[category]] if category else self.buffers.values()
+            frames = []
+            for buffer in buffers:
+                slots = buffer.match(where) if where else None
+                if since is not None:
+                    newer = buffer.slots_since(since)
+                    slots = newer if slots is None else slots[buffer.seq[slots] > since]
+                if until is not None:
+                    slots = buffer.all_slots() if slots is None else slots
+                    slots = slots[buffer.seq[slots] <= until]
+                if start_ms is not None or end_ms is not None:
+                    slots = buffer.all_slots() if slots is None else slots
+                    timestamps = buffer.columns["timestamp"][slots]
+                    if start_ms is not None:
+                        slots, timestamps = slots[timestamps >= start_ms], timestamps[timestamps >= start_ms]
+                    if end_ms is not None:
+                        slots = slots[timestamps < end_ms]
+                if columns is not None and where:
+                    columns = set(columns) | set(where)
+                if len(buffer) and (slots is None or len(slots)):
+                    frames.append(buffer.frame(slots, columns=columns))
+            if not frames:
+                return pd.DataFrame(columns=["_seq", "source_category", "timestamp"])
+            if len(frames) == 1:
+                return frames[0]
+            return pd.concat(frames, ignore_index=True).sort_values("_seq", ignore_index=True)
+
+    def rows_through(self, category: str, seq: int) -> int:
+        """Rows of a category ever written (evicted included) with _seq <= seq, counted since the last clear()
+
+        Exact while the category still holds an event with _seq <= seq; otherwise a bound (the evicted rows).
+        """
+        with self._lock:
+            buffer = self.buffers[category]
+            return buffer.written - len(buffer.slots_since(seq))
+
+    def oldest_seq(self, category: str) -> Optional[int]:
+        """Arrival sequence number of the oldest live event of a category (None when it holds none)"""
+        with self._lock:
+            buffer = self.buffers[category]
+            return int(buffer.seq[buffer.oldest_row % buffer.capacity]) if len(buffer) else None
+
+    def resume_after(self, seq: int):
+        """Number new events from seq + 1 on, e.g. after events an earlier run persisted; the store must be empty"""
+        with self._lock:
+            if self.next_seq:
+                raise ValueError("Arrival numbering can only be resumed before the first event")
+            self.next_seq = seq + 1
+
+    def time_counts(self, bucket_ms: int, buckets: int) -> Tuple[int, Dict[str, np.ndarray]]:
+        """Live events per category in each of the last complete time buckets
+
+        Returns the absolute number (timestamp // bucket_ms) of the first bucket and a
+        count array per category; the bucket holding the current time is excluded.
+        """
+        with self._lock:
+            now_ms = int(np.datetime64(datetime.now(), 'ms').astype(np.int64))
+            first = now_ms // bucket_ms - buckets
+            counts = {}
+            for category, buffer in self.buffers.items():
+                timestamps = buffer.columns["timestamp"]
+                # Every slot is live in a full buffer; otherwise only the visible rows are
+                timestamps = timestamps if len(buffer) == buffer.capacity else timestamps[buffer.all_slots()]
+                offsets = timestamps // bucket_ms - first
+                offsets = offsets[(offsets >= 0) & (offsets < buckets)]
+                counts[category] = np.bincount(offsets, minlength=buckets)
+            return first, counts
+
+    def clear(self):
+        """Drop all events (buffers keep their allocated memory)"""
+        with self._lock:
+            for buffer in self.buffers.values():
+                buffer.clear()
+            self.clears += 1
@@ -0,0 +1,404 @@
+"""
+Notification Dispatcher
+Alert delivery to PagerDuty, Slack, Teams and email from an asyncio loop on a background thread,
+with per-channel queues, rate limits, burst digests and retries
+"""
+
+import asyncio
+import json
+import os
+import random
+import smtplib
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from email.message import EmailMessage
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import streamlit as st
+
+SEND_TIMEOUT = 10  # seconds per delivery attempt
+MAX_QUEUED = 1000  # per channel; further alerts are dropped and counted
+MAX_DELIVERY_LOG = 200
+
+
+class DeliveryError(Exception):
+    """A transport rejected or failed to deliver a payload"""
+
+
+# Transports
+class WebhookTransport:
+    """JSON POST to an http(s) URL over asyncio streams"""
+
+    def __init__(self, url: str):
+        self.url = url
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.tls = parts.scheme == "https"
+        self.port = parts.port or (443 if self.tls else 80)
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    async def send(self, payload):
+        body = json.dumps(payload, default=str).encode()
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.tls or None)
+        try:
+            head = (
+                f"POST {self.path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+            )
+            writer.write(head.encode() + body)
+            await writer.drain()
+            status_line = await reader.readline()
+        finally:
+            writer.close()
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise DeliveryError(f"Bad HTTP response from {self.host}")
+        if int(parts[1]) >= 300:
+            raise DeliveryError(f"HTTP {int(parts[1])} from {self.host}")
+
+
+class SMTPTransport:
+    """Plain SMTP delivery; smtplib is blocking, so each message is sent from a worker thread"""
+
+    def __init__(self, host: str, port: int, sender: str, recipients: List[str]):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = recipients
+        self.url = f"smtp://{host}:{port}"
+
+    def _send(self, subject: str, body: str):
+        message = EmailMessage()
+        message["Subject"] = subject
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        message.set_content(body)
+        with smtplib.SMTP(self.host, self.port, timeout=SEND_TIMEOUT) as smtp:
+            smtp.send_message(message)
+
+    async def send(self, payload: Tuple[str, str]):
+        await asyncio.to_thread(self._send, *payload)
+
+
+# Local stand-ins for testing without external services
+class HTTPSink:
+    """Minimal HTTP server that accepts any POST and keeps the decoded JSON bodies"""
+
+    def __init__(self):
+        self.received: deque = deque(maxlen=MAX_DELIVERY_LOG)
+        self.port: Optional[int] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        server = await asyncio.start_server(self._handle, host, port)
+        self.port = server.sockets[0].getsockname()[1]
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.port}{path}"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value.strip())
+            body = await reader.readexactly(length) if length else b""
+            path = request_line.split()[1].decode() if len(request_line.split()) > 1 else "/"
+            self.received.append({"path": path, "body": json.loads(body or b"null")})
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+class SMTPDebugServer:
+    """Minimal SMTP server that accepts every message and keeps it instead of relaying it"""
+
+    def __init__(self):
+        self.received: deque = deque(maxlen=MAX_DELIVERY_LOG)
+        self.port: Optional[int] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        server = await asyncio.start_server(self._handle, host, port)
+        self.port = server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def reply(line: str):
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        sender, recipients = None, []
+        try:
+            await reply("220 localhost SMTP debugging server")
+            while True:
+                line = (await reader.readline()).decode("utf-8", "replace").rstrip("\r\n")
+                command = line[:4].upper()
+                if not line and reader.at_eof():
+                    break
+                if command in ("HELO", "EHLO"):
+                    await reply("250 localhost")
+                elif command == "MAIL":
+                    sender, recipients = line.partition(":")[2].strip(" <>"), []
+                    await reply("250 OK")
+                elif command == "RCPT":
+                    recipients.append(line.partition(":")[2].strip(" <>"))
+                    await reply("250 OK")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    lines = []
+                    while True:
+                        data = (await reader.readline()).decode("utf-8", "replace").rstrip("\r\n")
+                        if data == ".":
+                            break
+                        lines.append(data[1:] if data.startswith("..") else data)
+                    self.received.append({"from": sender, "to": recipients, "message": "\n".join(lines)})
+                    await reply("250 OK: queued")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("250 OK")
+        finally:
+            writer.close()
+
+
+# Payload formatting: each takes a batch of alert messages and returns the payloads to send
+def _line(message: Dict) -> str:
+    state = "RESOLVED" if message["kind"] == "resolved" else message["severity"].upper()
+    value = f" ({message['value']})" if message.get("value") else ""
+    return f"[{state}] {message['title']}{value}"
+
+
+def _digest_text(messages: List[Dict]) -> str:
+    if len(messages) == 1:
+        return f"{_line(messages[0])}\n{messages[0]['description']}"
+    return f"{len(messages)} alert updates:\n" + "\n".join(f"• {_line(message)}" for message in messages)
+
+
+def slack_payloads(messages: List[Dict]) -> List[Dict]:
+    return [{"text": _digest_text(messages)}]
+
+
+def teams_payloads(messages: List[Dict]) -> List[Dict]:
+    return [{"title": "AI/ML Observability Alerts", "text": _digest_text(messages).replace("\n", "<br/>")}]
+
+
+def email_payloads(messages: List[Dict]) -> List[Tuple[str, str]]:
+    if len(messages) == 1:
+        subject = _line(messages[0])
+    else:
+        subject = f"[ALERT DIGEST] {len(messages)} alert updates"
+    return [(subject, _digest_text(messages))]
+
+
+def pagerduty_payloads(routing_key: str) -> Callable[[List[Dict]], List[Dict]]:
+    """PagerDuty Events API v2: one trigger/resolve event per alert, deduplicated by rule and group"""
+    severities = {"critical": "critical", "warning": "warning", "info": "info"}
+
+    def payloads(messages: List[Dict]) -> List[Dict]:
+        return [
+            {
+                "routing_key": routing_key,
+                "event_action": "resolve" if message["kind"] == "resolved" else "trigger",
+                "dedup_key": f"{message['rule']}:{message['group']}",
+                "payload": {
+                    "summary": _line(message),
+                    "severity": severities.get(message["severity"], "error"),
+                    "source": "aiml-observability",
+                    "timestamp": message["time"],
+                },
+            }
+            for message in messages
+        ]
+    return payloads
+
+
+class ChannelConfig(NamedTuple):
+    """Transport, formatting and delivery policy of one notification channel"""
+    transport: object  # anything with async send(payload)
+    formatter: Callable[[List[Dict]], List[object]]
+    rate_per_minute: float = 30.0
+    burst: int = 5
+    batch_seconds: float = 2.0  # alerts arriving within this window go out as one digest
+    max_batch: int = 50
+    max_attempts: int = 4
+    backoff_seconds: float = 0.5  # doubled per retry, with jitter
+
+
+class _TokenBucket:
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class NotificationDispatcher:
+    """Owns an asyncio event loop on a daemon thread; submit() only schedules work on it and returns at once"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="notification-dispatcher", daemon=True)
+        self.thread.start()
+        self.channels: Dict[str, ChannelConfig] = {}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self.deliveries: deque = deque(maxlen=MAX_DELIVERY_LOG)
+        # Local stand-ins, when the channels use them
+        self.http_sink: Optional[HTTPSink] = None
+        self.smtp_sink: Optional[SMTPDebugServer] = None
+
+    def run(self, coroutine, timeout: Optional[float] = None):
+        """Run a coroutine on the dispatcher loop and wait for its result (setup only, never per alert)"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def add_channel(self, name: str, config: ChannelConfig):
+        async def start():
+            self._queues[name] = asyncio.Queue(MAX_QUEUED)
+            self.loop.create_task(self._worker(name, config, self._queues[name]))
+        self.channels[name] = config
+        self.stats[name] = {"queued": 0, "alerts_sent": 0, "deliveries": 0, "failed": 0, "retries": 0, "dropped": 0}
+        self.run(start())
+
+    def uses_local_sink(self, channel: str) -> bool:
+        """Whether a channel delivers to one of the local stand-ins instead of a real service"""
+        url = getattr(self.channels[channel].transport, "url", "")
+        sink_ports = [sink.port for sink in (self.http_sink, self.smtp_sink) if sink is not None]
+        return any(url.startswith(("http://127.0.0.1:", "smtp://127.0.0.1:")) and f":{port}" in url for port in sink_ports)
+
+    def submit(self, kind: str, alert: Dict):
+        """Queue an alert transition ("fired" or "resolved") on each of its channels"""
+        message = {
+            "kind": kind,
+            "rule": alert["rule"],
+            "group": alert["group"],
+            "severity": alert["severity"],
+            "title": alert["title"],
+            "description": alert["description"],
+            "value": alert.get("value"),
+            "time": datetime.now().isoformat(timespec="seconds"),
+        }
+        for channel in alert["channels"]:
+            if channel in self.channels:
+                self.loop.call_soon_threadsafe(self._enqueue, channel, message)
+
+    def _enqueue(self, channel: str, message: Dict):
+        try:
+            self._queues[channel].put_nowait(message)
+            self.stats[channel]["queued"] += 1
+        except asyncio.QueueFull:
+            self.stats[channel]["dropped"] += 1
+
+    async def _worker(self, name: str, config: ChannelConfig, queue: asyncio.Queue):
+        bucket = _TokenBucket(config.rate_per_minute / 60, config.burst)
+        while True:
+            batch = [await queue.get()]
+            deadline = self.loop.time() + config.batch_seconds
+            while len(batch) < config.max_batch:
+                remaining = deadline - self.loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            self.stats[name]["queued"] -= len(batch)
+            try:
+                payloads = config.formatter(batch)
+                for payload in payloads:
+                    await bucket.acquire()
+                    await self._deliver(name, config, payload, len(batch) if len(payloads) == 1 else 1)
+            except Exception as e:
+                # A formatter or bookkeeping bug must not end the channel task: record it and go on
+                self.stats[name]["failed"] += 1
+                self.deliveries.append({
+                    "time": datetime.now(),
+                    "channel": name,
+                    "alerts": len(batch),
+                    "status": "failed",
+                    "attempts": 0,
+                    "error": f"{type(e).__name__}: {e}",
+                })
+
+    async def _deliver(self, name: str, config: ChannelConfig, payload, alerts: int):
+        stats = self.stats[name]
+        for attempt in range(1, config.max_attempts + 1):
+            try:
+                await asyncio.wait_for(config.transport.send(payload), SEND_TIMEOUT)
+                error = None
+                break
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                if attempt < config.max_attempts:
+                    stats["retries"] += 1
+                    await asyncio.sleep(config.backoff_seconds * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+        stats["deliveries" if error is None else "failed"] += 1
+        if error is None:
+            stats["alerts_sent"] += alerts
+        self.deliveries.append({
+            "time": datetime.now(),
+            "channel": name,
+            "alerts": alerts,
+            "status": "sent" if error is None else "failed",
+            "attempts": attempt,
+            "error": error,
+        })
+
+
+@st.cache_resource(show_spinner=False)
+def notification_dispatcher() -> NotificationDispatcher:
+    """One dispatcher per server process, with channels configured from the environment
+
+    Webhook channels without a URL post to a local HTTP sink, and email without SMTP_HOST
+    goes to a local SMTP debugging server, so alerts flow end to end in development.
+    """
+    dispatcher = NotificationDispatcher()
+    if not all(os.getenv(name) for name in ("PAGERDUTY_EVENTS_URL", "SLACK_WEBHOOK_URL", "TEAMS_WEBHOOK_URL")):
+        dispatcher.http_sink = HTTPSink()
+        dispatcher.run(dispatcher.http_sink.start())
+    if not os.getenv("SMTP_HOST"):
+        dispatcher.smtp_sink = SMTPDebugServer()
+        dispatcher.run(dispatcher.smtp_sink.start())
+
+    def webhook(env_name: str, path: str) -> WebhookTransport:
+        return WebhookTransport(os.getenv(env_name) or dispatcher.http_sink.url(path))
+
+    dispatcher.add_channel("pagerduty", ChannelConfig(
+        webhook("PAGERDUTY_EVENTS_URL", "/pagerduty"),
+        pagerduty_payloads(os.getenv("PAGERDUTY_ROUTING_KEY", "local-routing-key")),
+        rate_per_minute=60,
+        burst=10,
+        batch_seconds=0,
+    ))
+    dispatcher.add_channel("slack", ChannelConfig(webhook("SLACK_WEBHOOK_URL", "/slack"), slack_payloads))
+    dispatcher.add_channel("teams", ChannelConfig(webhook("TEAMS_WEBHOOK_URL", "/teams"), teams_payloads))
+    dispatcher.add_channel("email", ChannelConfig(
+        SMTPTransport(
+            os.getenv("SMTP_HOST", "127.0.0.1"),
+            int(os.getenv("SMTP_PORT", "25")) if os.getenv("SMTP_HOST") else dispatcher.smtp_sink.port,
+            os.getenv("ALERT_EMAIL_FROM", "alerts@aiml-observability.local"),
+            os.getenv("ALERT_EMAIL_TO", "finops@aiml-observability.local").split(","),
+        ),
+        email_payloads,
+        rate_per_minute=6,
+        burst=2,
+        batch_seconds=30,
+    ))
+    return dispatcher
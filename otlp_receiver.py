@@ -0,0 +1,373 @@
+"""
+OTLP Receiver
+OTLP/HTTP JSON span ingestion with W3C traceparent propagation, batched into the trace store
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from trace_store import SPAN_SCHEMA, TraceStore
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson decodes bytes without building an intermediate str; json is the fallback
+    _loads = json.loads
+
+DEFAULT_HOST = os.getenv('OTLP_HTTP_HOST', '127.0.0.1')
+DEFAULT_PORT = int(os.getenv('OTLP_HTTP_PORT', '4318'))  # the OTLP/HTTP default
+TRACES_PATH = "/v1/traces"
+BATCH_SPANS = 8192  # pending spans that trigger a write to the trace store
+FLUSH_SECONDS = 0.25  # longest time a span waits in the batch
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+# W3C Trace Context: version-trace_id-parent_id-flags, lowercase hex
+_TRACEPARENT = re.compile(r"([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?")
+
+# Code points (below 128) that are hex digits, for vectorized id validation
+_HEX_POINTS = np.zeros(128, dtype=bool)
+_HEX_POINTS[[ord(c) for c in "0123456789abcdefABCDEF"]] = True
+_ERROR_STATUSES = (2, "STATUS_CODE_ERROR")
+
+
+class TraceContext(NamedTuple):
+    trace_id: str
+    parent_id: str
+    flags: int
+
+    @property
+    def sampled(self) -> bool:
+        return bool(self.flags & 1)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[TraceContext]:
+    """Parse a traceparent header value; None when it is missing or invalid per W3C Trace Context"""
+    match = _TRACEPARENT.fullmatch((header or "").strip())
+    if match is None:
+        return None
+    version, trace_id, parent_id, flags, rest = match.groups()
+    # Version ff is forbidden; version 00 has exactly four fields; all-zero ids are invalid
+    if version == "ff" or (version == "00" and rest) or not int(trace_id, 16) or not int(parent_id, 16):
+        return None
+    return TraceContext(trace_id, parent_id, int(flags, 16))
+
+
+def format_traceparent(trace_id: str, span_id: str, sampled: bool = True) -> str:
+    return f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
+
+
+def _parse_hex_ids(values: List[str], width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Lowercase fixed-width bytes ids and a mask of valid ones (width hex digits, not all zero)
+
+    Empty strings come back as b"" and are not valid. Works on the code points of a
+    fixed-width Unicode array, so there is no per-id Python work beyond building the array.
+    """
+    text = np.array(values, dtype=f"U{width + 1}")  # one spare character catches over-long ids
+    points = text.view(np.uint32).reshape(len(text), width + 1)
+    digits = points[:, :width]
+    valid = (points[:, width] == 0) & _HEX_POINTS[np.minimum(digits, 127)].all(axis=1) & (digits != ord("0")).any(axis=1)
+    lower = np.where((digits >= ord("A")) & (digits <= ord("F")), digits + 32, digits)
+    return np.ascontiguousarray(lower.astype(np.uint8)).view(f"S{width}").ravel(), valid
+
+
+_SPAN_FIELDS = (("traceId", ""), ("spanId", ""), ("parentSpanId", ""), ("name", "unnamed"),
+                ("startTimeUnixNano", 0), ("endTimeUnixNano", 0))
+
+
+def _span_values(span) -> Optional[Tuple]:
+    """(trace id, span id, parent id, name, start ns, end ns, status code) of one span; None when a field has the wrong type"""
+    if not isinstance(span, dict):
+        return None
+    values = [span.get(field) or default for field, default in _SPAN_FIELDS]
+    status = span.get("status") or {}
+    if not all(isinstance(value, str) for value in values[:4]) or not isinstance(status, dict):
+        return None
+    try:
+        values[4:] = np.array(values[4:], dtype=np.int64).tolist()
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return (*values, status.get("code"))
+
+
+def _span_rows(request: Dict) -> Tuple[List[Tuple], int]:
+    """One (fields..., service) tuple per well-typed span of a request, and the count of the others"""
+    rows = []
+    malformed = 0
+    for service, spans in _service_spans(request):
+        for span in spans:
+            values = _span_values(span)
+            if values is None:
+                malformed += 1
+            else:
+                rows.append((*values, service))
+    return rows, malformed
+
+
+def _service_spans(request: Dict) -> List[Tuple[str, List]]:
+    """(service.name, spans) of each scope in a request"""
+    scopes = []
+    for resource_spans in request.get("resourceSpans") or ():
+        service = "unknown_service"
+        for attribute in (resource_spans.get("resource") or {}).get("attributes") or ():
+            if attribute.get("key") == "service.name":
+                service = str((attribute.get("value") or {}).get("stringValue", service))
+        for scope_spans in resource_spans.get("scopeSpans") or ():
+            scopes.append((service, scope_spans.get("spans") or ()))
+    return scopes
+
+
+def decode_otlp_json(body: bytes, context: Optional[TraceContext] = None) -> Tuple[Dict[str, np.ndarray], int]:
+    """Span columns (trace_store.SPAN_SCHEMA) from an OTLP ExportTraceServiceRequest in JSON, and the rejected count
+
+    With a propagated context, spans without a traceId join the context's trace, and root spans
+    of that trace become children of the context's parent span. Spans with malformed ids or
+    fields of the wrong type are rejected rather than failing the whole request.
+    """
+    request = _loads(body)
+    trace_ids, span_ids, parents, names, services, starts, ends, statuses = [], [], [], [], [], [], [], []
+    malformed = 0
+    try:
+        # Column at a time while every span is well formed...
+        for service, spans in _service_spans(request):
+            trace_ids += [span.get("traceId") or "" for span in spans]
+            span_ids += [span.get("spanId") or "" for span in spans]
+            parents += [span.get("parentSpanId") or "" for span in spans]
+            names += [span.get("name") or "unnamed" for span in spans]
+            services += [service] * len(spans)
+            starts += [span.get("startTimeUnixNano") or 0 for span in spans]
+            ends += [span.get("endTimeUnixNano") or 0 for span in spans]
+            statuses += [(span.get("status") or {}).get("code") for span in spans]
+        if not all(type(value) is str for column in (trace_ids, span_ids, parents, names) for value in column):
+            raise TypeError("non-string span field")
+        # Nanosecond timestamps arrive as decimal strings (or ints); the store keeps microseconds
+        start_us = np.array(starts, dtype=np.int64) // 1000
+        end_us = np.array(ends, dtype=np.int64) // 1000
+    except (TypeError, ValueError, AttributeError, OverflowError):
+        # ...otherwise span by span, rejecting the malformed ones
+        rows, malformed = _span_rows(request)
+        columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in range(8)]
+        trace_ids, span_ids, parents, names, starts, ends, statuses, services = columns
+        start_us = np.array(starts, dtype=np.int64) // 1000
+        end_us = np.array(ends, dtype=np.int64) // 1000
+
+    if context is not None:
+        for i, (trace_id, parent) in enumerate(zip(trace_ids, parents)):
+            if not trace_id:
+                trace_ids[i] = trace_id = context.trace_id
+            if not parent and trace_id.lower() == context.trace_id:
+                parents[i] = context.parent_id
+
+    trace_id, valid_trace = _parse_hex_ids(trace_ids, 32)
+    span_id, valid_span = _parse_hex_ids(span_ids, 16)
+    parent_span_id, valid_parent = _parse_hex_ids(parents, 16)
+    valid = valid_trace & valid_span & (valid_parent | (parent_span_id == b""))
+    columns = {
+        "trace_id": trace_id,
+        "span_id": span_id,
+        "parent_span_id": parent_span_id,
+        "name": np.array(names, dtype=object),
+        "service": np.array(services, dtype=object),
+        "start_us": start_us,
+        "end_us": end_us,
+        "status": np.array(["error" if code in _ERROR_STATUSES else "success" for code in statuses], dtype=object),
+    }
+    if not valid.all():
+        columns = {name: values[valid] for name, values in columns.items()}
+    return columns, malformed + int(len(valid) - valid.sum())
+
+
+class SpanBatcher:
+    """Collects decoded span columns and writes them to the trace store in large batches"""
+
+    def __init__(self, store: TraceStore, batch_spans: int = BATCH_SPANS):
+        self.store = store
+        self.batch_spans = batch_spans
+        self._pending: List[Dict[str, np.ndarray]] = []
+        self.pending_spans = 0
+        self.batches_written = 0
+        self.spans_written = 0
+        self.spans_dropped = 0
+
+    def add(self, columns: Dict[str, np.ndarray]):
+        if len(columns["span_id"]):
+            self._pending.append(columns)
+            self.pending_spans += len(columns["span_id"])
+        if self.pending_spans >= self.batch_spans:
+            self.flush()
+
+    def flush(self):
+        """Write the pending spans; if the store rejects the batch it is counted as dropped and the error raised"""
+        if not self._pending:
+            return
+        pending, spans = self._pending, self.pending_spans
+        self._pending, self.pending_spans = [], 0
+        try:
+            self.store.extend({name: np.concatenate([columns[name] for columns in pending]) for name, _ in SPAN_SCHEMA})
+        except Exception:
+            self.spans_dropped += spans
+            raise
+        self.spans_written += spans
+        self.batches_written += 1
+
+
+class OTLPReceiver:
+    """HTTP/1.1 server for POST /v1/traces on an asyncio loop on a daemon thread
+
+    Accepts OTLP/JSON bodies (optionally gzip-encoded) over keep-alive connections and an
+    optional traceparent header. Responses follow OTLP/HTTP: 200 with a partialSuccess
+    object, 400 for undecodable bodies, 415 for protobuf.
+    """
+
+    def __init__(self, store: TraceStore, batch_spans: int = BATCH_SPANS, flush_seconds: float = FLUSH_SECONDS):
+        self.store = store
+        self.batcher = SpanBatcher(store, batch_spans)
+        self.flush_seconds = flush_seconds
+        self.host: Optional[str] = None
+        self.port: Optional[int] = None
+        self.error: Optional[str] = None
+        self.started_at = time.time()
+        self._stats = {"requests": 0, "spans_rejected": 0, "bad_requests": 0, "bytes": 0, "last_error": None}
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="otlp-receiver", daemon=True)
+        self.thread.start()
+
+    def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> bool:
+        """Bind and start serving; returns False (with error set) if the port cannot be bound"""
+        async def serve():
+            server = await asyncio.start_server(self._handle, host, port)
+            self.loop.create_task(self._flusher())
+            return server.sockets[0].getsockname()[1]
+        try:
+            self.port = asyncio.run_coroutine_threadsafe(serve(), self.loop).result()
+            self.host = host
+            return True
+        except OSError as e:
+            self.error = str(e)
+            return False
+
+    @property
+    def stats(self) -> Dict:
+        """Request counters; spans count as accepted once they are written to the trace store"""
+        batcher = self.batcher
+        return dict(self._stats, spans_accepted=batcher.spans_written, spans_pending=batcher.pending_spans,
+                    spans_dropped=batcher.spans_dropped)
+
+    @property
+    def endpoint(self) -> Optional[str]:
+        return f"http://{self.host}:{self.port}{TRACES_PATH}" if self.port else None
+
+    async def _flusher(self):
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            try:
+                self.batcher.flush()
+            except Exception as e:  # keep flushing later batches; the failed one is counted as dropped
+                self._stats["last_error"] = f"{type(e).__name__}: {e}"
+
+    def _ingest(self, body: bytes, headers: Dict[str, str]) -> Tuple[int, Dict]:
+        """(status code, response object) for one export request"""
+        content_type = headers.get("content-type", "application/json").split(";")[0].strip()
+        if content_type != "application/json":
+            return 415, {"code": 3, "message": "only OTLP/JSON (application/json) is supported"}
+        try:
+            if headers.get("content-encoding") == "gzip":
+                body = gzip.decompress(body)
+            columns, rejected = decode_otlp_json(body, parse_traceparent(headers.get("traceparent")))
+        except (ValueError, TypeError, AttributeError, OSError) as e:
+            self._stats["bad_requests"] += 1
+            return 400, {"code": 3, "message": f"invalid OTLP/JSON body: {e}"}
+        self._stats["spans_rejected"] += rejected
+        try:
+            self.batcher.add(columns)
+        except Exception as e:
+            self._stats["last_error"] = f"{type(e).__name__}: {e}"
+            return 503, {"code": 14, "message": f"could not store spans: {e}"}
+        partial = {"rejectedSpans": str(rejected), "errorMessage": "malformed spans (ids or field types)"} if rejected else {}
+        return 200, {"partialSuccess": partial}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                parts = request_line.split()
+                method, path = (parts[0].decode(), parts[1].decode()) if len(parts) > 1 else ("", "")
+                length = int(headers.get("content-length", "0") or 0)
+                if length > MAX_BODY_BYTES:
+                    status, response = 413, {"code": 8, "message": "request body too large"}
+                    await self._respond(writer, status, response, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                self._stats["requests"] += 1
+                self._stats["bytes"] += length
+                if path.split("?")[0] != TRACES_PATH:
+                    status, response = 404, {"code": 5, "message": f"unknown path {path}"}
+                elif method != "POST":
+                    status, response = 405, {"code": 12, "message": "use POST"}
+                elif "chunked" in headers.get("transfer-encoding", ""):
+                    status, response = 411, {"code": 3, "message": "Content-Length is required"}
+                else:
+                    status, response = self._ingest(body, headers)
+                close = headers.get("connection", "").lower() == "close" or status == 411
+                await self._respond(writer, status, response, close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, response: Dict, close: bool = False):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                   411: "Length Required", 413: "Payload Too Large", 415: "Unsupported Media Type",
+                   503: "Service Unavailable"}
+        body = json.dumps(response).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {reasons[status]}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: {'close' if close else 'keep-alive'}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+
+
+@st.cache_resource(show_spinner=False)
+def otlp_receiver() -> OTLPReceiver:
+    """One receiver and trace store per server process, listening on OTLP_HTTP_HOST:OTLP_HTTP_PORT
+
+    Set OTLP_RECEIVER_ENABLED=0 to keep the store but not open the port.
+    """
+    receiver = OTLPReceiver(TraceStore())
+    if os.getenv('OTLP_RECEIVER_ENABLED', '1') != '0':
+        receiver.start()
+    return receiver
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Standalone OTLP/HTTP JSON trace receiver")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    standalone = OTLPReceiver(TraceStore())
+    if not standalone.start(args.host, args.port):
+        raise SystemExit(f"Cannot listen on {args.host}:{args.port}: {standalone.error}")
+    print(f"Receiving OTLP/JSON spans on {standalone.endpoint}")
+    while True:
+        time.sleep(10)
+        print(f"{standalone.stats} spans held: {len(standalone.store):,}")
@@ -0,0 +1,285 @@
+"""
+Shared Log Store
+A LogStore whose columns live in one POSIX shared memory block, written by a single
+ingest process and read zero-copy by any number of dashboard server processes
+"""
+
+import os
+import threading
+import time
+from functools import wraps
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Optional
+
+import numpy as np
+
+from log_store import DEFAULT_MAX_BYTES, LogStore
+
+# Name of the shared block dashboards attach to; unset keeps a private store per process
+SHARED_NAME = os.getenv('LOG_STORE_SHARED_NAME', '')
+
+MAGIC = 0x41494D4C4F42534C  # "AIMLOBSL"
+LAYOUT_VERSION = 1
+MAX_STRINGS = 65_536  # distinct categorical values across all categories
+STRING_BYTES = 4 * 1024 * 1024
+READER_SLACK = 1 / 16  # share of each ring readers leave unread as room for concurrent writes
+READ_RETRIES = 5
+ALIGNMENT = 64
+
+# Header words (int64); _WRITTEN and _RESERVED start one word per source category
+_MAGIC, _VERSION, _GENERATION, _MAX_BYTES, _NEXT_SEQ, _STRINGS, _STRING_BYTES, _CLEARS = range(8)
+_WRITTEN, _RESERVED = 16, 40
+HEADER_WORDS = 64
+
+
+class _Arena:
+    """Hands out consecutive aligned arrays from one buffer; without a buffer it only measures"""
+
+    def __init__(self, buffer=None, initialize: bool = False):
+        self.buffer = buffer
+        self.initialize = initialize
+        self.nbytes = 0
+
+    def allocate(self, shape, dtype, fill=0) -> np.ndarray:
+        dtype = np.dtype(dtype)
+        offset = -(-self.nbytes // ALIGNMENT) * ALIGNMENT
+        self.nbytes = offset + int(np.prod(shape)) * dtype.itemsize
+        if self.buffer is None:
+            return np.broadcast_to(np.zeros((), dtype=dtype), shape)
+        array = np.ndarray(shape, dtype=dtype, buffer=self.buffer, offset=offset)
+        if self.initialize:
+            array.fill(fill)
+        return array
+
+
+class TornReadError(RuntimeError):
+    """A snapshot read was overtaken by the writer on every retry, so its rows may be torn"""
+
+
+def _snapshot_read(method):
+    """Run a LogStore read against a fresh snapshot, retrying (a few times) if the writer overtook the rows read"""
+    @wraps(method)
+    def read(self, *args, **kwargs):
+        with self._lock:
+            for _ in range(READ_RETRIES):
+                snapshot = self._refresh()
+                result = method(self, *args, **kwargs)
+                if self._still_valid(snapshot):
+                    return result
+            self.torn_reads += 1
+        raise TornReadError(
+            f"{method.__name__}() on shared log store '{self.name}' was overtaken by the writer "
+            f"{READ_RETRIES} times; its ring is too small for the ingest rate"
+        )
+    return read
+
+
+class SharedLogStore(LogStore):
+    """Log store in a shared memory block: one process creates and writes it, others attach read-only
+
+    The block holds a header, the string table and every category's columns, sequence numbers
+    and hash indexes; there are no bitmap indexes, so field=value filters on low-cardinality
+    fields scan. The writer publishes each batch by bumping a generation counter around the
+    header update (odd while it is being written). Readers copy the header when the generation
+    is even and unchanged, and read only the rows that snapshot covers minus a slack at the
+    oldest end of each ring. Before overwriting slots the writer records how far it is about to
+    write; a read is retried when that mark ran more than the slack past its snapshot.
+    """
+
+    def __init__(self, name: str, create: bool, max_bytes: int = DEFAULT_MAX_BYTES):
+        if create:
+            measure = _Arena()
+            measure.allocate(HEADER_WORDS, np.int64)
+            self._layout(measure, max_bytes)
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=measure.nbytes)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            # Python < 3.13 tracks attached blocks too and would unlink the writer's block when this process exits
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        self.name = name
+        self.read_only = not create
+        arena = _Arena(self._shm.buf, initialize=create)
+        self._header = arena.allocate(HEADER_WORDS, np.int64)
+        if create:
+            self._header[[_VERSION, _MAX_BYTES]] = LAYOUT_VERSION, max_bytes
+        elif self._header[_MAGIC] != MAGIC or self._header[_VERSION] != LAYOUT_VERSION:
+            magic, self._header = int(self._header[_MAGIC]), None
+            self._shm.close()
+            if not magic:
+                raise FileNotFoundError(f"Shared log store '{name}' is still being initialized")
+            raise ValueError(f"Shared memory block '{name}' is not a log store of layout version {LAYOUT_VERSION}")
+        self._layout(arena, int(self._header[_MAX_BYTES]))
+        self._generation = -1
+        self.torn_reads = 0  # reads abandoned after READ_RETRIES
+        self._published_strings = 0
+        self._positions = {category: position for position, category in enumerate(self.buffers)}
+        # Reentrant so snapshot reads can wrap the LogStore methods that take the lock themselves
+        self._lock = threading.RLock()
+        if self.read_only:
+            for buffer in self.buffers.values():
+                buffer.visible = max(1, buffer.capacity - int(buffer.capacity * READER_SLACK))
+        else:
+            # Set last: readers treat a block without it as not ready yet
+            self._header[_MAGIC] = MAGIC
+
+    def _layout(self, arena: _Arena, max_bytes: int):
+        """Place the string table and the LogStore columns in the arena"""
+        self._string_offsets = arena.allocate(MAX_STRINGS + 1, np.int64)
+        self._string_bytes = arena.allocate(STRING_BYTES, np.uint8)
+        super().__init__(max_bytes, allocate=arena.allocate, bitmap_fields=())
+
+    @classmethod
+    def create(cls, name: str, max_bytes: int = DEFAULT_MAX_BYTES) -> "SharedLogStore":
+        """Create the block as its only writer"""
+        return cls(name, create=True, max_bytes=max_bytes)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedLogStore":
+        """Attach read-only to a block another process writes"""
+        return cls(name, create=False)
+
+    @property
+    def generation(self) -> int:
+        """Number of batches published so far; unchanged means nothing new to read"""
+        return int(self._header[_GENERATION]) // 2
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    # Writer
+
+    def _publish(self):
+        """Make the rows and strings written since the last publish visible to readers"""
+        self._header[_GENERATION] += 1
+        self._write_header()
+        self._header[_GENERATION] += 1
+
+    def _write_header(self):
+        values = self.strings.values()[self._published_strings:]
+        if values:
+            count = self._published_strings
+            encoded = [value.encode() for value in values]
+            ends = int(self._string_offsets[count]) + np.cumsum([len(value) for value in encoded])
+            if count + len(encoded) > MAX_STRINGS or ends[-1] > STRING_BYTES:
+                raise RuntimeError(f"Shared string table of '{self.name}' is full")
+            self._string_bytes[int(self._string_offsets[count]):int(ends[-1])] = np.frombuffer(b"".join(encoded), np.uint8)
+            self._string_offsets[count + 1:count + 1 + len(encoded)] = ends
+            self._published_strings += len(encoded)
+        header = self._header
+        header[_NEXT_SEQ] = self.next_seq
+        header[_STRINGS] = self._published_strings
+        header[_STRING_BYTES] = self._string_offsets[self._published_strings]
+        header[_WRITTEN:_WRITTEN + len(self.buffers)] = [buffer.written for buffer in self.buffers.values()]
+
+    def _check_writable(self):
+        if self.read_only:
+            raise PermissionError(f"Log store '{self.name}' is attached read-only; events are written by its ingest process")
+
+    def _reserve(self, category: str, n: int):
+        """Announce the rows about to be written, before their slots change"""
+        self._header[_RESERVED + self._positions[category]] = self.buffers[category].written + n
+
+    def append(self, log: Dict):
+        self._check_writable()
+        with self._lock:
+            self._reserve(log["source_category"], 1)
+            super().append(log)
+            self._publish()
+
+    def extend(self, source_category: str, columns: Dict[str, np.ndarray]):
+        self._check_writable()
+        with self._lock:
+            self._reserve(source_category, len(columns["timestamp"]))
+            super().extend(source_category, columns)
+            self._publish()
+
+    def clear(self):
+        self._check_writable()
+        with self._lock:
+            # Odd for the whole clear, so no reader snapshots a half-cleared store
+            self._header[_GENERATION] += 1
+            self._header[_CLEARS] += 1
+            super().clear()
+            self._header[_RESERVED:_RESERVED + len(self.buffers)] = 0
+            self._write_header()
+            self._header[_GENERATION] += 1
+
+    def resume_after(self, seq: int):
+        self._check_writable()
+        with self._lock:
+            super().resume_after(seq)
+            self._publish()
+
+    def unlink(self):
+        """Remove the block's name once the writer is done (attached readers keep their mapping)"""
+        self._shm.unlink()
+
+    # Readers
+
+    def _header_snapshot(self) -> np.ndarray:
+        while True:
+            generation = self._header[_GENERATION]
+            if generation % 2 == 0:
+                header = self._header.copy()
+                if header[_GENERATION] == generation == self._header[_GENERATION]:
+                    return header
+            time.sleep(0)
+
+    def _refresh(self) -> Optional[np.ndarray]:
+        """Bring row counts, sequence numbers and strings up to the newest published batch"""
+        if not self.read_only:
+            return None
+        header = self._header_snapshot()
+        if header[_GENERATION] != self._generation:
+            offsets = self._string_offsets
+            for code in range(len(self.strings), int(header[_STRINGS])):
+                self.strings.intern(self._string_bytes[offsets[code]:offsets[code + 1]].tobytes().decode())
+            for buffer, written in zip(self.buffers.values(), header[_WRITTEN:_RESERVED].tolist()):
+                buffer.written = written
+            self.next_seq = int(header[_NEXT_SEQ])
+            self._generation = int(header[_GENERATION])
+        return header
+
+    def _still_valid(self, snapshot: Optional[np.ndarray]) -> bool:
+        """Whether the rows of a snapshot read could not have been overwritten during the read"""
+        if snapshot is None:
+            return True
+        header = self._header.copy()
+        if header[_CLEARS] != snapshot[_CLEARS]:
+            return False
+        count = len(self.buffers)
+        ahead = header[_RESERVED:_RESERVED + count] - snapshot[_WRITTEN:_WRITTEN + count]
+        return all(int(rows) <= buffer.capacity - buffer.visible
+                   for rows, buffer in zip(ahead.tolist(), self.buffers.values()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return super().__len__()
+
+    @property
+    def total_appended(self) -> int:
+        return int(self._header[_NEXT_SEQ])
+
+    lookup = _snapshot_read(LogStore.lookup)
+    search = _snapshot_read(LogStore.search)
+    facet_counts = _snapshot_read(LogStore.facet_counts)
+    tail = _snapshot_read(LogStore.tail)
+    frame = _snapshot_read(LogStore.frame)
+    oldest_seq = _snapshot_read(LogStore.oldest_seq)
+    rows_through = _snapshot_read(LogStore.rows_through)
+    time_counts = _snapshot_read(LogStore.time_counts)
+
+
+def open_log_store() -> LogStore:
+    """The log store of a server process: private, or attached to the block named by LOG_STORE_SHARED_NAME"""
+    if not SHARED_NAME:
+        return LogStore()
+    try:
+        return SharedLogStore.attach(SHARED_NAME)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"No shared log store '{SHARED_NAME}'; start the ingest process first: "
+            f"python ingestion_worker.py --shared {SHARED_NAME}"
+        ) from None
@@ -0,0 +1,98 @@
+"""
+Shared State
+Process-wide event stores and the engines derived from them, shared by every browser session
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+import streamlit as st
+
+from alert_engine import AlertEngine
+from anomaly_detector import LatencyAnomalyDetector
+from drift_engine import DriftEngine
+from forecasting import ForecastCache
+from ingestion_worker import ingestion_worker
+from log_store import LogStore
+from otlp_receiver import otlp_receiver
+from tier_manager import TierManager
+from trace_store import TraceStore
+
+COST_CATEGORY = "AI/ML Applications"
+COST_WINDOW_MINUTES = 24 * 60
+# Set to 0 to keep events in memory only (the tiers are then neither filled nor rolled)
+TIER_MANAGER_ENABLED = os.getenv('TIER_MANAGER_ENABLED', '1') != '0'
+
+
+class SharedState:
+    """The log and trace stores plus the engines that consume them, one instance per server process
+
+    Stores lock internally. The engines keep incremental state (last sequence numbers, windows,
+    open alerts), so updating and reading them happens under `lock`; every session then sees
+    the same anomalies, drift reports and alerts, and each alert transition is raised once.
+    `lock` only orders the sessions: the ingestion worker appends without it, so every
+    incremental read is bounded by the total_appended taken before it (frame's until=).
+    """
+
+    def __init__(self, log_store: LogStore, trace_store: TraceStore):
+        self.log_store = log_store
+        self.trace_store = trace_store
+        self.anomaly_detector = LatencyAnomalyDetector()
+        self.drift_engine = DriftEngine()
+        self.forecast_cache = ForecastCache()
+        self.alert_engine = AlertEngine()
+        self.tiers = TierManager(log_store)
+        if TIER_MANAGER_ENABLED:
+            self.tiers.start()
+        self.lock = threading.RLock()
+        # Per-minute inference cost over the last day, fed incrementally like the engines
+        self._cost_minutes = np.zeros(COST_WINDOW_MINUTES)
+        self._cost_head = None
+        self._cost_seq = -1
+
+    def observe(self):
+        """Fold events appended since the last call into the anomaly detector and drift engine"""
+        with self.lock:
+            self.anomaly_detector.observe(self.log_store)
+            self.drift_engine.observe(self.log_store)
+
+    def tick_alerts(self) -> List[Tuple[str, Dict]]:
+        """Evaluate the alert rules once; returns the ("fired" | "resolved", alert) transitions"""
+        with self.lock:
+            return self.alert_engine.tick(self.log_store)
+
+    def _update_cost(self, now_minute: int):
+        upto = self.log_store.total_appended - 1
+        events = self.log_store.frame(COST_CATEGORY, columns=["timestamp", "cost_usd"], since=self._cost_seq, until=upto)
+        self._cost_seq = upto
+        if self._cost_head is None:
+            self._cost_head = now_minute
+        steps = now_minute - self._cost_head
+        if steps > 0:
+            cleared = (self._cost_head + 1 + np.arange(min(steps, COST_WINDOW_MINUTES))) % COST_WINDOW_MINUTES
+            self._cost_minutes[cleared] = 0
+            self._cost_head = now_minute
+        if len(events):
+            minutes = events["timestamp"].to_numpy().astype("datetime64[m]").astype(np.int64)
+            recent = (minutes > now_minute - COST_WINDOW_MINUTES) & (minutes <= now_minute)
+            np.add.at(self._cost_minutes, minutes[recent] % COST_WINDOW_MINUTES, events["cost_usd"].to_numpy()[recent])
+
+    def quick_stats(self) -> Dict:
+        """Sidebar counters: events ingested, open alerts and inference cost over the last 24 hours"""
+        now_minute = int(np.datetime64(datetime.now(), "m").astype(np.int64))
+        with self.lock:
+            self._update_cost(now_minute)
+            return {
+                "events": self.log_store.total_appended,
+                "active_alerts": len(self.alert_engine.active()),
+                "cost_24h": float(self._cost_minutes.sum()),
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def shared_state() -> SharedState:
+    """The process-wide state every session reads; session_state keeps only view preferences"""
+    return SharedState(ingestion_worker().store, otlp_receiver().store)
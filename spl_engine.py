@@ -0,0 +1,650 @@
+"""
+SPL Query Engine
+Parses a practical subset of Splunk's Search Processing Language and runs it
+as vectorized pandas operations over the in-memory log store
+
+Supported:
+    index=<name> field=value field!=value field>number ...   (initial search)
+    earliest=-<n>s|m|h|d|w latest=-<n>s|m|h|d|w|now          (time range of the initial search)
+    | where <expr>
+    | eval <field>=<expr>[, <field>=<expr> ...]
+    | stats <agg>(<field>) [as <alias>], ... [by <field>, ...]
+    | sort [<limit>] [-|+]<field>, ...
+    | head [<n>]
+    | table <field>, ...
+    | transaction <field> [maxspan=<n>s|m|h]
+"""
+
+import ast
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from log_index import BITMAP_INDEXED_FIELDS, HASH_INDEXED_FIELDS
+from log_store import SOURCE_SCHEMAS, SPLUNK_INDEXES, LogStore
+
+ALL_FIELDS = None  # marker: a command needs every field of its input
+INDEXED_FIELDS = set(HASH_INDEXED_FIELDS) | set(BITMAP_INDEXED_FIELDS)
+
+
+class SPLError(ValueError):
+    """Raised for queries outside the supported SPL subset"""
+
+
+@dataclass
+class SPLResult:
+    frame: pd.DataFrame
+    scanned: int
+    elapsed: float
+
+
+# Query splitting and tokenizing
+
+_STRING = r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''
+_TOKEN = re.compile(rf'\s*({_STRING}|==|!=|<=|>=|[=<>()+\-*/%,]|[\w.*:]+)')
+_TERM = re.compile(rf'^(\w+)\s*(!=|<=|>=|=|<|>)\s*({_STRING}|\S+)$')
+_AGG = re.compile(r'^(\w+)(?:\((.*)\))?(?:\s+as\s+(\w+))?$', re.IGNORECASE)
+
+
+def _split_unquoted(text: str, separator: str) -> List[str]:
+    """Split on a separator character outside quotes and parentheses"""
+    parts, current, quote, depth = [], [], None, 0
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    if quote:
+        raise SPLError("Unterminated string literal")
+    parts.append("".join(current))
+    return [p.strip() for p in parts]
+
+
+def _split_terms(text: str) -> List[str]:
+    """Split a search segment on whitespace outside quotes"""
+    return re.findall(rf'(?:{_STRING}|[^\s"\']+)+', text)
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _literal(value: str):
+    """Interpret an unquoted search value as a number when it looks like one"""
+    if value[:1] in "\"'":
+        return _unquote(value)
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _field_list(text: str) -> List[str]:
+    return [f for f in re.split(r'[\s,]+', text.strip()) if f]
+
+
+# Expressions (where / eval / count(eval(...)))
+
+def _to_python(expr: str) -> str:
+    """Rewrite SPL expression syntax into Python syntax for ast.parse"""
+    out = []
+    tokens = [t.group(1) for t in _TOKEN.finditer(expr)]
+    for i, token in enumerate(tokens):
+        upper = token.upper()
+        if upper == "IF" and tokens[i + 1:i + 2] == ["("]:
+            out.append("_if")  # if is a Python keyword
+        elif token == "=":
+            out.append("==")
+        elif upper in ("AND", "OR", "NOT"):
+            out.append(upper.lower())
+        elif upper in ("TRUE", "FALSE"):
+            out.append(upper.capitalize())
+        else:
+            out.append(token)
+    return " ".join(out)
+
+
+def _like(values: pd.Series, pattern: str) -> pd.Series:
+    regex = "^" + re.escape(pattern).replace("%", ".*").replace("_", ".") + "$"
+    return values.astype(str).str.match(regex)
+
+
+def _if(cond, a, b) -> pd.Series:
+    return pd.Series(np.where(cond, a, b), index=cond.index if isinstance(cond, pd.Series) else None)
+
+
+_FUNCTIONS = {
+    "_if": _if,
+    "round": lambda x, n=0: np.round(x, int(n)),
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "log": np.log10,
+    "ln": np.log,
+    "exp": np.exp,
+    "len": lambda s: s.astype(str).str.len(),
+    "lower": lambda s: s.astype(str).str.lower(),
+    "upper": lambda s: s.astype(str).str.upper(),
+    "tonumber": lambda s: pd.to_numeric(s, errors="coerce"),
+    "tostring": lambda s: s.astype(str),
+    "isnull": lambda s: s.isna(),
+    "isnotnull": lambda s: s.notna(),
+    "like": _like,
+    "coalesce": lambda *args: pd.concat([pd.Series(a) for a in args], axis=1).bfill(axis=1).iloc[:, 0],
+}
+
+_BINARY = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b,
+    ast.Mod: lambda a, b: a % b,
+}
+
+_COMPARE = {
+    ast.Eq: lambda a, b: a == b,
+    ast.NotEq: lambda a, b: a != b,
+    ast.Lt: lambda a, b: a < b,
+    ast.LtE: lambda a, b: a <= b,
+    ast.Gt: lambda a, b: a > b,
+    ast.GtE: lambda a, b: a >= b,
+}
+
+
+class Expression:
+    """A compiled SPL expression, evaluated column-wise against a DataFrame"""
+
+    def __init__(self, text: str):
+        self.text = text
+        try:
+            self.tree = ast.parse(_to_python(text), mode="eval").body
+        except SyntaxError:
+            raise SPLError(f"Cannot parse expression: {text}")
+        self.fields = {
+            node.id for node in ast.walk(self.tree)
+            if isinstance(node, ast.Name) and node.id not in _FUNCTIONS
+        }
+
+    def evaluate(self, df: pd.DataFrame):
+        return self._eval(self.tree, df)
+
+    def _eval(self, node, df):
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            if node.id not in df.columns:
+                raise SPLError(f"Unknown field: {node.id}")
+            column = df[node.id]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                column = column.astype(object)
+            return column
+        if isinstance(node, ast.BoolOp):
+            values = [self._eval(v, df) for v in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            result = values[0]
+            for value in values[1:]:
+                result = combine(result, value)
+            return result
+        if isinstance(node, ast.UnaryOp):
+            operand = self._eval(node.operand, df)
+            if isinstance(node.op, ast.Not):
+                return np.logical_not(operand)
+            if isinstance(node.op, ast.USub):
+                return -operand
+            return operand
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+            return _BINARY[type(node.op)](self._eval(node.left, df), self._eval(node.right, df))
+        if isinstance(node, ast.Compare):
+            left = self._eval(node.left, df)
+            result = True
+            for op, comparator in zip(node.ops, node.comparators):
+                right = self._eval(comparator, df)
+                result = np.logical_and(result, _COMPARE[type(op)](left, right))
+                left = right
+            return result
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in _FUNCTIONS:
+            return _FUNCTIONS[node.func.id](*(self._eval(arg, df) for arg in node.args))
+        raise SPLError(f"Unsupported expression: {self.text}")
+
+
+# Commands
+
+class Command:
+    """One pipeline stage; fields() says which input fields it needs for the output it must produce"""
+
+    def fields(self, needed: Optional[Set[str]]) -> Optional[Set[str]]:
+        return needed
+
+    def run(self, df: pd.DataFrame) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class Search(Command):
+    def __init__(self, text: str):
+        self.indexes: List[str] = []
+        self.filters: List[Tuple[str, str, object]] = []
+        self.offsets: Dict[str, int] = {}
+        for term in _split_terms(re.sub(r'^search\b', '', text.strip())):
+            match = _TERM.match(term)
+            if not match:
+                raise SPLError(f"Unsupported search term: {term} (use field=value)")
+            field, op, value = match.groups()
+            if field == "index" and op == "=":
+                self.indexes.append(_unquote(value))
+            elif field in ("earliest", "latest") and op == "=":
+                self.offsets[field] = _relative_time(_unquote(value))
+            else:
+                self.filters.append((field, op, _literal(value)))
+
+    def categories(self) -> List[str]:
+        if not self.indexes or "*" in self.indexes:
+            return list(SOURCE_SCHEMAS)
+        unknown = [i for i in self.indexes if i not in SPLUNK_INDEXES]
+        if unknown:
+            raise SPLError(f"Unknown index: {', '.join(unknown)}")
+        return list(dict.fromkeys(SPLUNK_INDEXES[i] for i in self.indexes))
+
+    def fields(self, needed):
+        if needed is ALL_FIELDS:
+            return needed
+        return needed | {field for field, _, _ in self.filters}
+
+    def time_range(self) -> Dict[str, int]:
+        """start_ms / end_ms bounds of earliest= / latest=, relative to now"""
+        now_ms = int(np.datetime64(datetime.now(), 'ms').astype(np.int64))
+        bounds = {}
+        if "earliest" in self.offsets:
+            bounds["start_ms"] = now_ms - self.offsets["earliest"]
+        if "latest" in self.offsets:
+            bounds["end_ms"] = now_ms - self.offsets["latest"]
+        return bounds
+
+    def indexed_filters(self) -> Dict[str, str]:
+        """Exact field=value terms the store can answer from its indexes"""
+        return {
+            field: value for field, op, value in self.filters
+            if op == "=" and isinstance(value, str) and "*" not in value and field in INDEXED_FIELDS
+        }
+
+    def run(self, df):
+        mask = np.ones(len(df), dtype=bool)
+        for field, op, value in self.filters:
+            if field not in df.columns:
+                mask[:] = op == "!="
+                continue
+            column = df[field]
+            if isinstance(value, str) and "*" in value and op in ("=", "!="):
+                regex = "^" + ".*".join(re.escape(p) for p in value.split("*")) + "$"
+                matched = column.astype(str).str.match(regex).to_numpy()
+                mask &= matched if op == "=" else ~matched
+            else:
+                if isinstance(value, str) and pd.api.types.is_bool_dtype(column):
+                    value = value.lower() == "true"
+                mask &= np.asarray(_COMPARE[_SEARCH_OPS[op]](column, value), dtype=bool)
+        return df[mask]
+
+
+_TIME_UNITS_MS = {"s": 1000, "m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 7 * 86_400_000}
+
+
+def _relative_time(value: str) -> int:
+    """Milliseconds before now of an earliest/latest modifier such as -7d or now"""
+    if value == "now":
+        return 0
+    match = re.fullmatch(r'-(\d+)([smhdw])', value)
+    if not match:
+        raise SPLError(f"Cannot parse time modifier: {value} (use e.g. -15m, -7d or now)")
+    return int(match.group(1)) * _TIME_UNITS_MS[match.group(2)]
+
+
+_SEARCH_OPS = {"=": ast.Eq, "!=": ast.NotEq, "<": ast.Lt, "<=": ast.LtE, ">": ast.Gt, ">=": ast.GtE}
+
+
+class Where(Command):
+    def __init__(self, args: str):
+        self.expr = Expression(args)
+
+    def fields(self, needed):
+        return needed if needed is ALL_FIELDS else needed | self.expr.fields
+
+    def run(self, df):
+        mask = self.expr.evaluate(df)
+        return df[np.asarray(mask, dtype=bool)]
+
+
+class Eval(Command):
+    def __init__(self, args: str):
+        self.assignments = []
+        for part in _split_unquoted(args, ","):
+            field, sep, expr = part.partition("=")
+            if not sep or not field.strip().isidentifier():
+                raise SPLError(f"eval expects field=expression, got: {part}")
+            self.assignments.append((field.strip(), Expression(expr)))
+
+    def fields(self, needed):
+        if needed is ALL_FIELDS:
+            return needed
+        for field, expr in reversed(self.assignments):
+            needed = (needed - {field}) | expr.fields
+        return needed
+
+    def run(self, df):
+        df = df.copy()
+        for field, expr in self.assignments:
+            value = expr.evaluate(df)
+            df[field] = value.to_numpy() if isinstance(value, pd.Series) else value
+        return df
+
+
+_STATS_FUNCTIONS = {
+    "avg": "mean", "mean": "mean", "sum": "sum", "min": "min", "max": "max",
+    "median": "median", "stdev": "std", "var": "var", "dc": "nunique",
+    "distinct_count": "nunique", "first": "first", "last": "last",
+}
+
+
+class Stats(Command):
+    def __init__(self, args: str):
+        parts = re.split(r'\s+by\s+', args, maxsplit=1, flags=re.IGNORECASE)
+        aggs_text = parts[0]
+        self.by = _field_list(parts[1]) if len(parts) > 1 else []
+        self.aggs = []
+        for spec in _split_unquoted(aggs_text, ","):
+            for part in self._split_spaced(spec):
+                match = _AGG.match(part)
+                if not match:
+                    raise SPLError(f"Cannot parse stats function: {part}")
+                func, arg, alias = match.groups()
+                func = func.lower()
+                percentile = re.fullmatch(r'(?:p|perc)(\d{1,2})', func)
+                if func not in _STATS_FUNCTIONS and func != "count" and not percentile:
+                    raise SPLError(f"Unsupported stats function: {func}")
+                condition = None
+                if arg and arg.lower().startswith("eval(") and arg.endswith(")"):
+                    condition = Expression(arg[5:-1])
+                name = alias or (f"{func}({arg})" if arg else func)
+                self.aggs.append((func, arg if condition is None else None, condition, name))
+
+    @staticmethod
+    def _split_spaced(spec: str) -> List[str]:
+        """Allow `count avg(a) avg(b) as b` as well as `count, avg(a), avg(b) as b`"""
+        tokens = [t for t in _split_unquoted(spec, " ") if t]
+        parts: List[str] = []
+        while tokens:
+            token = tokens.pop(0)
+            if token.lower() == "as" and parts and tokens:
+                parts[-1] += f" as {tokens.pop(0)}"
+            else:
+                parts.append(token)
+        return parts or [spec]
+
+    def fields(self, needed):
+        fields = set(self.by)
+        for _, arg, condition, _ in self.aggs:
+            if arg:
+                fields.add(arg)
+            if condition:
+                fields |= condition.fields
+        return fields
+
+    def run(self, df):
+        work = pd.DataFrame(index=df.index)
+        for field in self.by:
+            if field not in df.columns:
+                return pd.DataFrame(columns=self.by + [name for *_, name in self.aggs])
+            work[field] = df[field]
+        specs = {}
+        for i, (func, arg, condition, name) in enumerate(self.aggs):
+            column = f"__agg{i}"
+            if condition is not None:
+                work[column] = np.asarray(condition.evaluate(df), dtype=np.int64)
+                specs[name] = (column, "sum")
+            elif func == "count":
+                work[column] = (df[arg] if arg in df.columns else np.nan) if arg else 1
+                specs[name] = (column, "count" if arg else "sum")
+            else:
+                if arg not in df.columns:
+                    raise SPLError(f"Unknown field: {arg}")
+                values = df[arg]
+                if isinstance(values.dtype, pd.CategoricalDtype) and func not in ("dc", "distinct_count", "first", "last"):
+                    values = pd.to_numeric(values.astype(object), errors="coerce")
+                work[column] = values
+                percentile = re.fullmatch(r'(?:p|perc)(\d{1,2})', func)
+                specs[name] = (column, int(percentile.group(1)) / 100 if percentile else _STATS_FUNCTIONS[func])
+
+        if not self.by:
+            return pd.DataFrame([{
+                name: work[column].quantile(how) if isinstance(how, float) else work[column].agg(how)
+                for name, (column, how) in specs.items()
+            }])
+        grouped = work.groupby(self.by, observed=True, sort=True)
+        result = pd.DataFrame({
+            name: grouped[column].quantile(how) if isinstance(how, float) else grouped[column].agg(how)
+            for name, (column, how) in specs.items()
+        })
+        return result.reset_index()
+
+
+class Sort(Command):
+    def __init__(self, args: str):
+        fields = _field_list(args.replace("-", " -").replace("+", " +"))
+        self.limit = int(fields.pop(0)) if fields and fields[0].isdigit() else None
+        self.keys = []
+        sign = "+"
+        for token in fields:
+            if token in ("-", "+"):
+                sign = token
+                continue
+            if token[0] in "+-":
+                sign, token = token[0], token[1:]
+            self.keys.append((token, sign == "+"))
+            sign = "+"
+        if not self.keys:
+            raise SPLError("sort needs at least one field")
+
+    def fields(self, needed):
+        return needed if needed is ALL_FIELDS else needed | {field for field, _ in self.keys}
+
+    def run(self, df):
+        keys = [(f, asc) for f, asc in self.keys if f in df.columns]
+        if keys:
+            df = df.sort_values([f for f, _ in keys], ascending=[asc for _, asc in keys], kind="stable")
+        return df.head(self.limit) if self.limit else df
+
+
+class Head(Command):
+    def __init__(self, args: str):
+        args = args.strip()
+        if args and not args.isdigit():
+            raise SPLError(f"head expects a number, got: {args}")
+        self.n = int(args) if args else 10
+
+    def run(self, df):
+        return df.head(self.n)
+
+
+class Table(Command):
+    def __init__(self, args: str):
+        self.columns = _field_list(args)
+        if not self.columns:
+            raise SPLError("table needs at least one field")
+
+    def fields(self, needed):
+        return set(self.columns)
+
+    def run(self, df):
+        # Like Splunk, fields missing from every event are silently skipped
+        return df[[c for c in self.columns if c in df.columns]]
+
+
+class Transaction(Command):
+    """Group events sharing a field value; maxspan starts a new transaction after that long"""
+
+    def __init__(self, args: str):
+        fields = _field_list(args)
+        options = dict(f.split("=", 1) for f in fields if "=" in f)
+        self.keys = [f for f in fields if "=" not in f]
+        if not self.keys:
+            raise SPLError("transaction needs a field, e.g. transaction trace_id")
+        self.maxspan = None
+        if "maxspan" in options:
+            match = re.fullmatch(r'(\d+)([smhd]?)', options["maxspan"])
+            if not match:
+                raise SPLError(f"Cannot parse maxspan: {options['maxspan']}")
+            unit = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+            self.maxspan = pd.Timedelta(seconds=int(match.group(1)) * unit)
+
+    def fields(self, needed):
+        return needed if needed is ALL_FIELDS else needed | set(self.keys) | {"_time"}
+
+    def run(self, df):
+        if df.empty or any(k not in df.columns for k in self.keys):
+            return df.iloc[0:0]
+        df = df.sort_values("_time", kind="stable")
+        group = df.groupby(self.keys, sort=False, observed=True).ngroup()
+        if self.maxspan is not None:
+            start = df["_time"].groupby(group).transform("min")
+            group = group * (10 ** 6) + ((df["_time"] - start) // self.maxspan)
+        group = group.to_numpy()
+        grouped = df.groupby(group, sort=False)
+        result = pd.DataFrame({
+            "_time": grouped["_time"].min(),
+            "duration": (grouped["_time"].max() - grouped["_time"].min()).dt.total_seconds(),
+            "eventcount": grouped.size(),
+        })
+        for column in df.columns:
+            if column in ("_time", "_seq", "timestamp"):
+                continue
+            values = grouped[column].first()
+            if column not in self.keys:
+                # Fields that differ within a transaction become multi-value lists
+                distinct = grouped[column].nunique()
+                multi = distinct.index[distinct.to_numpy() > 1]
+                if len(multi):
+                    rows = df[np.isin(group, multi)]
+                    lists = rows.groupby(group[np.isin(group, multi)], sort=False)[column].agg(
+                        lambda v: list(dict.fromkeys(v.tolist()))
+                    )
+                    values = values.astype(object)
+                    values.loc[lists.index] = lists
+            result[column] = values
+        return result.sort_values("_time", ascending=False, ignore_index=True)
+
+
+_COMMANDS = {
+    "search": Search,
+    "where": Where,
+    "eval": Eval,
+    "stats": Stats,
+    "sort": Sort,
+    "head": Head,
+    "table": Table,
+    "transaction": Transaction,
+}
+
+
+def parse(query: str) -> Tuple[Search, List[Command]]:
+    """Parse an SPL query into its initial search and the piped commands"""
+    segments = _split_unquoted(query.strip(), "|")
+    if segments and segments[0] == "":
+        # A leading pipe starts with a command; without an explicit search every index is searched
+        segments = segments[1:]
+        if segments and segments[0].partition(" ")[0].lower() != "search":
+            segments.insert(0, "")
+    if not any(segments):
+        raise SPLError("Empty query")
+    search = Search(segments[0])
+    commands = []
+    for segment in segments[1:]:
+        name, _, args = segment.partition(" ")
+        command = _COMMANDS.get(name.lower())
+        if command is None or command is Search:
+            raise SPLError(f"Unsupported command: {name}")
+        commands.append(command(args))
+    return search, commands
+
+
+def run_spl(query: str, store: LogStore) -> SPLResult:
+    """Run an SPL query against a log store (or a TierManager, to include its segment tiers) and report true scan counts and timing"""
+    start = time.perf_counter()
+    search, commands = parse(query)
+
+    needed = ALL_FIELDS
+    for command in reversed(commands):
+        needed = command.fields(needed)
+    needed = search.fields(needed)
+    columns = None if needed is ALL_FIELDS else {"timestamp" if f == "_time" else f for f in needed}
+
+    frames = []
+    scanned = 0
+    where = search.indexed_filters()
+    time_range = search.time_range()
+    for category in search.categories():
+        df = store.frame(category, columns=columns, where=where or None, **time_range)
+        scanned += len(df)
+        if len(df):
+            frames.append(df)
+    if frames:
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=["_seq", "source_category", "timestamp"])
+    df = df.rename(columns={"timestamp": "_time"})
+    df.insert(0, "index", df["source_category"].map(_CATEGORY_INDEXES) if len(df) else [])
+
+    try:
+        df = search.run(df)
+        for command in commands:
+            df = command.run(df)
+    except SPLError:
+        raise
+    except (TypeError, ValueError, KeyError) as e:
+        raise SPLError(f"Query failed: {e}")
+
+    df = df.drop(columns=["_seq"], errors="ignore").reset_index(drop=True)
+    return SPLResult(frame=df, scanned=scanned, elapsed=time.perf_counter() - start)
+
+
+# Default index reported for each category (first listed in SPLUNK_INDEXES)
+_CATEGORY_INDEXES: Dict[str, str] = {}
+for _index, _category in SPLUNK_INDEXES.items():
+    _CATEGORY_INDEXES.setdefault(_category, _index)
+
+
+# Queries past bugs broke, run against generated events by `python spl_engine.py`
+REGRESSION_QUERIES = [
+    'index=aiml_models | eval slow=if(latency_ms>1000,1,0) | stats count by slow',
+    'index=aiml_models | stats count avg(latency_ms) p95(latency_ms) by model',
+    'index=aiml_models | stats count(eval(status="warning")) as warnings count by model',
+    '| stats count by source_category',
+]
+
+
+if __name__ == "__main__":
+    from log_generator import generate_mixed_batch
+
+    sample = LogStore()
+    for _source, _columns in generate_mixed_batch(10_000).items():
+        sample.extend(_source, _columns)
+    for _query in REGRESSION_QUERIES:
+        _result = run_spl(_query, sample)
+        assert len(_result.frame), f"no rows: {_query}"
+        print(f"ok  {len(_result.frame):>3} rows  {_query}")
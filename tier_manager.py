@@ -0,0 +1,387 @@
+"""
+Tier Manager
+Hot/warm/cold/archive lifecycle of ingested events, driven by each index's retention policy
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import IO, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from log_segment import DEFAULT_SEGMENT_DIR, SEQ_COLUMN, Segment, SegmentStore, read_segments
+from log_store import SOURCE_SCHEMAS, SPLUNK_INDEXES, LogStore
+
+try:
+    import fcntl
+except ImportError:  # no flock (Windows): every private store gets a directory of its own process
+    fcntl = None
+
+# Length of a policy day; shorten it (e.g. TIER_DAY_SECONDS=60) to watch events move through the tiers
+DAY_MS = int(float(os.getenv('TIER_DAY_SECONDS', '86400')) * 1000)
+CYCLE_SECONDS = 1.0
+FLUSH_SECONDS = 30  # memory is flushed to hot segments at least this often...
+FLUSH_FILL = 0.5  # ...and as soon as this share of a category's ring has not been flushed
+IO_BUDGET_BYTES = 16 * 1024 * 1024  # segment bytes read plus written per cycle by compaction and rolls
+
+TIERS = ("hot", "warm", "cold", "archive")
+SEARCHABLE_TIERS = ("hot", "warm", "cold")
+TIER_CODECS = {"hot": "none", "warm": "none", "cold": "lzma", "archive": "lzma"}
+TIER_BUCKET_DAYS = {"hot": 1 / 24, "warm": 1 / 24, "cold": 1, "archive": 1}
+MOVES = ("Memory → Hot", "Hot → Warm", "Warm → Cold", "Cold → Archive", "Purged")
+
+
+# Claimed private segment directory and its held lock file, by base directory
+_private_dirs: Dict[str, Tuple[str, Optional[IO]]] = {}
+_private_dirs_lock = threading.Lock()
+
+
+def segment_dir(log_store: LogStore, base: str = DEFAULT_SEGMENT_DIR) -> str:
+    """Segment directory of a log store: one per shared block, and one per process for private stores
+
+    Private stores number events from 0 in every server process, and compaction drops duplicate
+    _seq values, so two processes must never write one directory. The first process claims
+    base/private with a lock held until it exits (a restarted server resumes it); others running
+    at the same time use base/private-<pid>.
+    """
+    name = getattr(log_store, "name", None)
+    if name:
+        return os.path.join(base, name)
+    with _private_dirs_lock:
+        if base not in _private_dirs:
+            path, lock = os.path.join(base, f"private-{os.getpid()}"), None
+            if fcntl is not None:
+                os.makedirs(base, exist_ok=True)
+                lock = open(os.path.join(base, "private.lock"), "w")
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    path = os.path.join(base, "private")
+                except OSError:  # held by another live server process
+                    lock.close()
+                    lock = None
+            _private_dirs[base] = (path, lock)
+        return _private_dirs[base][0]
+
+
+class RetentionPolicy(NamedTuple):
+    """Age limits in days: hot, then warm, then cold until each limit, then archived or (archive_days None) purged"""
+    index: str
+    hot_days: float
+    warm_days: float
+    cold_days: float
+    archive_days: Optional[float]
+    compliance: str
+
+
+RETENTION_POLICIES = [
+    RetentionPolicy("aiml_models", 14, 60, 180, 3 * 365, "SOC2"),
+    RetentionPolicy("aiml_training", 7, 30, 90, 365, "Internal"),
+    RetentionPolicy("aiml_rag", 14, 60, 180, 3 * 365, "SOC2"),
+    RetentionPolicy("infrastructure", 3, 14, 90, None, "Internal"),
+    RetentionPolicy("security_audit", 30, 90, 365, 7 * 365, "SOC2, HIPAA, GDPR"),
+    RetentionPolicy("devops_ci_cd", 7, 30, 90, 365, "Internal"),
+]
+# For source categories none of whose indexes has a policy
+DEFAULT_POLICY = RetentionPolicy("default", 7, 30, 90, None, "Internal")
+
+
+def category_policies(policies: Iterable[RetentionPolicy] = RETENTION_POLICIES) -> Dict[str, RetentionPolicy]:
+    """Effective policy of each source category: the longest limits among the policies of its indexes"""
+    by_category: Dict[str, List[RetentionPolicy]] = {}
+    for policy in policies:
+        if policy.index in SPLUNK_INDEXES:
+            by_category.setdefault(SPLUNK_INDEXES[policy.index], []).append(policy)
+    effective = {}
+    for category in SOURCE_SCHEMAS:
+        matching = by_category.get(category, [DEFAULT_POLICY])
+        archives = [p.archive_days for p in matching if p.archive_days is not None]
+        effective[category] = RetentionPolicy(
+            "+".join(p.index for p in matching),
+            max(p.hot_days for p in matching),
+            max(p.warm_days for p in matching),
+            max(p.cold_days for p in matching),
+            max(archives) if archives else None,
+            ", ".join(dict.fromkeys(c.strip() for p in matching for c in p.compliance.split(","))),
+        )
+    return effective
+
+
+def _concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate event frames, merging the categories of categorical columns instead of dropping to object"""
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return pd.DataFrame(columns=[SEQ_COLUMN, "source_category", "timestamp"])
+    if len(frames) == 1:
+        return frames[0]
+    merged = {}
+    for name in frames[0].columns:
+        dtypes = [frame[name].dtype for frame in frames if name in frame]
+        if len(dtypes) == len(frames) and all(isinstance(dtype, pd.CategoricalDtype) for dtype in dtypes):
+            categories = pd.unique(np.concatenate([dtype.categories.to_numpy(object) for dtype in dtypes]))
+            merged[name] = pd.CategoricalDtype(pd.Index(categories))
+    return pd.concat([frame.astype(merged) for frame in frames], ignore_index=True)
+
+
+class TierManager:
+    """Moves events from the in-memory log store through hot, warm, cold and archive segments
+
+    A daemon thread runs short cycles: flush events not yet persisted from memory to (uncompressed)
+    hot segments, retire segments whose newest event passed their tier's age limit (rename into
+    warm, rewrite into lzma-compressed daily cold segments, rename into the archive, or purge),
+    and merge the several segments of closed time buckets. Rewrites stop for the cycle once
+    io_budget bytes were read and written, so a backlog is worked off gradually.
+
+    frame() answers LogStore.frame() queries across memory and the searchable tiers, so SPL
+    searches see recent events from memory and older ones from disk without duplicates.
+    """
+
+    def __init__(self, log_store: LogStore, root: Optional[str] = None, day_ms: int = DAY_MS,
+                 io_budget: int = IO_BUDGET_BYTES):
+        self.log_store = log_store
+        self.root = root = root or segment_dir(log_store)
+        self.day_ms = day_ms
+        self.io_budget = io_budget
+        self.policies = category_policies()
+        self.stores = {
+            tier: SegmentStore(os.path.join(root, tier), max(1, int(TIER_BUCKET_DAYS[tier] * day_ms)))
+            for tier in TIERS
+        }
+        for store in self.stores.values():
+            store.refresh()
+        self._flushed_seq = -1
+        if not log_store.read_only and not log_store.total_appended:
+            # Keep arrival numbers unique across runs, so tiers and memory never hold two events with one _seq
+            newest = max((s.max_seq for store in self.stores.values() for s in store.segments()), default=None)
+            if newest is not None:
+                log_store.resume_after(newest)
+                self._flushed_seq = newest
+        # Rows of each category flushed or overwritten so far, and the store's clear() count they belong to
+        self._flushed_rows = {category: 0 for category in SOURCE_SCHEMAS}
+        self._clears = log_store.clears
+        self._last_flush = time.monotonic()
+        self._cycle_lock = threading.Lock()
+        self._active = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"cycles": 0, "io_bytes": 0, "backlog": False, "last_error": None, "overwritten": 0,
+                       "moved": {move: 0 for move in MOVES}}
+
+    @property
+    def running(self) -> bool:
+        return self._active.is_set()
+
+    def start(self):
+        """Start the background cycles (never for a store another process writes)"""
+        with self._lock:
+            if self._active.is_set() or self.log_store.read_only:
+                return
+            self._active.set()
+            # A thread that has not yet seen the stop() keeps going; once it has exited (clearing _thread) start a new one
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tier-manager", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._active.clear()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return dict(self._stats, moved=dict(self._stats["moved"]), running=self.running)
+
+    def _count(self, move: str, events: int):
+        with self._lock:
+            self._stats["moved"][move] += events
+
+    def _limit_ms(self, policy: RetentionPolicy, tier: str) -> Optional[float]:
+        days = {"hot": policy.hot_days, "warm": policy.warm_days, "cold": policy.cold_days,
+                "archive": policy.archive_days}[tier]
+        return None if days is None else days * self.day_ms
+
+    # Memory -> hot
+
+    def _flush_due(self) -> bool:
+        if self.log_store.total_appended - 1 <= self._flushed_seq:
+            return False
+        if time.monotonic() - self._last_flush >= FLUSH_SECONDS or self.log_store.clears != self._clears:
+            return True
+        return any(buffer.written - min(self._flushed_rows[category], buffer.written) >= buffer.capacity * FLUSH_FILL
+                   for category, buffer in self.log_store.buffers.items())
+
+    def flush(self) -> int:
+        """Write events not yet persisted from memory to hot segments; returns how many were written
+
+        Events the ring overwrote before they could be flushed are counted in snapshot()["overwritten"].
+        """
+        with self._cycle_lock:
+            if self.log_store.clears != self._clears:
+                # Row counts restarted; events dropped by clear() are not losses
+                self._clears = self.log_store.clears
+                self._flushed_rows = {category: 0 for category in SOURCE_SCHEMAS}
+            upto = self.log_store.total_appended - 1
+            written = overwritten = 0
+            for category in SOURCE_SCHEMAS:
+                rows = self.log_store.rows_through(category, upto)
+                events = self.log_store.frame(category, since=self._flushed_seq, until=upto)
+                # max(): a clear() racing this flush restarts the row count
+                overwritten += max(0, rows - self._flushed_rows[category] - len(events))
+                self._flushed_rows[category] = rows
+                segments = self.stores["hot"].write(category, events, TIER_CODECS["hot"])
+                written += sum(segment.rows for segment in segments)
+            self._flushed_seq = upto
+            self._last_flush = time.monotonic()
+        with self._lock:
+            self._stats["overwritten"] += overwritten
+        self._count("Memory → Hot", written)
+        return written
+
+    # Segment lifecycle
+
+    def _rewrite(self, category: str, segments: List[Segment], source: str, target: str) -> int:
+        """Merge segments into the target tier's format and bucket; returns bytes read plus written"""
+        events = read_segments(segments)
+        written = self.stores[target].write(category, events.drop_duplicates(SEQ_COLUMN), TIER_CODECS[target])
+        kept = {segment.path for segment in written}
+        self.stores[source].remove([segment for segment in segments if segment.path not in kept])
+        return sum(segment.nbytes for segment in segments) + sum(segment.nbytes for segment in written)
+
+    def _retire(self, now_ms: int, budget: int) -> int:
+        """Move or purge segments past their tier's age limit, oldest tier first; returns the budget left"""
+        for position in range(len(TIERS) - 1, -1, -1):
+            tier = TIERS[position]
+            store = self.stores[tier]
+            for category, policy in self.policies.items():
+                limit = self._limit_ms(policy, tier)
+                if limit is None:
+                    continue
+                due = [s for s in store.segments(category) if s.max_ts < now_ms - limit]
+                if not due:
+                    continue
+                target = TIERS[position + 1] if position + 1 < len(TIERS) else None
+                if target == "archive" and policy.archive_days is None:
+                    target = None
+                if target is None:
+                    store.remove(due)
+                    self._count("Purged", sum(s.rows for s in due))
+                    continue
+                move = f"{tier.title()} → {target.title()}"
+                target_store = self.stores[target]
+                if store.bucket_ms == target_store.bucket_ms and TIER_CODECS[tier] == TIER_CODECS[target]:
+                    for segment in due:
+                        store.move(segment, target_store)
+                    self._count(move, sum(s.rows for s in due))
+                    continue
+                groups: Dict[int, List[Segment]] = {}
+                for segment in due:
+                    groups.setdefault(segment.min_ts // target_store.bucket_ms, []).append(segment)
+                for bucket in sorted(groups):
+                    if budget <= 0:
+                        return budget
+                    budget -= self._rewrite(category, groups[bucket], tier, target)
+                    self._count(move, sum(s.rows for s in groups[bucket]))
+        return budget
+
+    def _compact(self, now_ms: int, budget: int) -> int:
+        """Merge the small segments of closed buckets (e.g. one hot file per flush) into one; returns the budget left"""
+        grace_ms = 2 * FLUSH_SECONDS * 1000
+        for tier in TIERS:
+            store = self.stores[tier]
+            for category in self.policies:
+                buckets: Dict[int, List[Segment]] = {}
+                for segment in store.segments(category):
+                    if segment.nbytes < self.io_budget:
+                        buckets.setdefault(segment.min_ts // store.bucket_ms, []).append(segment)
+                for bucket, segments in sorted(buckets.items()):
+                    if len(segments) < 2 or (bucket + 1) * store.bucket_ms + grace_ms > now_ms:
+                        continue
+                    if budget <= 0:
+                        return budget
+                    budget -= self._rewrite(category, segments, tier, tier)
+        return budget
+
+    def run_once(self, now_ms: Optional[int] = None) -> int:
+        """One cycle: flush if due, then retire and compact within the I/O budget; returns bytes read and written"""
+        if self._flush_due():
+            self.flush()
+        if now_ms is None:
+            now_ms = int(np.datetime64(datetime.now(), 'ms').astype(np.int64))
+        with self._cycle_lock:
+            for store in self.stores.values():
+                store.refresh()
+            budget = self._retire(now_ms, self.io_budget)
+            budget = self._compact(now_ms, budget)
+        with self._lock:
+            self._stats["cycles"] += 1
+            self._stats["io_bytes"] += self.io_budget - budget
+            self._stats["backlog"] = budget <= 0
+        return self.io_budget - budget
+
+    def _run(self):
+        while True:
+            with self._lock:
+                # Decided under the lock, so start() either sees this thread continue or spawns a new one
+                if not self._active.is_set():
+                    self._thread = None
+                    return
+            started = time.monotonic()
+            try:
+                self.run_once()
+            except Exception as e:  # keep cycling; the storage page shows the last error
+                with self._lock:
+                    self._stats["last_error"] = f"{type(e).__name__}: {e}"
+            time.sleep(max(0.0, CYCLE_SECONDS - (time.monotonic() - started)))
+
+    # Queries
+
+    def frame(self, category: Optional[str] = None, columns: Optional[Iterable[str]] = None,
+              where: Optional[Dict[str, str]] = None, start_ms: Optional[int] = None, end_ms: Optional[int] = None,
+              tiers: Iterable[str] = SEARCHABLE_TIERS) -> pd.DataFrame:
+        """Events from memory and the segment tiers, shaped and ordered like LogStore.frame()
+
+        Memory answers for every event still held there; segments for the older ones. Time
+        bounds skip whole segments and buckets, so narrow ranges stay cheap on long retention.
+        """
+        categories = [category] if category else list(SOURCE_SCHEMAS)
+        frames = []
+        for category in categories:
+            memory = self.log_store.frame(category, columns, where, start_ms=start_ms, end_ms=end_ms)
+            # Read after the memory frame: events older than this left memory and are answered from disk
+            boundary = self.log_store.oldest_seq(category)
+            if boundary is not None and len(memory):
+                memory = memory[memory[SEQ_COLUMN] >= boundary]
+            for attempt in range(3):
+                try:
+                    stored = [self.stores[tier].frame(category, columns, start_ms, end_ms, where, boundary)
+                              for tier in tiers]
+                    break
+                except FileNotFoundError:  # a segment was rolled between listing and reading it
+                    for tier in tiers:
+                        self.stores[tier].refresh()
+            else:
+                stored = []
+            on_disk = _concat(stored)
+            if len(on_disk):
+                frames.append(on_disk.drop_duplicates(SEQ_COLUMN))
+            frames.append(memory)
+        events = _concat(frames)
+        return events.sort_values(SEQ_COLUMN, ignore_index=True) if len(events) else events
+
+    def tier_summary(self) -> pd.DataFrame:
+        """Events, segments, bytes and time span held in memory and in each tier"""
+        rows = [{"tier": "hot (memory)", "segments": 0, "events": len(self.log_store),
+                 "bytes": self.log_store.nbytes, "oldest": None, "newest": None}]
+        for tier, store in self.stores.items():
+            store.refresh()
+            segments = store.segments()
+            rows.append({
+                "tier": tier, "segments": len(segments), "events": sum(s.rows for s in segments),
+                "bytes": sum(s.nbytes for s in segments),
+                "oldest": min((s.min_ts for s in segments), default=None),
+                "newest": max((s.max_ts for s in segments), default=None),
+            })
+        summary = pd.DataFrame(rows)
+        for name in ("oldest", "newest"):
+            summary[name] = pd.to_datetime(summary[name], unit="ms")
+        return summary
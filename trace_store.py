@@ -0,0 +1,176 @@
+"""
+Trace Store
+Spans of RAG request traces in a columnar ring buffer, indexed by trace_id,
+with waterfall and critical path reconstruction and per-stage latency sketches
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from latency_sketch import LatencySketches
+from log_store import ColumnarRingBuffer, StringTable, epoch_us_to_local, row_nbytes
+
+# Memory ceiling for the span columns of one store
+DEFAULT_MAX_BYTES = int(float(os.getenv('TRACE_STORE_MAX_MB', '32')) * 1024 * 1024)
+
+TRACE_CATEGORY = "RAG Traces"
+# Column kinds as in log_store.SOURCE_SCHEMAS; ids are lowercase hex, roots have an empty parent
+SPAN_SCHEMA = [
+    ("trace_id", "S32"),
+    ("span_id", "S16"),
+    ("parent_span_id", "S16"),
+    ("name", "cat"),
+    ("service", "cat"),
+    ("start_us", "long"),
+    ("end_us", "long"),
+    ("status", "cat"),
+]
+
+
+def waterfall(spans: pd.DataFrame) -> pd.DataFrame:
+    """Spans of one trace in tree order with offsets, depth and critical path
+
+    Adds offset_ms (start relative to the earliest span), duration_ms, depth, critical
+    (on the critical path) and critical_ms (time the span itself contributes to the path).
+    Spans whose parent is missing are treated as roots.
+    """
+    spans = spans.reset_index(drop=True)
+    ids = spans["span_id"].tolist()
+    parents = spans["parent_span_id"].tolist()
+    starts = spans["start_us"].to_numpy()
+    ends = spans["end_us"].to_numpy()
+    known = set(ids)
+    children: Dict[str, list] = {}
+    roots = []
+    for row, parent in enumerate(parents):
+        if parent and parent in known:
+            children.setdefault(parent, []).append(row)
+        else:
+            roots.append(row)
+
+    # Tree order (each span followed by its children by start time) and depth
+    order, depth = [], np.zeros(len(spans), dtype=np.int64)
+    stack = sorted(roots, key=lambda row: starts[row], reverse=True)
+    while stack:
+        row = stack.pop()
+        order.append(row)
+        kids = sorted(children.get(ids[row], []), key=lambda kid: starts[kid], reverse=True)
+        depth[kids] = depth[row] + 1
+        stack.extend(kids)
+
+    # Critical path: from the end of the longest root, repeatedly take the child that finished
+    # last before the cursor, then continue from that child's start
+    critical_us = np.zeros(len(spans), dtype=np.int64)
+    on_path = np.zeros(len(spans), dtype=bool)
+    if roots:
+        walk = [(max(roots, key=lambda row: ends[row] - starts[row]), None)]
+        while walk:
+            row, clamp = walk.pop()
+            end = ends[row] if clamp is None else min(ends[row], clamp)
+            on_path[row] = True
+            cursor = end
+            for kid in sorted(children.get(ids[row], []), key=lambda kid: ends[kid], reverse=True):
+                if starts[kid] >= cursor:
+                    continue
+                walk.append((kid, cursor))
+                critical_us[row] += cursor - min(ends[kid], cursor)
+                cursor = starts[kid]
+            critical_us[row] += max(cursor - starts[row], 0)
+
+    result = spans.iloc[order].copy()
+    origin = starts.min() if len(spans) else 0
+    result["offset_ms"] = (result["start_us"] - origin) / 1000
+    result["duration_ms"] = (result["end_us"] - result["start_us"]) / 1000
+    result["depth"] = depth[order]
+    result["critical"] = on_path[order]
+    result["critical_ms"] = critical_us[order] / 1000
+    return result.reset_index(drop=True)
+
+
+class TraceStore:
+    """Fixed-capacity span store; a trace lookup walks only that trace's hash chain
+
+    Safe to share between threads: writers (e.g. the OTLP receiver) and readers take one lock.
+    Span latencies also go into minute sketches per span name ("stage") and per service, which
+    outlive the spans themselves and answer percentile queries over any time range.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._lock = threading.Lock()
+        self.strings = StringTable()
+        capacity = max(1, max_bytes // row_nbytes(SPAN_SCHEMA))
+        self.spans = ColumnarRingBuffer(TRACE_CATEGORY, SPAN_SCHEMA, capacity, self.strings)
+        self.sketches = LatencySketches()
+        self.next_seq = 0
+
+    def __len__(self) -> int:
+        """Number of spans currently held"""
+        return len(self.spans)
+
+    @property
+    def total_spans(self) -> int:
+        """Number of spans ever added, including evicted ones"""
+        return self.next_seq
+
+    @property
+    def nbytes(self) -> int:
+        return self.spans.nbytes + self.spans.index_nbytes
+
+    def extend(self, columns: Dict[str, np.ndarray]):
+        """Add a batch of spans given as columns (see log_generator.generate_rag_traces)"""
+        n = len(columns["span_id"])
+        with self._lock:
+            self.spans.extend(columns, np.arange(self.next_seq, self.next_seq + n))
+            self.next_seq += n
+            start_us, end_us = np.asarray(columns["start_us"]), np.asarray(columns["end_us"])
+            self.sketches.add("stage", columns["name"], start_us, end_us)
+            self.sketches.add("service", columns["service"], start_us, end_us)
+
+    def trace(self, trace_id: str) -> pd.DataFrame:
+        """Waterfall of one trace's live spans (empty frame if none are stored)"""
+        with self._lock:
+            frame = self.spans.frame(self.spans.lookup("trace_id", trace_id.strip().lower()))
+        for name in ("name", "service", "status"):
+            frame[name] = frame[name].astype(str)
+        return waterfall(frame.drop(columns=["_seq", "source_category"]))
+
+    def slowest(self, n: int = 10, since_us: Optional[int] = None) -> pd.DataFrame:
+        """The n longest root spans (whole requests), optionally only those started at or after since_us"""
+        with self._lock:
+            slots = self.spans.all_slots()
+            columns = self.spans.columns
+            slots = slots[columns["parent_span_id"][slots] == b""]
+            if since_us is not None:
+                slots = slots[columns["start_us"][slots] >= since_us]
+            durations = columns["end_us"][slots] - columns["start_us"][slots]
+            if len(slots) > n:
+                top = np.argpartition(durations, len(slots) - n)[len(slots) - n:]
+                slots, durations = slots[top], durations[top]
+            order = np.argsort(durations)[::-1]
+            slots, durations = slots[order], durations[order]
+            return pd.DataFrame({
+                "trace_id": self.spans.decoded("trace_id", slots),
+                "start": epoch_us_to_local(columns["start_us"][slots]),
+                "duration_ms": durations / 1000,
+                "service": self.spans.decoded("service", slots),
+                "status": self.spans.decoded("status", slots),
+            })
+
+    def latency_summary(self, group: str, start_minute: int, end_minute: int) -> pd.DataFrame:
+        """Span count, mean, rate and P50/P95/P99 per "stage" or "service" over an inclusive range of epoch minutes"""
+        with self._lock:
+            return self.sketches.summary(group, start_minute, end_minute)
+
+    def contains(self, trace_id: str) -> bool:
+        """Whether any span of the trace is held"""
+        with self._lock:
+            return len(self.spans.lookup("trace_id", trace_id.strip().lower())) > 0
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+            self.sketches.clear()
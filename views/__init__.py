@@ -0,0 +1,32 @@
+"""
+Dashboard Views
+One module per sidebar page, imported and rendered only when that page is selected
+(deliberately not named pages/, which Streamlit would route to directly, bypassing login)
+"""
+
+import importlib
+from typing import Dict
+
+import streamlit as st
+
+from shared_log_store import TornReadError
+
+# Sidebar label -> view module
+PAGES: Dict[str, str] = {
+    "🏠 Overview Dashboard": "overview",
+    "📥 Layer 1: Log Ingestion": "ingestion",
+    "⚙️ Layer 2: Processing": "processing",
+    "💾 Layer 3: Storage": "storage",
+    "📊 Layer 4: Consumption": "consumption",
+    "🔗 End-to-End Tracing": "tracing",
+    "⚡ Real-time Monitoring": "realtime",
+}
+
+
+def render(page: str):
+    """Import the selected page's module on first use and render it"""
+    try:
+        importlib.import_module(f"views.{PAGES[page]}").render()
+    except TornReadError as e:
+        # Nothing torn was shown; incremental readers did not advance, so the next run reads it again
+        st.warning(f"⚠️ Page stopped early, the shared log store changed under every read attempt: {e}")
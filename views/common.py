@@ -0,0 +1,93 @@
+"""
+Shared View Components
+Help bubbles, info cards and the cached Plotly chart renderer used across dashboard pages
+"""
+
+import hashlib
+import json
+from typing import Callable, Optional, Tuple
+
+import plotly.graph_objects as go
+import plotly.io
+import streamlit as st
+
+
+def show_help_bubble(message, key=None):
+    """Display an animated help bubble"""
+    st.markdown(f'<div class="help-bubble">{message}</div>', unsafe_allow_html=True)
+
+def show_info_card(title, content):
+    """Display an information card"""
+    st.markdown(f"""
+    <div class="info-card">
+        <div class="info-card-title">{title}</div>
+        <div class="info-card-content">{content}</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# Figure cache: Plotly JSON specs memoized by builder and a fingerprint of its inputs.
+# st.plotly_chart re-runs plotly.io.to_json on every call, so on the Streamlit releases this
+# was checked against the cached spec is enqueued directly; anything else uses the public API.
+_FAST_PATH_STREAMLIT = ("1.37",)
+_PLOTLY_CONFIG = json.dumps({"showLink": False, "linkText": False})
+
+try:
+    from streamlit.elements.form import current_form_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    from streamlit.runtime.state.common import compute_widget_id
+    _FAST_PATH = (
+        ".".join(st.__version__.split(".")[:2]) in _FAST_PATH_STREAMLIT
+        and {"spec", "config", "use_container_width", "theme", "form_id", "id"}
+        <= set(PlotlyChartProto.DESCRIPTOR.fields_by_name)
+    )
+except ImportError:
+    _FAST_PATH = False
+
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _cached_figure(_build: Callable, name: str, *inputs) -> go.Figure:
+    """Build a figure once per (builder, inputs); the instance is shared, so it is never modified"""
+    return _build(*inputs)
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _cached_spec(_build: Callable, name: str, *inputs) -> Tuple[str, str]:
+    """Build and encode a figure once per (builder, inputs); returns its JSON spec and the spec's digest"""
+    spec = plotly.io.to_json(_build(*inputs), validate=False)
+    return spec, hashlib.md5(spec.encode()).hexdigest()
+
+def plotly_chart(build: Callable, *inputs, use_container_width: bool = True, key: Optional[str] = None):
+    """Render build(*inputs) (a go.Figure builder), reusing the encoded figure while the inputs are unchanged
+
+    Inputs are hashed by st.cache_resource (arrays and DataFrames by content), so builders must
+    depend only on their arguments. Pass a key to keep a chart's zoom state when the layout shifts.
+    """
+    name = f"{build.__module__}.{build.__qualname__}"
+    if not _FAST_PATH:
+        st.plotly_chart(_cached_figure(build, name, *inputs), use_container_width=use_container_width, key=key)
+        return
+
+    spec, digest = _cached_spec(build, name, *inputs)
+    proto = PlotlyChartProto()
+    proto.spec = spec
+    proto.config = _PLOTLY_CONFIG
+    proto.use_container_width = use_container_width
+    proto.theme = "streamlit"
+    proto.form_id = current_form_id(st._main)
+    ctx = get_script_run_ctx()
+    # Same inputs as st.plotly_chart's id, with the spec digest standing in for the spec; without
+    # a key the element's position keeps identical charts on one page apart
+    proto.id = compute_widget_id(
+        "plotly_chart",
+        user_key=key,
+        key=key,
+        plotly_spec=digest,
+        plotly_config=proto.config,
+        theme=proto.theme,
+        form_id=proto.form_id,
+        use_container_width=use_container_width,
+        page=ctx.active_script_hash if ctx else None,
+        position=st._main._get_delta_path_str() if key is None else None,
+    )
+    st._main._enqueue("plotly_chart", proto)
@@ -0,0 +1,279 @@
+"""
+Layer 4: Consumption Page
+Dashboards, the API explorer and integrations
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import time
+
+import chart_data
+from views.common import plotly_chart, show_help_bubble, show_info_card
+
+
+def _token_usage_figure(tokens):
+    """Hourly token usage area chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=tokens['hour'],
+        y=tokens['tokens'],
+        mode='lines',
+        fill='tozeroy',
+        line=dict(color='#8B5CF6', width=2),
+        hovertemplate='<b>Hour:</b> %{x}<br><b>Tokens:</b> %{y:,}<extra></extra>'
+    ))
+    fig.update_layout(
+        title="Token Usage (Last 24h)",
+        height=250,
+        margin=dict(l=0, r=0, t=30, b=0),
+        xaxis_title="Hour",
+        yaxis_title="Tokens"
+    )
+    return fig
+
+
+def _daily_cost_figure(daily_costs):
+    """Daily cost line chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=daily_costs['date'],
+        y=daily_costs['cost_usd'],
+        mode='lines+markers',
+        line=dict(color='#F59E0B', width=2),
+        hovertemplate='<b>Date:</b> %{x}<br><b>Cost:</b> $%{y:.2f}<extra></extra>'
+    ))
+    fig.add_hline(
+        y=500, 
+        line_dash="dash", 
+        line_color="red",
+        annotation_text="Budget Threshold",
+        annotation_position="right"
+    )
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Date",
+        yaxis_title="Cost (USD)"
+    )
+    return fig
+
+
+def render():
+    """Render the Layer 4: Consumption page"""
+    if st.session_state.show_help:
+        show_info_card(
+            "📊 Consumption & Visualization Layer",
+            "This layer provides dashboards, APIs, and integrations for consuming the observability data. "
+            "Different stakeholders access data through role-appropriate interfaces."
+        )
+    
+    st.header("📊 Layer 4: Consumption, Visualization & Integration")
+    
+    tab1, tab2, tab3 = st.tabs(["📈 Dashboards", "🔌 API Explorer", "🔗 Integrations"])
+    
+    with tab1:
+        st.subheader("📈 Pre-built Dashboards")
+        
+        dashboard_type = st.selectbox(
+            "Select Dashboard",
+            ["AI/ML Operations", "RAG Pipeline", "Infrastructure", "Security & Compliance", "Cost Analytics"],
+            help="Choose from role-specific dashboards"
+        )
+        
+        if dashboard_type == "AI/ML Operations":
+            if st.session_state.show_help:
+                show_help_bubble("📊 This dashboard provides real-time insights into all AI/ML models across your organization")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric("Total Inferences (24h)", "1.2M", delta="+45K")
+            with col2:
+                st.metric("Avg Latency", "847ms", delta="-23ms")
+            with col3:
+                st.metric("Cost per 1K Tokens", "$0.0023", delta="-$0.0002")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Model comparison
+                models = ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]
+                metrics = {
+                    "Latency (ms)": [850, 920, 1200, 780, 950],
+                    "Cost ($/1K)": [0.0030, 0.0025, 0.0015, 0.0028, 0.0020],
+                    "Quality Score": [0.94, 0.96, 0.87, 0.93, 0.89]
+                }
+                
+                df = pd.DataFrame(metrics, index=models)
+                st.dataframe(df, use_container_width=True)
+            
+            with col2:
+                # Token usage over time
+                tokens = chart_data.token_usage_24h()
+                
+                plotly_chart(_token_usage_figure, tokens)
+        
+        elif dashboard_type == "Cost Analytics":
+            if st.session_state.show_help:
+                show_help_bubble("💰 Track and optimize AI/ML costs across teams, models, and time periods")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("##### 💰 Cost by Team (Last 30 Days)")
+                
+                teams = ["Data Science", "ML Ops", "Product", "Engineering", "Research"]
+                costs = [4567, 3234, 2890, 2345, 1890]
+                
+                fig = go.Figure(data=[go.Pie(
+                    labels=teams,
+                    values=costs,
+                    hole=0.4,
+                    hovertemplate='<b>%{label}</b><br>Cost: $%{value:,}<br>Percentage: %{percent}<extra></extra>'
+                )])
+                fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col2:
+                st.markdown("##### 📈 Daily Cost Trend")
+                
+                daily_costs = chart_data.daily_costs_30d()
+                
+                plotly_chart(_daily_cost_figure, daily_costs)
+    
+    with tab2:
+        st.subheader("🔌 Splunk REST API Explorer")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "🔌 API Access",
+                "Use REST APIs to programmatically access Splunk data. " 
+                "Integrate with custom applications, scripts, and other tools in your ecosystem."
+            )
+        
+        endpoint = st.selectbox(
+            "Select API Endpoint",
+            [
+                "GET /services/search/jobs - Create search job",
+                "GET /services/search/jobs/{sid}/results - Get search results",
+                "POST /services/data/indexes - Manage indexes",
+                "GET /services/saved/searches - List saved searches",
+                "GET /services/server/info - Server information"
+            ]
+        )
+        
+        st.markdown("##### 📋 Request")
+        
+        if "search/jobs" in endpoint and "results" not in endpoint:
+            request_body = {
+                "search": "search index=aiml_models | stats avg(latency_ms) by model_name",
+                "earliest_time": "-24h",
+                "latest_time": "now",
+                "output_mode": "json"
+            }
+        else:
+            request_body = {
+                "output_mode": "json",
+                "count": 100
+            }
+        
+        st.json(request_body)
+        
+        if st.button("🚀 Execute API Call", type="primary"):
+            with st.spinner("Executing API request..."):
+                time.sleep(1)
+                
+                st.success("✅ API call successful (Response time: 234ms)")
+                
+                st.markdown("##### 📥 Response")
+                
+                response = {
+                    "status": "success",
+                    "execution_time": "0.234s",
+                    "results": [
+                        {"model_name": "GPT-4", "avg_latency_ms": 850},
+                        {"model_name": "Claude-3", "avg_latency_ms": 920},
+                        {"model_name": "Llama-2", "avg_latency_ms": 1200}
+                    ],
+                    "result_count": 3
+                }
+                
+                st.json(response)
+                
+                st.markdown("##### 💻 Python SDK Example")
+                st.code("""
+import splunklib.client as client
+
+# Connect to Splunk
+service = client.connect(
+    host="splunk.example.com",
+    port=8089,
+    username="admin",
+    token="your-token-here"
+)
+
+# Create search job
+job = service.jobs.create(
+    "search index=aiml_models | stats avg(latency_ms)"
+)
+
+# Get results
+for result in job.results():
+    print(result)
+                """, language="python")
+    
+    with tab3:
+        st.subheader("🔗 External System Integrations")
+        
+        if st.session_state.show_help:
+            show_help_bubble("🔗 Pre-configured integrations with ITSM, incident management, and collaboration tools")
+        
+        integrations = {
+            "ServiceNow": {
+                "status": "🟢 Connected",
+                "description": "ITSM Ticketing",
+                "metrics": {"Incidents Created (24h)": 12, "Avg Resolution Time": "2.3 hours"}
+            },
+            "PagerDuty": {
+                "status": "🟢 Connected",
+                "description": "Incident Management",
+                "metrics": {"Alerts Sent (24h)": 45, "On-Call Engineers": 8}
+            },
+            "Slack": {
+                "status": "🟢 Connected",
+                "description": "ChatOps Notifications",
+                "metrics": {"Messages Sent (24h)": 234, "Channels": 12}
+            },
+            "Grafana": {
+                "status": "🟢 Connected",
+                "description": "Metrics Visualization",
+                "metrics": {"Dashboards": 23, "Active Users": 156}
+            },
+            "Datadog": {
+                "status": "🟢 Connected",
+                "description": "APM & Tracing",
+                "metrics": {"Traces/sec": 2345, "Services Monitored": 45}
+            },
+            "Azure AD": {
+                "status": "🟢 Connected",
+                "description": "SSO Authentication",
+                "metrics": {"Active Users": 234, "Auth Requests (24h)": 5678}
+            }
+        }
+        
+        for name, details in integrations.items():
+            with st.expander(f"{details['status']} **{name}** - {details['description']}", expanded=False):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**Configuration**")
+                    st.markdown(f"- Status: {details['status']}")
+                    st.markdown(f"- Type: {details['description']}")
+                    st.markdown("- Authentication: ✅ OAuth2")
+                    st.markdown("- Last Sync: 2 minutes ago")
+                
+                with col2:
+                    st.markdown("**Metrics (Last 24h)**")
+                    for metric, value in details['metrics'].items():
+                        st.markdown(f"- {metric}: **{value}**")
@@ -0,0 +1,606 @@
+"""
+Layer 1: Log Ingestion Page
+Data sources, forwarders, the live simulator and the log inspector
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import random
+import time
+
+from ingestion_worker import ingestion_worker
+from log_generator import SOURCE_CATEGORIES, generate_source_specific_log
+from shared_state import shared_state
+import chart_data
+from views.common import plotly_chart, show_help_bubble, show_info_card
+
+INGEST_RATES = [1, 10, 100, 1_000, 10_000, 100_000, 1_000_000]
+LIVE_REFRESH_SECONDS = 2
+
+
+def _forwarder_health_figure(health_data):
+    """Forwarder status donut"""
+    fig = go.Figure(data=[go.Pie(
+        labels=list(health_data.keys()),
+        values=list(health_data.values()),
+        marker=dict(colors=['#10B981', '#F59E0B', '#EF4444']),
+        hole=0.4,
+        hovertemplate='<b>%{label}</b><br>Count: %{value}<extra></extra>'
+    )])
+    fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
+    return fig
+
+
+def _top_forwarders_figure(top_forwarders, volumes):
+    """Horizontal bars of the busiest forwarders"""
+    fig = go.Figure(go.Bar(
+        x=volumes,
+        y=top_forwarders,
+        orientation='h',
+        marker_color='#1E40AF',
+        hovertemplate='<b>%{y}</b><br>Volume: %{x:,} logs/hour<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Logs/hour",
+        yaxis_title="Forwarder"
+    )
+    return fig
+
+
+def _render_live_status():
+    """Worker status and the newest events; reads only counters and the store's tail"""
+    worker = ingestion_worker()
+    stats = worker.snapshot()
+    log_store = shared_state().log_store
+    
+    if log_store.read_only:
+        st.success(f"🟢 **Status**: Reading shared log store `{log_store.name}` - events are written by its ingest process")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Events Held", f"{len(log_store):,}")
+        with col2:
+            st.metric("Events Appended", f"{log_store.total_appended:,}")
+        with col3:
+            st.metric("Batches Published", f"{log_store.generation:,}", help="Generation counter of the shared store")
+        with col4:
+            st.metric("Torn Reads", f"{log_store.torn_reads:,}",
+                      help="Reads abandoned because the writer overtook them on every retry")
+    else:
+        if stats["running"]:
+            st.success("🟢 **Status**: Ingestion Active - Generating logs from all sources...")
+        else:
+            st.info("⏸️ **Status**: Ingestion Paused - Click 'Start Ingestion' to begin")
+        if stats["last_error"]:
+            st.error(f"❌ Last ingestion error: {stats['last_error']}")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Target Rate", f"{stats['rate']:,.0f}/s")
+        with col2:
+            st.metric("Achieved Rate", f"{stats['achieved_rate']:,.0f}/s",
+                      help="Smoothed over recent batches; falls short of the target when generation cannot keep up")
+        with col3:
+            st.metric("Events Generated", f"{stats['events']:,}", help=f"{stats['dropped']:,} owed events skipped while behind")
+        with col4:
+            st.metric("Events Held", f"{len(log_store):,}", help=f"{log_store.total_appended:,} appended in total")
+    
+    if len(log_store):
+        # Show recent logs
+        st.markdown("##### 📜 Recent Logs (Last 10)")
+        for i, log in enumerate(log_store.tail(10)[::-1]):
+            with st.expander(f"Log {log_store.total_appended - i} - {log['source_category']} - {log['timestamp']}", expanded=i==0):
+                st.json(log)
+
+
+def render():
+    """Render the Layer 1: Log Ingestion page"""
+    if st.session_state.show_help:
+        show_info_card(
+            "📥 Log Ingestion Layer",
+            "This layer captures logs from all sources using Universal and Heavy Forwarders. "
+            "Start the simulator to see real-time log ingestion in action!"
+        )
+    
+    st.header("📥 Layer 1: Log Ingestion & Collection Infrastructure")
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "🎯 Six Log Sources",
+        "🎮 Live Simulator", 
+        "📊 Forwarder Status", 
+        "🔍 Log Inspector", 
+        "📈 Metrics"
+    ])
+
+    # Tab 1: Six Log Sources
+    with tab1:
+        st.subheader("🎯 Six Primary Log Source Categories")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "📚 Understanding the Six Log Sources",
+                "This platform captures logs from six distinct source categories, each providing unique "
+                "insights into your AI/ML operations. Click on each source below to see sample logs and learn more."
+            )
+        
+        # Visual Architecture Diagram
+        st.markdown("##### 🏗️ Log Collection Architecture")
+        
+        st.markdown("""
+        <div style='background: linear-gradient(135deg, #eff6ff 0%, #dbeafe 100%); 
+                    padding: 2rem; border-radius: 12px; margin: 1rem 0;'>
+            <div style='text-align: center; margin-bottom: 1.5rem;'>
+                <h3 style='color: #1e40af; margin: 0;'>Data Flow: Sources → Forwarders → Splunk Platform</h3>
+            </div>
+            <div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1.5rem;'>
+                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🤖</div>
+                    <strong style='color: #1e40af;'>AI/ML Applications</strong><br/>
+                    <small style='color: #64748b;'>Model serving, training, pipelines</small>
+                </div>
+                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #8b5cf6;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🔗</div>
+                    <strong style='color: #7c3aed;'>RAG Pipeline</strong><br/>
+                    <small style='color: #64748b;'>Complete chain tracing</small>
+                </div>
+                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #10b981;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>📊</div>
+                    <strong style='color: #059669;'>Model Metrics</strong><br/>
+                    <small style='color: #64748b;'>Performance & quality KPIs</small>
+                </div>
+                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>👥</div>
+                    <strong style='color: #d97706;'>User Interactions</strong><br/>
+                    <small style='color: #64748b;'>Behavioral & audit data</small>
+                </div>
+                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #ef4444;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🖥️</div>
+                    <strong style='color: #dc2626;'>Infrastructure</strong><br/>
+                    <small style='color: #64748b;'>System health & events</small>
+                </div>
+                <div style='background: white; padding: 1rem; border-radius: 8px; border-left: 4px solid #6366f1;'>
+                    <div style='font-size: 1.5rem; margin-bottom: 0.5rem;'>🔒</div>
+                    <strong style='color: #4f46e5;'>Governance & Compliance</strong><br/>
+                    <small style='color: #64748b;'>Policy & regulatory</small>
+                </div>
+            </div>
+            <div style='text-align: center; padding: 1rem; background: rgba(59, 130, 246, 0.1); border-radius: 8px;'>
+                <div style='font-size: 1.2rem; margin-bottom: 0.5rem;'>⬇️</div>
+                <strong style='color: #1e40af;'>Universal Forwarders (156 active)</strong> → 
+                <strong style='color: #7c3aed;'>Heavy Forwarders (12 active)</strong> → 
+                <strong style='color: #059669;'>Splunk Indexers (12 active)</strong>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Interactive Source Selector
+        st.markdown("##### 🔍 Explore Each Source Category")
+        
+        source_categories = [
+            "🤖 AI/ML Applications",
+            "🔗 RAG Pipeline", 
+            "📊 Model Metrics",
+            "👥 User Interactions",
+            "🖥️ Infrastructure",
+            "🔒 Governance & Compliance"
+        ]
+        
+        selected_source = st.selectbox(
+            "Select a source category to view sample logs:",
+            source_categories,
+            help="Choose a source to see what kind of logs it generates"
+        )
+        
+        # Source Statistics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        # Generate stats based on selected source
+        if "AI/ML" in selected_source:
+            with col1:
+                st.metric("Logs/Hour", "45,234", delta="+2,341", help="Log generation rate")
+            with col2:
+                st.metric("Active Models", "5", help="Currently served models")
+            with col3:
+                st.metric("Avg Latency", "847ms", delta="-23ms", help="Model response time")
+            with col4:
+                st.metric("GPU Utilization", "73%", delta="+5%", help="GPU usage across cluster")
+                
+        elif "RAG" in selected_source:
+            with col1:
+                st.metric("Chain Executions", "32,156", delta="+1,543", help="Complete RAG chains")
+            with col2:
+                st.metric("Avg Chain Time", "2,375ms", delta="+125ms", help="End-to-end latency")
+            with col3:
+                st.metric("Retrieval Accuracy", "94.3%", delta="+1.2%", help="Vector search quality")
+            with col4:
+                st.metric("Documents Indexed", "1.2M", help="Total documents in vector DB")
+                
+        elif "Model Metrics" in selected_source:
+            with col1:
+                st.metric("P95 Latency", "1,240ms", delta="+140ms", help="95th percentile response time")
+            with col2:
+                st.metric("Hallucination Rate", "2.3%", delta="-0.5%", delta_color="inverse", help="Detected hallucinations")
+            with col3:
+                st.metric("Drift Events", "3", delta="+1", help="Model drift detections today")
+            with col4:
+                st.metric("Quality Score", "0.94", delta="+0.02", help="Average quality metric")
+                
+        elif "User" in selected_source:
+            with col1:
+                st.metric("Active Users", "234", delta="+12", help="Unique users today")
+            with col2:
+                st.metric("Sessions", "5,678", delta="+234", help="Total sessions")
+            with col3:
+                st.metric("Avg Duration", "8.3 min", delta="+1.2 min", help="Average session length")
+            with col4:
+                st.metric("Failed Logins", "12", delta="-3", delta_color="inverse", help="Authentication failures")
+                
+        elif "Infrastructure" in selected_source:
+            with col1:
+                st.metric("Cluster Nodes", "20", help="Total Kubernetes nodes")
+            with col2:
+                st.metric("Avg CPU", "67%", delta="+5%", help="Average CPU utilization")
+            with col3:
+                st.metric("Memory Usage", "73%", delta="+2%", help="Average memory utilization")
+            with col4:
+                st.metric("Incidents", "2", delta="-1", delta_color="inverse", help="Active incidents")
+                
+        else:  # Governance
+            with col1:
+                st.metric("Policy Checks", "15,234", delta="+1,234", help="Policy evaluations")
+            with col2:
+                st.metric("Violations", "3", delta="-2", delta_color="inverse", help="Policy violations")
+            with col3:
+                st.metric("Anomalies", "7", delta="+2", help="Detected anomalies")
+            with col4:
+                st.metric("Audit Events", "2,456", delta="+123", help="Audit trail entries")
+        
+        st.markdown("---")
+        
+        # Live Log Generation for Selected Source
+        st.markdown(f"##### 📜 Sample Logs from: {selected_source}")
+        
+        if st.session_state.show_help:
+            show_help_bubble("👇 These are real-time sample logs showing the structure and fields captured from this source")
+        
+        # Generate button
+        if st.button(f"🎲 Generate Sample Logs from {selected_source}", type="primary"):
+            st.session_state.sample_logs_generated = True
+        
+        if st.session_state.get('sample_logs_generated', False):
+            for i in range(3):
+                log = generate_source_specific_log(selected_source)
+                
+                # Color code based on status
+                if "status" in log:
+                    if log["status"] in ["success", "compliant", "healthy"]:
+                        status_emoji = "🟢"
+                    elif log["status"] in ["warning", "degraded"]:
+                        status_emoji = "🟡"
+                    else:
+                        status_emoji = "🔴"
+                else:
+                    status_emoji = "⚪"
+                
+                with st.expander(f"{status_emoji} Log #{i+1} - {log['timestamp']}", expanded=i==0):
+                    col1, col2 = st.columns([2, 1])
+                    
+                    with col1:
+                        st.json(log)
+                    
+                    with col2:
+                        st.markdown("**Key Fields:**")
+                        st.markdown(f"- **Source**: {log['source_category']}")
+                        st.markdown(f"- **Trace ID**: `{log['trace_id']}`")
+                        
+                        if "model" in log:
+                            st.markdown(f"- **Model**: {log['model']}")
+                        if "latency_ms" in log:
+                            st.markdown(f"- **Latency**: {log['latency_ms']}ms")
+                        if "stage" in log:
+                            st.markdown(f"- **Stage**: {log['stage']}")
+                        if "user_id" in log:
+                            st.markdown(f"- **User**: {log['user_id']}")
+                        if "host" in log:
+                            st.markdown(f"- **Host**: {log['host']}")
+                        if "policy_type" in log:
+                            st.markdown(f"- **Policy**: {log['policy_type']}")
+        
+        st.markdown("---")
+        
+        # Collection Methods
+        st.markdown("##### 🔧 Collection Methods by Source")
+        
+        collection_info = {
+            "🤖 AI/ML Applications": {
+                "forwarder": "Universal Forwarder (sidecar)",
+                "frequency": "Real-time (streaming)",
+                "protocol": "HTTP/HTTPS, gRPC",
+                "parsing": "JSON + custom timestamp extraction",
+                "index": "aiml_models, aiml_training"
+            },
+            "🔗 RAG Pipeline": {
+                "forwarder": "Heavy Forwarder (central)",
+                "frequency": "Real-time (per-stage)",
+                "protocol": "HTTP API endpoints",
+                "parsing": "JSON + trace ID correlation",
+                "index": "aiml_rag"
+            },
+            "📊 Model Metrics": {
+                "forwarder": "Heavy Forwarder (aggregator)",
+                "frequency": "Every 60 seconds (batch)",
+                "protocol": "Prometheus metrics → transformed",
+                "parsing": "Metric transformation + enrichment",
+                "index": "aiml_metrics"
+            },
+            "👥 User Interactions": {
+                "forwarder": "Universal Forwarder (web tier)",
+                "frequency": "Real-time (event-based)",
+                "protocol": "HTTPS",
+                "parsing": "W3C Extended Log + user enrichment",
+                "index": "user_activity"
+            },
+            "🖥️ Infrastructure": {
+                "forwarder": "Universal Forwarder (DaemonSet)",
+                "frequency": "Real-time + 30-second intervals",
+                "protocol": "Kubernetes API, syslog",
+                "parsing": "K8s events + system metrics",
+                "index": "infrastructure"
+            },
+            "🔒 Governance & Compliance": {
+                "forwarder": "Heavy Forwarder (policy engine)",
+                "frequency": "Real-time (policy evaluation)",
+                "protocol": "Internal API",
+                "parsing": "Policy DSL + audit formatting",
+                "index": "security_audit"
+            }
+        }
+        
+        if selected_source in collection_info:
+            info = collection_info[selected_source]
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.info(f"""
+                **Collection Configuration:**
+                
+                - **Forwarder Type**: {info['forwarder']}
+                - **Collection Frequency**: {info['frequency']}
+                - **Protocol**: {info['protocol']}
+                """)
+            
+            with col2:
+                st.success(f"""
+                **Processing & Storage:**
+                
+                - **Parsing Method**: {info['parsing']}
+                - **Target Index**: `{info['index']}`
+                - **Retention**: 14-180 days (configurable)
+                """)
+        
+        # Summary Statistics
+        st.markdown("---")
+        st.markdown("##### 📊 Overall Source Statistics (Last 24h)")
+        
+        source_stats = pd.DataFrame({
+            "Source Category": [
+                "AI/ML Applications",
+                "RAG Pipeline",
+                "Model Metrics",
+                "User Interactions",
+                "Infrastructure",
+                "Governance & Compliance"
+            ],
+            "Log Volume": ["45,234", "32,156", "15,890", "23,456", "67,123", "12,345"],
+            "Avg Size (KB)": [2.3, 1.8, 0.5, 1.2, 3.4, 1.9],
+            "Error Rate": ["0.5%", "0.2%", "0.0%", "1.2%", "2.1%", "0.3%"],
+            "Forwarders": [45, 12, 8, 23, 156, 6],
+            "Status": ["🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟡 Warning", "🟢 Healthy"]
+        })
+        
+        st.dataframe(source_stats, use_container_width=True, hide_index=True)
+    
+    # Tab 2: Live Simulator  
+    with tab2:
+        st.subheader("🎮 Live Log Ingestion Simulator")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "🎮 Live Simulator",
+                "This simulator demonstrates real-time log ingestion. Click 'Start Ingestion' to begin generating logs from all six source categories."
+            )
+        
+        worker = ingestion_worker()
+        # A store attached to another process's shared memory is written only by that process
+        read_only = worker.store.read_only
+        
+        col1, col2, col3 = st.columns([1, 1, 1])
+        
+        with col1:
+            if st.button("▶️ Start Ingestion", type="primary", help="Begin simulating log generation", disabled=read_only):
+                worker.start()
+                
+        with col2:
+            if st.button("⏸️ Stop Ingestion", help="Stop log generation", disabled=read_only):
+                worker.stop()
+                
+        with col3:
+            if st.button("🗑️ Clear Logs", help="Clear all generated logs", disabled=read_only):
+                shared_state().log_store.clear()
+        
+        rate = st.select_slider(
+            "Target rate (events/sec)",
+            options=INGEST_RATES,
+            value=min(INGEST_RATES, key=lambda option: abs(option - worker.rate)),
+            help="The background worker generates vectorized batches at this rate for every viewer, independent of page refreshes",
+            disabled=read_only
+        )
+        if rate != worker.rate:
+            worker.set_rate(rate)
+        
+        st.markdown("---")
+        
+        # Status, refreshed from the worker's or the shared store's counters while events arrive
+        fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+        if (worker.running or read_only) and fragment is not None:
+            fragment(run_every=LIVE_REFRESH_SECONDS)(_render_live_status)()
+        else:
+            _render_live_status()
+    
+    # Tab 3: Forwarder Status
+
+  
+    
+    with tab3:
+        st.subheader("📊 Universal Forwarder Status")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "📊 Forwarder Monitoring",
+                "Universal Forwarders are lightweight agents installed on application servers. "
+                "They collect logs and forward them to Heavy Forwarders for processing."
+            )
+        
+        # Generate forwarder data
+        forwarders_data = []
+        for i in range(10):
+            status = random.choice(["🟢 Active", "🟢 Active", "🟢 Active", "🟡 Warning"])
+            forwarders_data.append({
+                "Forwarder ID": f"UF-{i+1:03d}",
+                "Host": f"app-server-{i+1:02d}.prod.internal",
+                "Status": status,
+                "CPU %": f"{random.randint(10, 70)}%",
+                "Memory": f"{random.randint(50, 95)} MB",
+                "Logs/sec": f"{random.randint(100, 1500)}",
+                "Buffer": f"{random.randint(5, 45)}%"
+            })
+        
+        df = pd.DataFrame(forwarders_data)
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Forwarder Health Distribution")
+            health_data = {"Active": 156, "Warning": 3, "Error": 1}
+            plotly_chart(_forwarder_health_figure, health_data)
+        
+        with col2:
+            st.subheader("Top Forwarders by Volume")
+            top_forwarders = [f"UF-{i:03d}" for i in range(1, 6)]
+            volumes = chart_data.forwarder_volumes(5)
+            
+            plotly_chart(_top_forwarders_figure, top_forwarders, volumes)
+    
+    with tab4:
+        st.subheader("🔍 Log Inspector & Parser")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "🔍 Log Parsing",
+                "Heavy Forwarders parse logs to extract structured fields. "
+                "This enables fast searching and correlation across millions of events."
+            )
+        
+        log_store = shared_state().log_store
+        if len(log_store):
+            # Indexed lookups: trace_id via hash chains, facets via bitmaps
+            lookup_mode = st.radio("Find events by", ["Trace ID", "Facets"], horizontal=True)
+            
+            lookup_start = time.perf_counter()
+            if lookup_mode == "Trace ID":
+                trace_id = st.text_input("Trace ID", value=log_store.tail(1)[0].get('trace_id', ''))
+                matches = log_store.lookup('trace_id', trace_id.strip())
+            else:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    category = st.selectbox("Source", ["All"] + list(SOURCE_CATEGORIES.values()))
+                with col2:
+                    model = st.selectbox("Model", ["Any"] + sorted(log_store.facet_counts('model')))
+                with col3:
+                    status = st.selectbox("Status", ["Any"] + sorted(log_store.facet_counts('status')))
+                filters = {field: value for field, value in [('model', model), ('status', status)] if value != "Any"}
+                matches = log_store.search(filters, category=None if category == "All" else category, limit=20)
+            lookup_ms = (time.perf_counter() - lookup_start) * 1000
+            
+            st.caption(f"Found {len(matches):,} matching events in {lookup_ms:.2f} ms across {len(log_store):,} stored events")
+            
+            if not matches:
+                st.info("No stored events match this lookup")
+            else:
+                selected_log = matches[-1]
+                
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    st.markdown("##### 📄 Raw Log")
+                    st.json(selected_log)
+                
+                with col2:
+                    st.markdown("##### 🏷️ Extracted Fields")
+                    st.markdown(f"""
+                    - **Trace ID**: `{selected_log.get('trace_id', '-')}`
+                    - **Model**: `{selected_log.get('model', '-')}`
+                    - **Stage**: `{selected_log.get('stage', '-')}`
+                    - **User**: `{selected_log.get('user_id', '-')}`
+                    - **Status**: `{selected_log.get('status', '-')}`
+                    """)
+                
+                    st.markdown("##### 🎯 Metadata Enrichment")
+                    st.markdown("""
+                    - **Environment**: `production`
+                    - **Region**: `us-west-2`
+                    - **Cluster**: `ml-cluster-01`
+                    - **Version**: `v2.4.1`
+                    """)
+        else:
+            st.info("📭 Start ingestion in the 'Live Simulator' tab to see log details...")
+    
+    with tab5:
+        st.subheader("📈 Ingestion Metrics & Analytics")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("##### Logs by Source Type")
+            sources = ["AI/ML Apps", "RAG Pipeline", "Infrastructure", "Security", "DevOps"]
+            counts = [45000, 32000, 28000, 15000, 8000]
+            
+            fig = go.Figure(data=[go.Pie(
+                labels=sources,
+                values=counts,
+                hole=0.3,
+                hovertemplate='<b>%{label}</b><br>Count: %{value:,}<br>Percentage: %{percent}<extra></extra>'
+            )])
+            fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown("##### Ingestion Rate (last hour)")
+            minutes = list(range(60))
+            rates = [random.randint(2000, 4000) for _ in range(60)]
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=minutes,
+                y=rates,
+                mode='lines',
+                fill='tozeroy',
+                line=dict(color='#8B5CF6'),
+                fillcolor='rgba(139, 92, 246, 0.2)',
+                hovertemplate='<b>%{x} min ago</b><br>Rate: %{y} logs/sec<extra></extra>'
+            ))
+            fig.update_layout(
+                height=300,
+                margin=dict(l=0, r=0, t=0, b=0),
+                xaxis_title="Minutes Ago",
+                yaxis_title="Logs/sec"
+            )
+            st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,268 @@
+"""
+Overview Dashboard Page
+Executive KPIs and platform-wide trends
+"""
+
+import time
+
+import streamlit as st
+import plotly.graph_objects as go
+
+import chart_data
+from log_generator import RAG_STAGE_SPANS
+from shared_state import shared_state
+from views.common import plotly_chart, show_help_bubble, show_info_card
+
+STAGE_LABELS = {
+    "Ingestion": "Ingestion",
+    "Embedding": "Embedding",
+    "Retrieval": "Retrieval",
+    "Prompt Construction": "Prompt",
+    "LLM Inference": "Inference",
+    "Post-Processing": "Post-Proc",
+}
+STAGE_RANGES = {"Last 15 minutes": 15, "Last hour": 60, "Last 4 hours": 240}
+
+
+def _ingestion_volume_figure(volume):
+    """Hourly ingestion volume area chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=volume['time'],
+        y=volume['volume_gb'],
+        mode='lines+markers',
+        name='Ingestion Volume',
+        line=dict(color='#1E40AF', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(30, 64, 175, 0.2)',
+        hovertemplate='<b>Time:</b> %{x}<br><b>Volume:</b> %{y:.1f} GB<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Time",
+        yaxis_title="Volume (GB/hour)",
+        hovermode='x unified'
+    )
+    return fig
+
+
+def _stage_latency_figure(stages, p50_latency, p95_latency, p99_latency):
+    """P50, P95 and P99 latency bars per RAG stage"""
+    fig = go.Figure()
+    for name, latency, color in (("P50", p50_latency, '#10B981'), ("P95", p95_latency, '#F59E0B'), ("P99", p99_latency, '#EF4444')):
+        fig.add_trace(go.Bar(
+            name=f'{name} Latency', 
+            x=stages, 
+            y=latency, 
+            marker_color=color,
+            hovertemplate=f'<b>%{{x}}</b><br>{name}: %{{y:,.1f}}ms<extra></extra>'
+        ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        barmode='group',
+        xaxis_title="Pipeline Stage",
+        yaxis_title="Latency (ms)",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def _stage_throughput_figure(stages, throughput):
+    """Throughput line across RAG stages"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=stages,
+        y=throughput,
+        mode='lines+markers',
+        line=dict(color='#8B5CF6', width=3),
+        marker=dict(size=10),
+        hovertemplate='<b>%{x}</b><br>Throughput: %{y:,.2f} req/sec<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Pipeline Stage",
+        yaxis_title="Throughput (req/sec)",
+    )
+    return fig
+
+
+def render():
+    """Render the Overview Dashboard page"""
+    if st.session_state.show_help:
+        show_info_card(
+            "🎯 Overview Dashboard", 
+            "This executive dashboard provides high-level KPIs and metrics across all layers. " 
+            "Monitor ingestion volume, query performance, model metrics, and system health at a glance."
+        )
+    
+    st.header("📊 Executive Dashboard")
+    
+    # Key metrics row
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric(
+            label="Total Ingestion (24h)",
+            value="2.4 TB",
+            delta="+124 GB",
+            help="Total data ingested across all forwarders in the last 24 hours"
+        )
+    
+    with col2:
+        st.metric(
+            label="Avg Query Latency",
+            value="847 ms",
+            delta="-23 ms",
+            delta_color="inverse",
+            help="Average search query response time across the cluster"
+        )
+    
+    with col3:
+        st.metric(
+            label="Model Inference Count",
+            value="1.2M",
+            delta="+45K",
+            help="Total AI/ML model inference requests processed today"
+        )
+    
+    with col4:
+        st.metric(
+            label="Hallucination Rate",
+            value="2.3%",
+            delta="-0.5%",
+            delta_color="inverse",
+            help="Percentage of LLM responses flagged as potential hallucinations"
+        )
+    
+    with col5:
+        st.metric(
+            label="Cost Efficiency",
+            value="$0.0023/req",
+            delta="-$0.0002",
+            delta_color="inverse",
+            help="Average cost per model inference request"
+        )
+    
+    st.markdown("---")
+    
+    if st.session_state.show_help:
+        show_help_bubble("📈 These charts update in real-time. Hover over data points for detailed information!")
+    
+    # Two column layout for charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📈 Ingestion Volume (Last 24h)")
+        
+        volume = chart_data.ingestion_volume_24h()
+        
+        plotly_chart(_ingestion_volume_figure, volume)
+    
+    with col2:
+        st.subheader("🎯 Model Performance Distribution")
+        
+        models = ["GPT-4", "Claude-3", "Llama-2", "Gemini-Pro", "Mistral-7B"]
+        latencies = [850, 920, 1200, 780, 950]
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=models,
+            y=latencies,
+            marker=dict(
+                color=latencies,
+                colorscale='Viridis',
+                showscale=False
+            ),
+            text=[f"{l}ms" for l in latencies],
+            textposition='outside',
+            hovertemplate='<b>Model:</b> %{x}<br><b>Latency:</b> %{y}ms<extra></extra>'
+        ))
+        fig.update_layout(
+            height=300,
+            margin=dict(l=0, r=0, t=0, b=0),
+            xaxis_title="Model",
+            yaxis_title="Avg Latency (ms)",
+            showlegend=False
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # RAG Pipeline Health
+    st.subheader("🔄 RAG Pipeline Stage Performance")
+    
+    if st.session_state.show_help:
+        show_info_card(
+            "🔄 RAG Pipeline Monitoring",
+            "Monitor each stage of your Retrieval-Augmented Generation pipeline. "
+            "Track latency and throughput to identify bottlenecks and optimize performance."
+        )
+    
+    # Percentiles from the trace store's per-minute stage sketches, over the chosen range
+    minutes = STAGE_RANGES[st.selectbox("Time range", list(STAGE_RANGES), index=1, key="stage_range")]
+    end_minute = int(time.time() // 60)
+    trace_store = shared_state().trace_store
+    summary = trace_store.latency_summary("stage", end_minute - minutes + 1, end_minute).set_index("key")
+    summary = summary.reindex([name for name, _, _ in RAG_STAGE_SPANS]).dropna()
+    
+    if summary.empty:
+        st.info("ℹ️ No RAG traces in this time range yet. Generate or load sample traces on the 🔗 End-to-End Tracing page, "
+                "or send OTLP spans from your services.")
+    else:
+        stages = [STAGE_LABELS.get(name, name) for name in summary.index]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            plotly_chart(_stage_latency_figure, stages, summary["p50_ms"].tolist(), summary["p95_ms"].tolist(), summary["p99_ms"].tolist())
+        
+        with col2:
+            plotly_chart(_stage_throughput_figure, stages, summary["per_second"].tolist())
+        
+        with st.expander("📋 Latency percentiles by stage and service"):
+            services = trace_store.latency_summary("service", end_minute - minutes + 1, end_minute)
+            st.dataframe(summary.reset_index().rename(columns={"key": "stage"}).round(1), use_container_width=True, hide_index=True)
+            st.dataframe(services.rename(columns={"key": "service"}).round(1), use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Active Alerts
+    st.subheader("⚠️ Active Alerts & Anomalies")
+    
+    if st.session_state.show_help:
+        show_help_bubble("🚨 Alerts are automatically generated based on predefined thresholds and ML-powered anomaly detection")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="error-box">
+            <strong>🔴 CRITICAL</strong><br/>
+            High hallucination rate detected in GPT-4<br/>
+            <small>Threshold: 15% | Current: 18.3%</small><br/>
+            <small>📍 Action: PagerDuty incident #12345 created</small>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="warning-box">
+            <strong>🟡 WARNING</strong><br/>
+            Claude-3 latency increasing<br/>
+            <small>Baseline: 850ms | Current: 1240ms</small><br/>
+            <small>📍 Action: Slack notification sent to #ml-ops</small>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="success-box">
+            <strong>🟢 INFO</strong><br/>
+            Cost optimization detected<br/>
+            <small>Savings: $234.50 (24h)</small><br/>
+            <small>📍 Action: Report emailed to FinOps team</small>
+        </div>
+        """, unsafe_allow_html=True)
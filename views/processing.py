@@ -0,0 +1,534 @@
+"""
+Layer 2: Processing Page
+SPL queries, ML analytics and alerting
+"""
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from datetime import datetime, timedelta
+
+from log_generator import generate_mixed_batch
+from anomaly_detector import ANOMALY_SOURCES
+from drift_engine import KS_ALPHA, PSI_MAJOR, PSI_WARNING, ks_critical_value
+from forecasting import ForecastCache
+from notifications import notification_dispatcher
+from shared_state import shared_state
+import spl_engine
+import chart_data
+from views.common import plotly_chart, show_help_bubble, show_info_card
+
+# Newest events of the selected series plotted in the anomaly chart
+ANOMALY_CHART_EVENTS = 2000
+
+# Capacity forecast history and horizon
+FORECAST_HISTORY_DAYS = 60
+FORECAST_DAYS = 14
+FORECAST_HISTORY_MINUTES = 60
+FORECAST_MINUTES = 15
+INDEXER_CAPACITY_GB = 140
+
+ALERT_EVALUATION_SECONDS = 10
+
+
+def _anomaly_figure(latency, title):
+    """Latency series with the detector's anomalous points highlighted"""
+    anomalies = latency[latency['anomaly']]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=latency['time'],
+        y=latency['latency_ms'],
+        mode='lines',
+        name='Latency',
+        line=dict(color='#3B82F6', width=1.5),
+        hovertemplate='<b>Time:</b> %{x}<br><b>Latency:</b> %{y:.0f}ms<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=anomalies['time'],
+        y=anomalies['latency_ms'],
+        mode='markers',
+        name='Anomaly',
+        marker=dict(size=12, color='red'),
+        hovertemplate='<b>Anomaly:</b> %{x}<br><b>Latency:</b> %{y:.0f}ms<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=30, b=0),
+        title=title,
+        xaxis_title="Time",
+        yaxis_title="Latency (ms)",
+        showlegend=False
+    )
+    return fig
+
+
+def _drift_figure(report, threshold):
+    """Per-feature KS statistic bars against the critical value, drifted features in red"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=report['feature'],
+        x=report['ks_statistic'],
+        orientation='h',
+        marker=dict(color=['#EF4444' if drifted else '#10B981' for drifted in report['drift_detected']]),
+        customdata=report['psi'],
+        hovertemplate='<b>%{y}</b><br>KS Statistic: %{x:.3f}<br>PSI: %{customdata:.3f}<extra></extra>'
+    ))
+    fig.add_vline(
+        x=threshold, 
+        line_dash="dash", 
+        line_color="red",
+        annotation_text="Critical Value",
+        annotation_position="top"
+    )
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=30, b=0),
+        title="Feature Drift Analysis (KS Test)",
+        xaxis_title="Drift Score (KS Statistic)",
+        yaxis_title="Feature"
+    )
+    return fig
+
+
+def _forecast_figure(series, y_title, limit):
+    """History and Holt-Winters forecast with its 95% band, against an optional capacity limit"""
+    history = series[~series['forecast']]
+    forecast = series[series['forecast']]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=history['date'],
+        y=history['value'],
+        mode='lines',
+        name='Historical Data',
+        line=dict(color='#1E40AF', width=2),
+        hovertemplate='<b>Date:</b> %{x}<br><b>Volume:</b> %{y:.1f}<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=forecast['date'],
+        y=forecast['upper'],
+        mode='lines',
+        line=dict(width=0),
+        showlegend=False,
+        hoverinfo='skip'
+    ))
+    fig.add_trace(go.Scatter(
+        x=forecast['date'],
+        y=forecast['lower'],
+        mode='lines',
+        name='95% Interval',
+        line=dict(width=0),
+        fill='tonexty',
+        fillcolor='rgba(245, 158, 11, 0.2)',
+        hoverinfo='skip'
+    ))
+    fig.add_trace(go.Scatter(
+        x=forecast['date'],
+        y=forecast['value'],
+        mode='lines',
+        name='Forecast (Holt-Winters)',
+        line=dict(color='#F59E0B', width=2, dash='dash'),
+        hovertemplate='<b>Date:</b> %{x}<br><b>Forecast:</b> %{y:.1f}<extra></extra>'
+    ))
+    if limit is not None:
+        fig.add_hline(
+            y=limit, 
+            line_dash="dash", 
+            line_color="red",
+            annotation_text="Capacity Limit",
+            annotation_position="right"
+        )
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Date",
+        yaxis_title=y_title,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+
+def _forecast_series(dates, history, forecast_dates, mean, lower, upper):
+    """One series' history and forecast as rows of date, value, lower, upper and a forecast flag"""
+    return pd.DataFrame({
+        'date': list(dates) + list(forecast_dates),
+        'value': np.concatenate([history, mean]),
+        'lower': np.concatenate([np.full(len(history), np.nan), lower]),
+        'upper': np.concatenate([np.full(len(history), np.nan), upper]),
+        'forecast': np.arange(len(history) + len(mean)) >= len(history)
+    })
+
+
+@st.cache_resource(show_spinner=False)
+def _daily_forecasts() -> ForecastCache:
+    """Fits for the daily index volumes, shared by all sessions"""
+    return ForecastCache()
+
+
+_SEVERITY_LABELS = {"critical": "🔴 CRITICAL", "warning": "🟡 WARNING", "info": "🟢 INFO"}
+_SEVERITY_BOXES = {"critical": "error-box", "warning": "warning-box", "info": "success-box"}
+_CHANNEL_NAMES = {"pagerduty": "PagerDuty", "slack": "Slack", "email": "Email", "teams": "Teams"}
+_CHANNEL_ICONS = {"pagerduty": "🔔", "slack": "💬", "email": "📧", "teams": "📱"}
+
+
+def _ago(moment) -> str:
+    """Coarse age of a datetime, like '2 minutes ago'"""
+    seconds = int((datetime.now() - moment).total_seconds())
+    for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = seconds // size
+            return f"{count} {unit}{'s' if count > 1 else ''} ago"
+    return "just now"
+
+
+def _render_alert_manager():
+    """Run one evaluation tick and show the open alerts, statistics and MTTR"""
+    shared = shared_state()
+    alert_engine = shared.alert_engine
+    dispatcher = notification_dispatcher()
+    # Delivery happens on the dispatcher's own loop; submit only queues. The engine is shared,
+    # so whichever session ticks first raises each transition exactly once.
+    for kind, alert in shared.tick_alerts():
+        dispatcher.submit(kind, alert)
+    with shared.lock:
+        active = alert_engine.active()
+        grouped = alert_engine.grouped()
+        counts = alert_engine.fired_counts()
+        mttr = alert_engine.mttr()
+        recent_mttr = alert_engine.mttr(since=datetime.now() - timedelta(hours=1))
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("##### 🔔 Active Alerts")
+        
+        if not active:
+            st.success(f"✅ No rules firing ({len(alert_engine.rules)} rules, evaluated every {ALERT_EVALUATION_SECONDS}s)")
+        
+        # One card per rule; groups firing the same rule are listed together
+        for alerts in grouped.values():
+            first = alerts[0]
+            if len(alerts) == 1:
+                title, value = first['title'], first['value']
+                if first.get('baseline'):
+                    value += f" (baseline: {first['baseline']})"
+            else:
+                title = f"{first['title'].rsplit(' - ', 1)[0]} - {len(alerts)} groups"
+                value = ", ".join(f"{alert['group']}: {alert['value']}" for alert in alerts)
+            channels = ", ".join(_CHANNEL_NAMES.get(channel, channel) for channel in first['channels'])
+            
+            st.markdown(f"""
+            <div class="{_SEVERITY_BOXES[first['severity']]}">
+                <strong>{_SEVERITY_LABELS[first['severity']]}: {title}</strong><br/>
+                {first['description']}<br/>
+                <strong>Value:</strong> {value}<br/>
+                <small>⏰ {_ago(min(alert['fired_at'] for alert in alerts))} | 📤 Routed to {channels}</small>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("##### 📊 Alert Statistics")
+        
+        alert_stats = pd.DataFrame({
+            "Type": [severity.title() for severity in counts],
+            "Last 24h": [day for day, _ in counts.values()],
+            "Last 7d": [week for _, week in counts.values()]
+        })
+        
+        st.dataframe(alert_stats, use_container_width=True, hide_index=True)
+        
+        st.markdown("##### 🎯 MTTR")
+        st.metric(
+            "Mean Time To Resolve", 
+            "—" if mttr is None else f"{mttr / 60:.1f} min", 
+            delta=None if mttr is None or recent_mttr is None else f"{(recent_mttr - mttr) / 60:+.1f} min (last hour)",
+            delta_color="inverse",
+            help="Average time from alert generation to resolution"
+        )
+        
+        st.markdown("##### 📨 Notification Channels")
+        channel_lines = []
+        for channel, icon in _CHANNEL_ICONS.items():
+            if channel not in dispatcher.channels:
+                continue
+            stats = dispatcher.stats[channel]
+            channel_lines.append(
+                f"- {icon} {_CHANNEL_NAMES[channel]}: **{'Local sink' if dispatcher.uses_local_sink(channel) else 'Enabled'}** · "
+                f"{stats['alerts_sent']} sent · {stats['queued']} queued · {stats['failed']} failed"
+            )
+        st.markdown("\n".join(channel_lines))
+        
+        if st.button("📨 Send test notification", help="Queue a test alert on every channel"):
+            dispatcher.submit("fired", {
+                "rule": "test",
+                "group": "all",
+                "severity": "info",
+                "title": "Test Notification",
+                "description": "Sent from the Alert Manager",
+                "value": None,
+                "channels": tuple(dispatcher.channels)
+            })
+        
+        deliveries = list(dispatcher.deliveries)
+        if deliveries:
+            with st.expander(f"📬 Recent deliveries ({len(deliveries)})"):
+                st.dataframe(pd.DataFrame(deliveries[::-1]), use_container_width=True, hide_index=True)
+
+
+def render():
+    """Render the Layer 2: Processing page"""
+    if st.session_state.show_help:
+        show_info_card(
+            "⚙️ Processing & Analytics Layer",
+            "This layer processes ingested logs using Splunk Processing Language (SPL), " 
+            "performs ML-powered analytics, and generates alerts based on anomalies and thresholds."
+        )
+    
+    st.header("⚙️ Layer 2: Real-Time Processing & Analytics")
+    
+    tab1, tab2, tab3 = st.tabs(["🔧 SPL Queries", "🤖 ML Analytics", "⚡ Alerting"])
+    
+    with tab1:
+        st.subheader("🔧 Search Processing Language (SPL) Console")
+        
+        if st.session_state.show_help:
+            show_help_bubble("💡 SPL is Splunk's query language. Select a template, customize if needed, and click 'Run Query' to see results!")
+        
+        # Predefined queries
+        query_templates = {
+            "Model Performance": "index=aiml_models | eval tokens_total=tokens_input+tokens_output | stats avg(latency_ms), avg(tokens_total), sum(cost_usd) by model",
+            "Hallucination Detection": "index=aiml_metrics | where confidence_score < 0.8 AND hallucination_score > 0.1 | stats count by model",
+            "RAG Chain": "index=aiml_rag | transaction trace_id maxspan=30s | sort -eventcount | head 20 | table _time, trace_id, eventcount, stage, latency_ms",
+            "Cost by Model": "index=aiml_models | stats sum(cost_usd) as total_cost by model | sort -total_cost",
+            "Error Rate": "index=aiml_models | stats count(eval(status=\"warning\")) as warnings, count as total | eval warning_rate=warnings/total*100",
+            "Latency Percentiles": "index=aiml_rag | stats count, avg(latency_ms), p95(latency_ms) by stage | sort -p95(latency_ms)",
+            "Weekly Cost Trend": "index=aiml_models earliest=-7d | stats sum(cost_usd) as cost, count by model | sort -cost"
+        }
+        
+        selected_template = st.selectbox(
+            "Select Query Template", 
+            list(query_templates.keys()),
+            help="Choose from pre-built queries for common use cases"
+        )
+        
+        query = st.text_area("SPL Query", value=query_templates[selected_template], height=100)
+        
+        col1, col2, col3 = st.columns([1, 1, 4])
+        with col1:
+            run_query = st.button("▶️ Run Query", type="primary")
+        with col2:
+            st.button("💾 Save Query")
+        with col3:
+            if st.button("🎲 Load 100K Sample Events", help="Fill the log store with generated events to query",
+                         disabled=shared_state().log_store.read_only):
+                for category, columns in generate_mixed_batch(100_000).items():
+                    shared_state().log_store.extend(category, columns)
+        
+        st.caption(f"📦 Log store: {len(shared_state().log_store):,} events in memory, shared by all sessions; "
+                   "older events are searched in the hot, warm and cold segment tiers")
+        
+        if run_query:
+            with st.spinner("Executing query..."):
+                try:
+                    result = spl_engine.run_spl(query, shared_state().tiers)
+                except spl_engine.SPLError as e:
+                    st.error(f"❌ {e}")
+                    result = None
+            
+            if result is not None:
+                st.success(f"✅ Query completed in {result.elapsed:.3f} seconds | Scanned {result.scanned:,} events")
+                
+                results = result.frame
+                if results.empty:
+                    st.info("📭 No matching events. Start ingestion in Layer 1 or load sample events above.")
+                else:
+                    st.dataframe(results, use_container_width=True, hide_index=True)
+                
+                # Visualization: a category column followed by a numeric aggregate
+                if (len(results.columns) >= 2 and 1 < len(results) <= 50
+                        and not pd.api.types.is_numeric_dtype(results.iloc[:, 0])
+                        and pd.api.types.is_numeric_dtype(results.iloc[:, 1])):
+                    fig = go.Figure(go.Bar(
+                        x=results.iloc[:, 0].astype(str),
+                        y=results.iloc[:, 1],
+                        marker=dict(color=results.iloc[:, 1], colorscale='Viridis', showscale=True)
+                    ))
+                    fig.update_layout(
+                        height=300,
+                        title="Query Results Visualization",
+                        xaxis_title=results.columns[0],
+                        yaxis_title=results.columns[1]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+    
+    with tab2:
+        st.subheader("🤖 Machine Learning Toolkit (MLTK)")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "🤖 ML-Powered Analytics",
+                "Splunk's ML Toolkit detects anomalies, predicts trends, and identifies drift automatically. "
+                "Red markers indicate detected anomalies that exceed thresholds."
+            )
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("##### 🎯 Anomaly Detection")
+            
+            # Score latency (and update drift windows with) events that arrived since any session last looked
+            shared = shared_state()
+            log_store, detector = shared.log_store, shared.anomaly_detector
+            shared.observe()
+            with shared.lock:
+                series = detector.series()
+            
+            recent = None
+            if series:
+                category, key = st.selectbox(
+                    "Series",
+                    series,
+                    format_func=lambda series: f"{ANOMALY_SOURCES[series[0]]}: {series[1]}",
+                    help="Each model and RAG stage has its own running baseline"
+                )
+                recent = log_store.frame(
+                    category, columns=['timestamp', 'latency_ms'], where={ANOMALY_SOURCES[category]: key}
+                ).tail(ANOMALY_CHART_EVENTS)
+            
+            if recent is not None and len(recent):
+                with shared.lock:
+                    flagged = detector.anomalies(category, key, since_seq=int(recent['_seq'].iloc[0]) - 1)
+                    total_anomalies, scored = detector.total_anomalies(), detector.scored
+                latency = pd.DataFrame({
+                    'time': recent['timestamp'],
+                    'latency_ms': recent['latency_ms'],
+                    'anomaly': recent['_seq'].isin(flagged['_seq'])
+                })
+                plotly_chart(_anomaly_figure, latency, f"{key} Latency (last {len(latency):,} events)")
+                st.info(
+                    f"🔍 Detected {len(flagged)} anomalies in the last {len(latency):,} {key} events (marked in red) · "
+                    f"{total_anomalies:,} across {len(series)} series in {scored:,} events scored"
+                )
+            else:
+                # Sample series until the log store has model or RAG latency events
+                latency = chart_data.latency_with_anomalies_48h()
+                plotly_chart(_anomaly_figure, latency, "Latency Anomaly Detection (48h sample)")
+                st.info(
+                    f"🔍 Sample data: {int(latency['anomaly'].sum())} anomalies in the last 48 hours (marked in red). "
+                    "Load sample events in the SPL tab or start ingestion to score live latency."
+                )
+        
+        with col2:
+            st.markdown("##### 📊 Model Drift Detection")
+            
+            # Each model's live window was updated by shared.observe() above
+            drift_engine = shared.drift_engine
+            with shared.lock:
+                baselined = drift_engine.baselined_keys()
+            if baselined:
+                drift_model = st.selectbox("Model", baselined, help="Live window compared with the model's reference window")
+                with shared.lock:
+                    report = drift_engine.report(drift_model)
+            
+            if baselined and report is None:
+                st.info(f"📥 Collecting live {drift_model} events since the reference window was set")
+            elif baselined:
+                reference_events = int(report['reference_events'].iloc[0])
+                live_events = int(report['live_events'].iloc[0])
+                plotly_chart(_drift_figure, report, ks_critical_value(reference_events, live_events))
+                
+                drifted = report.loc[report['drift_detected'], 'feature'].tolist()
+                if drifted:
+                    st.warning(f"⚠️ drift_detected for {drift_model}: {', '.join(drifted)}")
+                else:
+                    st.success(f"✅ No drift for {drift_model}")
+                st.caption(
+                    f"{live_events:,} live vs {reference_events:,} reference events · "
+                    f"drift = KS p < {KS_ALPHA} with PSI ≥ {PSI_WARNING}, or PSI ≥ {PSI_MAJOR}"
+                )
+                if st.button("📌 Use live window as reference", help="Re-baseline after an expected change"):
+                    with shared.lock:
+                        drift_engine.snapshot_reference(drift_model)
+                    st.rerun()
+            else:
+                # Sample scores until a model has both a reference and a live window
+                sample = pd.DataFrame({
+                    'feature': ["Feature_A", "Feature_B", "Feature_C", "Feature_D", "Feature_E"],
+                    'ks_statistic': [0.05, 0.12, 0.18, 0.08, 0.22],
+                    'psi': [0.02, 0.08, 0.14, 0.04, 0.25],
+                    'drift_detected': [False, False, True, False, True]
+                })
+                plotly_chart(_drift_figure, sample, 0.15)
+                st.warning(
+                    "⚠️ Sample data: Features C and E exceed drift threshold (>0.15). "
+                    "Drift is scored per model once the log store has Model Metrics events."
+                )
+        
+        st.markdown("---")
+        
+        st.markdown("##### 📈 Predictive Analytics - Capacity Forecast")
+        
+        if st.session_state.show_help:
+            show_help_bubble("📊 Forecasting helps plan infrastructure capacity and prevent resource shortages")
+        
+        history_source = st.radio(
+            "History",
+            ["Daily volume by index", "Log store events per minute"],
+            horizontal=True,
+            help="Holt-Winters is fitted to every series at once and updated incrementally as new points arrive"
+        )
+        
+        if history_source == "Daily volume by index":
+            volume = chart_data.index_volume(FORECAST_HISTORY_DAYS)
+            names = ["All indexes"] + [name for name in volume.columns if name not in ('day', 'date')]
+            values = volume[names[1:]].to_numpy().T
+            values = np.vstack([values.sum(axis=0), values])
+            mean, lower, upper = _daily_forecasts().forecast(
+                "index_volume", names, values, int(volume['day'].iloc[0]), FORECAST_DAYS, season=7
+            )
+            dates = volume['date']
+            forecast_dates = pd.date_range(dates.iloc[-1], periods=FORECAST_DAYS + 1, freq='D')[1:]
+            y_title = "Ingestion Volume (GB/day)"
+        else:
+            first_minute, counts = shared_state().log_store.time_counts(60_000, FORECAST_HISTORY_MINUTES)
+            names = ["All sources"] + list(counts)
+            values = np.vstack([sum(counts.values())] + list(counts.values())).astype(np.float64)
+            mean, lower, upper = shared_state().forecast_cache.forecast(
+                "log_store_minutes", names, values, first_minute, FORECAST_MINUTES
+            )
+            minutes = np.arange(first_minute, first_minute + FORECAST_HISTORY_MINUTES + FORECAST_MINUTES)
+            all_dates = pd.to_datetime(minutes * 60_000, unit='ms')
+            dates, forecast_dates = all_dates[:FORECAST_HISTORY_MINUTES], all_dates[FORECAST_HISTORY_MINUTES:]
+            y_title = "Events per Minute"
+        
+        series_name = st.selectbox("Series", names, key="forecast_series")
+        row = names.index(series_name)
+        limit = INDEXER_CAPACITY_GB if series_name == "All indexes" else None
+        plotly_chart(
+            _forecast_figure,
+            _forecast_series(dates, values[row], forecast_dates, mean[row], lower[row], upper[row]),
+            y_title,
+            limit
+        )
+        if limit is not None and (upper[row] > limit).any():
+            breach = forecast_dates[int(np.argmax(upper[row] > limit))]
+            st.warning(f"⚠️ Upper forecast bound reaches indexer capacity ({limit} GB/day) on {breach:%b %d}")
+    
+    with tab3:
+        st.subheader("⚡ Alert Manager & Notification System")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "⚡ Intelligent Alerting",
+                "Alerts are automatically generated when metrics exceed thresholds or anomalies are detected. "
+                "Different severity levels route to different notification channels."
+            )
+        
+        # Evaluate the rules on a timer without rerunning the whole page
+        fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+        if fragment is not None:
+            fragment(run_every=ALERT_EVALUATION_SECONDS)(_render_alert_manager)()
+        else:
+            st.button("🔄 Evaluate rules now")
+            _render_alert_manager()
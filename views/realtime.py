@@ -0,0 +1,176 @@
+"""
+Real-time Monitoring Page
+Live system metrics and cluster health
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+import chart_data
+from views.common import plotly_chart, show_help_bubble, show_info_card
+
+
+def _ingestion_rate_figure(rates):
+    """Events/sec over the last minute"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=rates['seconds_ago'],
+        y=rates['value'],
+        mode='lines',
+        fill='tozeroy',
+        line=dict(color='#10B981', width=2),
+        fillcolor='rgba(16, 185, 129, 0.2)',
+        hovertemplate='<b>%{x} sec ago</b><br>Rate: %{y} logs/sec<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Seconds Ago",
+        yaxis_title="Events/sec"
+    )
+    return fig
+
+
+def _response_time_figure(response_times):
+    """Query response time over the last minute against the SLA"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=response_times['seconds_ago'],
+        y=response_times['value'],
+        mode='lines',
+        line=dict(color='#3B82F6', width=2),
+        hovertemplate='<b>%{x} sec ago</b><br>Response: %{y}ms<extra></extra>'
+    ))
+    fig.add_hline(
+        y=800, 
+        line_dash="dash", 
+        line_color="red",
+        annotation_text="SLA Threshold (800ms)",
+        annotation_position="right"
+    )
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Seconds Ago",
+        yaxis_title="Response Time (ms)"
+    )
+    return fig
+
+
+def render():
+    """Render the Real-time Monitoring page"""
+    if st.session_state.show_help:
+        show_info_card(
+            "⚡ Real-time System Monitoring",
+            "Live dashboard showing current system status across all components. " 
+            "Enable auto-refresh to see metrics update automatically every 5 seconds."
+        )
+    
+    st.header("⚡ Real-time System Monitoring")
+    
+    st.markdown("##### 🎛️ Live System Metrics")
+    
+    # Auto-refresh toggle
+    auto_refresh = st.checkbox(
+        "🔄 Auto-refresh (5 seconds)", 
+        value=True,
+        help="Automatically refresh metrics every 5 seconds"
+    )
+    
+    if st.session_state.show_help:
+        show_help_bubble("📊 All metrics refresh automatically when auto-refresh is enabled")
+    
+    def render_live_metrics():
+        """Live metric cards and charts (the only part re-run by auto-refresh)"""
+        # Real-time metrics (value, change since the last refresh)
+        metrics = chart_data.live_metrics()
+        col1, col2, col3, col4, col5 = st.columns(5)
+        
+        with col1:
+            st.metric(
+                "Ingestion Rate", 
+                f"{metrics['Ingestion Rate'][0]}/s", 
+                delta=f"{metrics['Ingestion Rate'][1]:+d}",
+                help="Events ingested per second"
+            )
+        with col2:
+            st.metric(
+                "Query Load", 
+                f"{metrics['Query Load'][0]}/s", 
+                delta=f"{metrics['Query Load'][1]:+d}",
+                help="Search queries per second"
+            )
+        with col3:
+            st.metric(
+                "Indexer CPU", 
+                f"{metrics['Indexer CPU'][0]}%", 
+                delta=f"{metrics['Indexer CPU'][1]:+d}%",
+                help="Average CPU across indexers"
+            )
+        with col4:
+            st.metric(
+                "Network I/O", 
+                f"{metrics['Network I/O'][0]} Mbps", 
+                delta=f"{metrics['Network I/O'][1]:+d}",
+                help="Network throughput"
+            )
+        with col5:
+            st.metric(
+                "Active Queries", 
+                f"{metrics['Active Queries'][0]}", 
+                delta=f"{metrics['Active Queries'][1]:+d}",
+                help="Currently executing queries"
+            )
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("##### 📊 Live Ingestion Rate")
+            
+            rates = chart_data.ingestion_rate_60s()
+            
+            plotly_chart(_ingestion_rate_figure, rates)
+        
+        with col2:
+            st.markdown("##### ⚡ Query Response Time")
+            
+            response_times = chart_data.query_response_60s()
+            
+            plotly_chart(_response_time_figure, response_times)
+        
+    
+    # Partial reruns: only the live widgets re-execute on the timer, not the whole script
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if auto_refresh and fragment is not None:
+        fragment(run_every=5)(render_live_metrics)()
+    else:
+        if auto_refresh:
+            st.caption("⏸️ Auto-refresh needs Streamlit 1.33 or later; use the button to refresh")
+        st.button("🔄 Refresh now")
+        render_live_metrics()
+    
+    st.markdown("---")
+    
+    st.markdown("##### 🖥️ Cluster Health")
+    
+    if st.session_state.show_help:
+        show_help_bubble("🖥️ Monitor the health and resource usage of all cluster components in real-time")
+    
+    # Cluster status
+    load = chart_data.cluster_load(10)
+    cluster_data = {
+        "Component": ["Search Head 1", "Search Head 2", "Search Head 3", "Indexer 1", "Indexer 2", 
+                     "Indexer 3", "Indexer 4", "Master Node", "License Server", "Deployment Server"],
+        "Status": ["🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy",
+                  "🟢 Healthy", "🟡 Warning", "🟢 Healthy", "🟢 Healthy", "🟢 Healthy"],
+        "CPU %": [f"{v}%" for v in load['cpu']],
+        "Memory %": [f"{v}%" for v in load['memory']],
+        "Disk %": [f"{v}%" for v in load['disk']],
+        "Network": [f"{v} Mbps" for v in load['network']]
+    }
+    
+    df = pd.DataFrame(cluster_data)
+    st.dataframe(df, use_container_width=True, hide_index=True)
@@ -0,0 +1,245 @@
+"""
+Layer 3: Storage Page
+Storage tiers and retention policies
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+import chart_data
+from log_store import SPLUNK_INDEXES
+from shared_state import shared_state
+from tier_manager import RETENTION_POLICIES
+from views.common import plotly_chart, show_help_bubble, show_info_card
+
+
+def _days(days) -> str:
+    """Retention limit as shown in the policy table"""
+    if days is None:
+        return "Purge"
+    if days >= 365 and days % 365 == 0:
+        years = int(days // 365)
+        return f"{years} year" if years == 1 else f"{years} years"
+    return f"{days:g} days"
+
+
+def _storage_growth_figure(growth):
+    """Cumulative storage area chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=growth['date'],
+        y=growth['total_tb'],
+        mode='lines',
+        fill='tozeroy',
+        line=dict(color='#1E40AF', width=3),
+        fillcolor='rgba(30, 64, 175, 0.2)',
+        hovertemplate='<b>Date:</b> %{x}<br><b>Total:</b> %{y:.1f} TB<extra></extra>'
+    ))
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        xaxis_title="Date",
+        yaxis_title="Total Storage (TB)"
+    )
+    return fig
+
+
+def _render_tiers():
+    """Events held in memory and each segment tier, and the tier manager's status"""
+    shared = shared_state()
+    tiers = shared.tiers
+    stats = tiers.snapshot()
+    st.markdown("##### 💽 Live Tier Status")
+    st.caption(f"Columnar segment files under `{tiers.root}`, rolled by the retention policies of each index")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Tier Manager", "🟢 Running" if stats["running"] else "⚪ Stopped")
+    with col2:
+        st.metric("Cycles", f"{stats['cycles']:,}")
+    with col3:
+        st.metric("Segment I/O", f"{stats['io_bytes'] / 1024 / 1024:,.1f} MB")
+    with col4:
+        st.write("")
+        flush = st.button("💾 Flush Now", disabled=shared.log_store.read_only,
+                          help="Write events not yet persisted from memory to hot segments")
+    if flush:
+        try:
+            written = tiers.flush()
+            st.success(f"✅ Flushed {written:,} events to hot segments")
+        except OSError as e:
+            st.error(f"❌ Could not write segments: {e}")
+    if stats["overwritten"]:
+        st.warning(f"⚠️ {stats['overwritten']:,} events were overwritten in memory before they could be flushed; "
+                   "raise LOG_STORE_MAX_MB or lower the ingestion rate")
+    if stats["backlog"]:
+        st.warning("⏳ Tier moves are behind; the per-cycle I/O budget is working off the backlog")
+    if stats["last_error"]:
+        st.error(f"❌ Last tier cycle failed: {stats['last_error']}")
+    
+    summary = tiers.tier_summary()
+    summary["MB"] = (summary.pop("bytes") / 1024 / 1024).round(2)
+    st.dataframe(summary, use_container_width=True, hide_index=True)
+
+
+def render():
+    """Render the Layer 3: Storage page"""
+    if st.session_state.show_help:
+        show_info_card(
+            "💾 Storage & Lifecycle Management",
+            "Data moves through storage tiers automatically based on age and access patterns. "
+            "Hot storage for real-time queries, cold storage for compliance and historical analysis."
+        )
+    
+    st.header("💾 Layer 3: Data Storage & Lifecycle Management")
+    
+    tab1, tab2 = st.tabs(["🗄️ Storage Tiers", "📋 Retention Policies"])
+    
+    with tab1:
+        st.subheader("🗄️ Splunk Indexer Cluster - Storage Tier Status")
+        
+        if st.session_state.show_help:
+            show_help_bubble("💡 Data automatically moves through tiers: Hot (fast, expensive) → Warm → Cold → Frozen (slow, cheap)")
+        
+        # Storage overview metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Hot Storage", "2.4 TB", delta="+124 GB", help="NVMe SSD - Last 7-30 days")
+        with col2:
+            st.metric("Warm Storage", "8.7 TB", delta="+89 GB", help="SATA SSD - 30-90 days")
+        with col3:
+            st.metric("Cold Storage", "45.2 TB", delta="+234 GB", help="S3 - 90-365 days")
+        with col4:
+            st.metric("Frozen/Archive", "234.5 TB", delta="+1.2 TB", help="Glacier - 1-7 years")
+        
+        st.markdown("---")
+        
+        # Storage tier details
+        tier_data = {
+            "Tier": ["Hot (NVMe SSD)", "Warm (SATA SSD)", "Cold (S3)", "Frozen (Glacier)"],
+            "Capacity": ["5 TB", "15 TB", "100 TB", "500 TB"],
+            "Used": ["2.4 TB", "8.7 TB", "45.2 TB", "234.5 TB"],
+            "Usage %": ["48%", "58%", "45%", "47%"],
+            "Retention": ["7-30 days", "30-90 days", "90-365 days", "1-7 years"],
+            "Search Speed": ["< 1s", "2-5s", "10-30s", "1-12h"],
+            "Replication": ["3x", "2x", "1x", "1x"],
+            "Cost/GB/Month": ["$0.15", "$0.08", "$0.023", "$0.004"]
+        }
+        
+        df = pd.DataFrame(tier_data)
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("##### 📊 Storage Distribution")
+            
+            sizes = [2.4, 8.7, 45.2, 234.5]
+            labels = ["Hot", "Warm", "Cold", "Frozen"]
+            
+            fig = go.Figure(data=[go.Pie(
+                labels=labels,
+                values=sizes,
+                hole=0.4,
+                marker=dict(colors=['#EF4444', '#F59E0B', '#3B82F6', '#8B5CF6']),
+                hovertemplate='<b>%{label}</b><br>Size: %{value} TB<br>Percentage: %{percent}<extra></extra>'
+            )])
+            fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown("##### 📈 Storage Growth Trend")
+            
+            growth = chart_data.storage_growth_30d()
+            
+            plotly_chart(_storage_growth_figure, growth)
+        
+        st.markdown("---")
+        
+        st.markdown("##### 🔄 Data Lifecycle Automation")
+        
+        st.info("""
+        **Automated Data Movement Schedule:**
+        - **Hot → Warm**: After 7 days (AI/ML logs), 3 days (Infrastructure)
+        - **Warm → Cold**: After 30 days (Application logs), 60 days (Model logs)
+        - **Cold → Frozen**: After 90 days (Application), 180 days (Model logs)
+        - **Frozen → Purge**: After retention period expires (configurable by index)
+        
+        💡 **Benefit**: Automatic cost optimization while maintaining compliance requirements
+        """)
+        
+        st.markdown("---")
+        
+        _render_tiers()
+    
+    with tab2:
+        st.subheader("📋 Data Retention Policies by Index")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "📋 Retention Policies",
+                "Different log types have different retention requirements based on compliance, " 
+                "business needs, and cost considerations. Security logs are kept longest for audit purposes."
+            )
+        
+        # The policies the tier manager enforces
+        retention_data = {
+            "Index": [p.index for p in RETENTION_POLICIES],
+            "Source": [SPLUNK_INDEXES.get(p.index, "-") for p in RETENTION_POLICIES],
+            "Hot": [_days(p.hot_days) for p in RETENTION_POLICIES],
+            "Warm": [_days(p.warm_days) for p in RETENTION_POLICIES],
+            "Cold": [_days(p.cold_days) for p in RETENTION_POLICIES],
+            "Archive": [_days(p.archive_days) for p in RETENTION_POLICIES],
+            "Compliance": [p.compliance for p in RETENTION_POLICIES]
+        }
+        
+        df = pd.DataFrame(retention_data)
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        
+        st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("##### 💰 Storage Cost by Index")
+            
+            indices = list(retention_data["Index"])
+            costs = [1245, 834, 1570, 452, 2340, 560]
+            
+            fig = go.Figure()
+            fig.add_trace(go.Bar(
+                x=indices,
+                y=costs,
+                marker_color='#8B5CF6',
+                text=[f"${c}" for c in costs],
+                textposition='outside',
+                hovertemplate='<b>%{x}</b><br>Monthly Cost: $%{y}<extra></extra>'
+            ))
+            fig.update_layout(
+                height=300,
+                margin=dict(l=0, r=0, t=0, b=0),
+                xaxis_title="Index",
+                yaxis_title="Monthly Cost (USD)",
+                xaxis_tickangle=-45
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown("##### 🔄 Data Movement Events (This Run)")
+            
+            movements = shared_state().tiers.snapshot()["moved"]
+            if any(movements.values()):
+                fig = go.Figure(data=[go.Pie(
+                    labels=list(movements.keys()),
+                    values=list(movements.values()),
+                    hole=0.3,
+                    hovertemplate='<b>%{label}</b><br>Events: %{value:,}<extra></extra>'
+                )])
+                fig.update_layout(height=300, margin=dict(l=0, r=0, t=0, b=0))
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("No events moved between tiers yet")
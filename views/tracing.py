@@ -0,0 +1,218 @@
+"""
+End-to-End Tracing Page
+RAG request traces reconstructed from the trace store, and trace lookup
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import time
+
+from log_generator import generate_rag_traces, rag_span_events
+from otlp_receiver import TRACES_PATH, format_traceparent, otlp_receiver
+from shared_state import shared_state
+from views.common import plotly_chart, show_help_bubble, show_info_card
+
+SAMPLE_TRACES = 10_000
+SAMPLE_TRACES_SPAN_MS = 60 * 60 * 1000
+SLOWEST_TRACES = 10
+
+
+def _add_traces(n: int, span_ms: int = 1000) -> str:
+    """Generate n traces into the trace store and their stage events into the log store; returns the newest trace id"""
+    spans = generate_rag_traces(n, span_ms=span_ms)
+    shared_state().trace_store.extend(spans)
+    if not shared_state().log_store.read_only:
+        shared_state().log_store.extend("RAG Pipeline", rag_span_events(spans))
+    return spans["trace_id"][-1].decode()
+
+
+def _inspect_trace(key: str):
+    """Widget callback: show the chosen trace's waterfall if the trace store holds it"""
+    trace_id = st.session_state[key].strip().lower()
+    if shared_state().trace_store.contains(trace_id):
+        st.session_state.current_trace = trace_id
+
+
+def _waterfall_figure(trace: pd.DataFrame) -> go.Figure:
+    """Horizontal bars from each span's start offset, indented by depth, critical path highlighted"""
+    labels = [" " * depth + name for depth, name in zip(trace["depth"], trace["name"])]
+    colors = ['#EF4444' if critical else '#3B82F6' for critical in trace["critical"]]
+    outlines = ['#111827' if status == "error" else 'rgba(0,0,0,0)' for status in trace["status"]]
+    fig = go.Figure(go.Bar(
+        x=trace["duration_ms"],
+        base=trace["offset_ms"],
+        y=list(range(len(trace))),
+        orientation='h',
+        marker=dict(color=colors, line=dict(color=outlines, width=2)),
+        text=[f"{duration:,.1f}ms" for duration in trace["duration_ms"]],
+        textposition='auto',
+        customdata=trace[["service", "status", "offset_ms", "critical_ms"]].to_numpy(),
+        hovertemplate="<b>%{text}</b><br>Service: %{customdata[0]}<br>Status: %{customdata[1]}<br>"
+                      "Starts at: %{customdata[2]:,.1f}ms<br>On critical path: %{customdata[3]:,.1f}ms<extra></extra>",
+    ))
+    fig.update_layout(
+        height=max(250, 45 * len(trace)),
+        margin=dict(l=0, r=0, t=0, b=0),
+        showlegend=False,
+        xaxis_title="Time since request start (ms)",
+        yaxis=dict(tickvals=list(range(len(trace))), ticktext=labels, autorange='reversed'),
+    )
+    return fig
+
+
+def render():
+    """Render the End-to-End Tracing page"""
+    if st.session_state.show_help:
+        show_info_card(
+            "🔗 End-to-End Request Tracing",
+            "Trace complete request flows through your RAG pipeline. "
+            "Every request gets a unique trace ID that links all processing stages together."
+        )
+    
+    st.header("🔗 End-to-End Request Tracing")
+    
+    st.info("""
+    **W3C Trace Context Implementation** - Every request gets a unique trace ID that propagates
+    through all services, enabling complete chain reconstruction from API gateway to final response.
+    """)
+    
+    trace_store = shared_state().trace_store
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        if st.button("🎲 Generate New RAG Chain Trace", type="primary", use_container_width=True):
+            st.session_state.current_trace = _add_traces(1)
+    
+    with col2:
+        if st.button(f"📦 Load {SAMPLE_TRACES:,} Sample Traces", use_container_width=True):
+            with st.spinner("Generating traces..."):
+                _add_traces(SAMPLE_TRACES, SAMPLE_TRACES_SPAN_MS)
+    
+    st.caption(f"Trace store: {len(trace_store):,} spans held ({trace_store.total_spans:,} ingested), "
+               f"{trace_store.nbytes / 1024 / 1024:.1f} MB")
+    
+    # OTLP/HTTP endpoint feeding the same trace store
+    receiver = otlp_receiver()
+    if receiver.port:
+        stats = receiver.stats
+        st.caption(f"📡 OTLP receiver at `{receiver.endpoint}`: {stats['spans_accepted']:,} spans stored, "
+                   f"{stats['spans_pending']:,} pending, {stats['spans_rejected']:,} rejected from {stats['requests']:,} requests")
+        if stats["last_error"]:
+            st.error(f"❌ {stats['spans_dropped']:,} received spans could not be stored; last error: {stats['last_error']}")
+        with st.expander("📡 Send traces from your services"):
+            st.markdown("Point any OpenTelemetry SDK or Collector at the receiver using OTLP over HTTP with JSON encoding. "
+                        "A `traceparent` header on the export request links its root spans to the caller's span.")
+            st.code(f"""OTEL_EXPORTER_OTLP_TRACES_ENDPOINT={receiver.endpoint}
+OTEL_EXPORTER_OTLP_TRACES_PROTOCOL=http/json""", language="bash")
+            st.code(f"""curl -X POST http://{receiver.host}:{receiver.port}{TRACES_PATH} \\
+  -H 'Content-Type: application/json' \\
+  -H 'traceparent: 00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01' \\
+  -d '{{"resourceSpans": [{{"resource": {{"attributes": [{{"key": "service.name", "value": {{"stringValue": "llm-gateway"}}}}]}},
+       "scopeSpans": [{{"spans": [{{"spanId": "b7ad6b7169203331", "name": "LLM Inference",
+       "startTimeUnixNano": "1700000000000000000", "endTimeUnixNano": "1700000002100000000"}}]}}]}}]}}'""", language="bash")
+    elif receiver.error:
+        st.error(f"❌ OTLP receiver could not start: {receiver.error}")
+    else:
+        st.caption("📡 OTLP receiver disabled (OTLP_RECEIVER_ENABLED=0)")
+    
+    # Slowest requests among the stored traces
+    if len(trace_store):
+        st.markdown("##### 🐢 Slowest Traces")
+        slowest = trace_store.slowest(SLOWEST_TRACES)
+        st.dataframe(slowest, use_container_width=True, hide_index=True)
+        st.selectbox("Inspect a slow trace", ["—"] + slowest["trace_id"].tolist(), key="slow_trace",
+                     on_change=_inspect_trace, args=("slow_trace",))
+        
+        st.markdown("##### 📊 Stage Latency Across All Traces (last hour)")
+        end_minute = int(time.time() // 60)
+        stage_summary = trace_store.latency_summary("stage", end_minute - 59, end_minute)
+        st.dataframe(stage_summary.rename(columns={"key": "stage"}).round(1), use_container_width=True, hide_index=True)
+    
+    # Indexed trace lookup over the simulator's log store
+    st.markdown("##### 🔎 Look up a trace in the log store")
+    trace_query = st.text_input("Trace ID", placeholder="e.g. 4bf92f3577b34da6a3ce929d0e0e4736", key="trace_lookup",
+                                on_change=_inspect_trace, args=("trace_lookup",))
+    if trace_query:
+        lookup_start = time.perf_counter()
+        trace_events = shared_state().log_store.lookup('trace_id', trace_query.strip())
+        lookup_ms = (time.perf_counter() - lookup_start) * 1000
+        st.caption(f"Found {len(trace_events):,} events in {lookup_ms:.2f} ms across {len(shared_state().log_store):,} stored events")
+        if trace_events:
+            st.dataframe(pd.DataFrame(trace_events), use_container_width=True, hide_index=True)
+        else:
+            st.info("No stored events carry this trace ID")
+    
+    if 'current_trace' in st.session_state:
+        trace_id = st.session_state.current_trace
+        trace = trace_store.trace(trace_id)
+        
+        if trace.empty:
+            st.warning(f"⚠️ Trace `{trace_id}` is no longer held in the trace store")
+            return
+        
+        if st.session_state.show_help:
+            show_help_bubble("🔍 This waterfall shows when each span of the request started and ended; red bars form the critical path")
+        
+        st.markdown(f"### 🔍 Trace ID: `{trace_id}`")
+        root = trace.iloc[0]
+        st.code(f"traceparent: {format_traceparent(trace_id, root['span_id'])}", language="text")
+        
+        # Timeline visualization
+        st.markdown("##### ⏱️ Execution Waterfall")
+        plotly_chart(_waterfall_figure, trace)
+        
+        # Detailed breakdown
+        st.markdown("##### 📋 Span Details")
+        
+        details = trace[['name', 'service', 'offset_ms', 'duration_ms', 'critical_ms', 'status', 'span_id', 'parent_span_id']]
+        st.dataframe(details, use_container_width=True, hide_index=True)
+        
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        bottleneck = trace.loc[trace["critical_ms"].idxmax()]
+        
+        with col1:
+            st.metric("End-to-End Latency", f"{root['duration_ms']:,.1f}ms", help="Duration of the root span")
+        with col2:
+            st.metric("Spans", len(trace), help="Spans stored for this trace")
+        with col3:
+            st.metric("Success Rate", f"{(trace['status'] == 'success').mean():.0%}", help="Percentage of successful spans")
+        with col4:
+            st.metric("Critical Path Bottleneck", bottleneck['name'],
+                      help=f"{bottleneck['critical_ms']:,.1f}ms of the critical path is spent in this span itself")
+        
+        st.markdown("---")
+        
+        # SPL Query to retrieve this trace
+        st.markdown("##### 💻 SPL Query to Reconstruct This Chain")
+        
+        if st.session_state.show_help:
+            show_info_card(
+                "💻 Trace Reconstruction",
+                "This SPL query retrieves all log entries with the same trace ID and orders them chronologically. "
+                "Copy this query and run it in the Processing layer to see actual results."
+            )
+        
+        spl_query = f"""index=aiml_rag trace_id="{trace_id}"
+| transaction trace_id maxspan=30s
+| table _time, stage, latency_ms, status
+| sort _time"""
+        
+        st.code(spl_query, language="spl")
+        
+        # Raw spans as stored
+        with st.expander("📄 View Raw Spans"):
+            for span in trace.itertuples(index=False):
+                st.json({
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_span_id": span.parent_span_id,
+                    "name": span.name,
+                    "service": span.service,
+                    "start_time_unix_us": int(span.start_us),
+                    "end_time_unix_us": int(span.end_us),
+                    "status": span.status,
+                })